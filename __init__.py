@@ -1,45 +1,107 @@
-# workout_tracker/services/__init__.py
-"""Services package for workout tracker business logic."""
-
-from .workout_service import (
-    save_workout,
-    get_workouts,
-    get_workout_details,
-    delete_workout,
-    get_workout_types,
-    get_exercises
-)
-
-from .analytics_service import (
-    get_exercise_progression,
-    get_top_set_by_date,
-    get_weekly_volume,
-    get_cardio_weekly_summary,
-    get_current_week_cardio,
-    get_exercise_volume_by_type,
-    calculate_estimated_1rm,
-    get_estimated_1rm_progression,
-    get_personal_records,
-    get_workout_frequency
-)
-
-__all__ = [
-    # Workout service
-    'save_workout',
-    'get_workouts',
-    'get_workout_details',
-    'delete_workout',
-    'get_workout_types',
-    'get_exercises',
-    # Analytics service
-    'get_exercise_progression',
-    'get_top_set_by_date',
-    'get_weekly_volume',
-    'get_cardio_weekly_summary',
-    'get_current_week_cardio',
-    'get_exercise_volume_by_type',
-    'calculate_estimated_1rm',
-    'get_estimated_1rm_progression',
-    'get_personal_records',
-    'get_workout_frequency',
-]
+# workout_tracker/services/__init__.py
+"""Services package for workout tracker business logic."""
+
+from .workout_service import (
+    save_workout,
+    save_workouts,
+    get_workouts,
+    get_workouts_page,
+    iter_workouts,
+    get_workout_totals,
+    get_workout_details,
+    get_workout_details_many,
+    delete_workout,
+    delete_workouts,
+    delete_workouts_between,
+    get_workout_types,
+    get_exercises
+)
+
+from .cache import (
+    cache_stats,
+    clear_cache,
+    set_cache_enabled
+)
+
+from .records import (
+    Workout,
+    WorkoutSummary,
+    SetRecord,
+    CardioSession,
+    ProgressionPoint,
+    DailyEstimate
+)
+
+from .events import (
+    subscribe,
+    unsubscribe,
+    WORKOUT_SAVED,
+    WORKOUT_DELETED,
+    EXERCISE_ADDED
+)
+
+from .analytics_service import (
+    get_exercise_progression,
+    get_top_set_by_date,
+    get_weekly_volume,
+    get_cardio_weekly_summary,
+    get_monthly_summary,
+    get_current_week_cardio,
+    get_exercise_volume_by_type,
+    calculate_estimated_1rm,
+    get_estimated_1rm_progression,
+    get_daily_estimated_1rm,
+    get_personal_records,
+    get_estimated_1rm_records,
+    get_workout_records,
+    get_workout_frequency
+)
+
+__all__ = [
+    # Workout service
+    'save_workout',
+    'save_workouts',
+    'get_workouts',
+    'get_workouts_page',
+    'iter_workouts',
+    'get_workout_totals',
+    'get_workout_details',
+    'get_workout_details_many',
+    'delete_workout',
+    'delete_workouts',
+    'delete_workouts_between',
+    'get_workout_types',
+    'get_exercises',
+    # Analytics service
+    'get_exercise_progression',
+    'get_top_set_by_date',
+    'get_weekly_volume',
+    'get_cardio_weekly_summary',
+    'get_monthly_summary',
+    'get_current_week_cardio',
+    'get_exercise_volume_by_type',
+    'calculate_estimated_1rm',
+    'get_estimated_1rm_progression',
+    'get_daily_estimated_1rm',
+    'get_personal_records',
+    'get_estimated_1rm_records',
+    'get_workout_records',
+    'get_workout_frequency',
+    # Query cache
+    'cache_stats',
+    'clear_cache',
+    'set_cache_enabled',
+    # Record types
+    'Workout',
+    'WorkoutSummary',
+    'SetRecord',
+    'CardioSession',
+    'ProgressionPoint',
+    'DailyEstimate',
+    # Change events
+    'subscribe',
+    'unsubscribe',
+    'WORKOUT_SAVED',
+    'WORKOUT_DELETED',
+    'EXERCISE_ADDED',
+]
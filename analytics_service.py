@@ -1,380 +1,602 @@
-# workout_tracker/services/analytics_service.py
-
-from datetime import datetime, timedelta
-from collections import defaultdict
-from ..db import get_connection
-
-
-def get_exercise_progression(exercise_name):
-    """
-    Get progression data for a specific exercise over time.
-
-    Args:
-        exercise_name: Name of the exercise
-
-    Returns:
-        List of dicts with date, max_weight, total_volume, total_reps
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    cur.execute(
-        """
-        SELECT
-            w.date,
-            MAX(s.weight) as max_weight,
-            SUM(s.reps * s.weight) as total_volume,
-            SUM(s.reps) as total_reps,
-            COUNT(s.id) as num_sets
-        FROM sets s
-        JOIN workouts w ON s.workout_id = w.id
-        WHERE s.exercise_name = ?
-        GROUP BY w.date
-        ORDER BY w.date ASC
-        """,
-        (exercise_name,)
-    )
-
-    rows = cur.fetchall()
-    conn.close()
-
-    return [dict(row) for row in rows]
-
-
-def get_top_set_by_date(exercise_name):
-    """
-    Get the top (heaviest) set for each date for a specific exercise.
-
-    Args:
-        exercise_name: Name of the exercise
-
-    Returns:
-        List of dicts with date, weight, reps, rpe
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    cur.execute(
-        """
-        SELECT
-            w.date,
-            s.weight,
-            s.reps,
-            s.rpe
-        FROM sets s
-        JOIN workouts w ON s.workout_id = w.id
-        WHERE s.exercise_name = ?
-        AND s.weight = (
-            SELECT MAX(s2.weight)
-            FROM sets s2
-            JOIN workouts w2 ON s2.workout_id = w2.id
-            WHERE s2.exercise_name = s.exercise_name
-            AND w2.date = w.date
-        )
-        GROUP BY w.date
-        ORDER BY w.date ASC
-        """,
-        (exercise_name,)
-    )
-
-    rows = cur.fetchall()
-    conn.close()
-
-    return [dict(row) for row in rows]
-
-
-def get_weekly_volume(weeks=12):
-    """
-    Calculate total weekly volume (weight × reps) for the last N weeks.
-
-    Args:
-        weeks: Number of weeks to analyze (default 12)
-
-    Returns:
-        List of dicts with week_start_date and total_volume
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    # Calculate start date
-    end_date = datetime.now()
-    start_date = end_date - timedelta(weeks=weeks)
-
-    cur.execute(
-        """
-        SELECT
-            date(w.date, 'weekday 0', '-6 days') as week_start,
-            SUM(s.reps * s.weight) as total_volume
-        FROM sets s
-        JOIN workouts w ON s.workout_id = w.id
-        WHERE w.date >= ?
-        GROUP BY week_start
-        ORDER BY week_start ASC
-        """,
-        (start_date.strftime('%Y-%m-%d'),)
-    )
-
-    rows = cur.fetchall()
-    conn.close()
-
-    return [dict(row) for row in rows]
-
-
-def get_cardio_weekly_summary(weeks=12):
-    """
-    Get weekly cardio minutes for the last N weeks.
-
-    Args:
-        weeks: Number of weeks to analyze (default 12)
-
-    Returns:
-        List of dicts with week_start_date, total_minutes, workout_count
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    # Calculate start date
-    end_date = datetime.now()
-    start_date = end_date - timedelta(weeks=weeks)
-
-    cur.execute(
-        """
-        SELECT
-            date(w.date, 'weekday 0', '-6 days') as week_start,
-            SUM(c.minutes) as total_minutes,
-            COUNT(DISTINCT c.workout_id) as workout_count
-        FROM cardio_sessions c
-        JOIN workouts w ON c.workout_id = w.id
-        WHERE w.date >= ?
-        GROUP BY week_start
-        ORDER BY week_start ASC
-        """,
-        (start_date.strftime('%Y-%m-%d'),)
-    )
-
-    rows = cur.fetchall()
-    conn.close()
-
-    return [dict(row) for row in rows]
-
-
-def get_current_week_cardio():
-    """
-    Get total cardio minutes for the current week (Monday-Sunday).
-
-    Returns:
-        Integer representing total minutes this week
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    # Get the Monday of the current week
-    today = datetime.now()
-    monday = today - timedelta(days=today.weekday())
-    monday_str = monday.strftime('%Y-%m-%d')
-
-    cur.execute(
-        """
-        SELECT COALESCE(SUM(c.minutes), 0) as total_minutes
-        FROM cardio_sessions c
-        JOIN workouts w ON c.workout_id = w.id
-        WHERE w.date >= ?
-        """,
-        (monday_str,)
-    )
-
-    result = cur.fetchone()
-    conn.close()
-
-    return result[0] if result else 0
-
-
-def get_exercise_volume_by_type():
-    """
-    Get total volume grouped by exercise for all time.
-
-    Returns:
-        List of dicts with exercise_name, total_volume, total_sets, total_reps
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    cur.execute(
-        """
-        SELECT
-            s.exercise_name,
-            SUM(s.reps * s.weight) as total_volume,
-            COUNT(s.id) as total_sets,
-            SUM(s.reps) as total_reps,
-            AVG(s.weight) as avg_weight
-        FROM sets s
-        GROUP BY s.exercise_name
-        ORDER BY total_volume DESC
-        """
-    )
-
-    rows = cur.fetchall()
-    conn.close()
-
-    return [dict(row) for row in rows]
-
-
-def calculate_estimated_1rm(weight, reps):
-    """
-    Calculate estimated 1RM using the Epley formula.
-
-    Args:
-        weight: Weight lifted
-        reps: Number of reps performed
-
-    Returns:
-        Estimated 1RM value
-    """
-    if reps == 1:
-        return weight
-    # Epley formula: 1RM = weight × (1 + reps/30)
-    return weight * (1 + reps / 30)
-
-
-def get_estimated_1rm_progression(exercise_name):
-    """
-    Get estimated 1RM progression over time for an exercise.
-
-    Args:
-        exercise_name: Name of the exercise
-
-    Returns:
-        List of dicts with date, estimated_1rm, actual_weight, reps
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    cur.execute(
-        """
-        SELECT
-            w.date,
-            s.weight,
-            s.reps,
-            s.rpe
-        FROM sets s
-        JOIN workouts w ON s.workout_id = w.id
-        WHERE s.exercise_name = ?
-        ORDER BY w.date ASC
-        """,
-        (exercise_name,)
-    )
-
-    rows = cur.fetchall()
-    conn.close()
-
-    # Calculate estimated 1RM for each set
-    progression = []
-    for row in rows:
-        row_dict = dict(row)
-        estimated_1rm = calculate_estimated_1rm(row_dict['weight'], row_dict['reps'])
-        progression.append({
-            'date': row_dict['date'],
-            'estimated_1rm': round(estimated_1rm, 2),
-            'actual_weight': row_dict['weight'],
-            'reps': row_dict['reps'],
-            'rpe': row_dict['rpe']
-        })
-
-    return progression
-
-
-def get_personal_records(exercise_name=None):
-    """
-    Get personal records (max weight) for exercises.
-
-    Args:
-        exercise_name: Optional specific exercise, or None for all exercises
-
-    Returns:
-        List of dicts with exercise_name, max_weight, reps, date
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    if exercise_name:
-        cur.execute(
-            """
-            SELECT
-                s.exercise_name,
-                s.weight as max_weight,
-                s.reps,
-                w.date
-            FROM sets s
-            JOIN workouts w ON s.workout_id = w.id
-            WHERE s.exercise_name = ?
-            AND s.weight = (
-                SELECT MAX(weight)
-                FROM sets
-                WHERE exercise_name = s.exercise_name
-            )
-            LIMIT 1
-            """,
-            (exercise_name,)
-        )
-    else:
-        cur.execute(
-            """
-            SELECT
-                s.exercise_name,
-                MAX(s.weight) as max_weight,
-                s.reps,
-                w.date
-            FROM sets s
-            JOIN workouts w ON s.workout_id = w.id
-            WHERE (s.exercise_name, s.weight) IN (
-                SELECT exercise_name, MAX(weight)
-                FROM sets
-                GROUP BY exercise_name
-            )
-            GROUP BY s.exercise_name
-            ORDER BY s.exercise_name
-            """
-        )
-
-    rows = cur.fetchall()
-    conn.close()
-
-    return [dict(row) for row in rows]
-
-
-def get_workout_frequency(days=30):
-    """
-    Calculate workout frequency for the last N days.
-
-    Args:
-        days: Number of days to analyze (default 30)
-
-    Returns:
-        Dict with total_workouts, days_analyzed, avg_per_week
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
-
-    cur.execute(
-        """
-        SELECT COUNT(*) as workout_count
-        FROM workouts
-        WHERE date >= ?
-        """,
-        (start_date.strftime('%Y-%m-%d'),)
-    )
-
-    result = cur.fetchone()
-    conn.close()
-
-    workout_count = result[0] if result else 0
-    avg_per_week = (workout_count / days) * 7 if days > 0 else 0
-
-    return {
-        'total_workouts': workout_count,
-        'days_analyzed': days,
-        'avg_per_week': round(avg_per_week, 2)
-    }
+# workout_tracker/services/analytics_service.py
+
+from datetime import datetime, timedelta
+from collections import defaultdict
+from ..db import connection, day_number, day_to_date
+from .cache import cached
+from .records import ProgressionPoint, DailyEstimate
+from .e1rm import (
+    estimate_one,
+    estimate_1rm,
+    reduce_by_day,
+    set_columns,
+    numpy_available,
+    FORMULAS,
+    REDUCTIONS
+)
+
+
+@cached
+def get_exercise_progression(exercise_name):
+    """
+    Get progression data for a specific exercise over time.
+
+    Args:
+        exercise_name: Name of the exercise
+
+    Returns:
+        List of dicts with date, max_weight, total_volume, total_reps
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+
+        cur.execute(
+            """
+            SELECT
+                w.date,
+                MAX(s.weight) as max_weight,
+                -- Not s.volume: SQLite does not treat an index as covering
+                -- for generated columns, and idx_sets_exercise covers these
+                SUM(s.reps * s.weight) as total_volume,
+                SUM(s.reps) as total_reps,
+                COUNT(s.id) as num_sets
+            FROM sets s
+            JOIN workouts w ON s.workout_id = w.id
+            JOIN exercises e ON s.exercise_id = e.id
+            WHERE e.name = ?
+            GROUP BY w.date
+            ORDER BY w.date ASC
+            """,
+            (exercise_name,)
+        )
+
+        rows = cur.fetchall()
+
+    return [dict(row) for row in rows]
+
+
+@cached
+def get_top_set_by_date(exercise_name):
+    """
+    Get the top (heaviest) set for each date for a specific exercise.
+
+    Ties on weight go to the set with more reps, then to the earlier set.
+
+    Args:
+        exercise_name: Name of the exercise
+
+    Returns:
+        List of dicts with date, weight, reps, rpe
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+
+        cur.execute(
+            """
+            SELECT date, weight, reps, rpe
+            FROM (
+                SELECT
+                    w.date,
+                    s.weight,
+                    s.reps,
+                    s.rpe,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY w.date
+                        ORDER BY s.weight DESC, s.reps DESC, s.id ASC
+                    ) as rank
+                FROM sets s
+                JOIN workouts w ON s.workout_id = w.id
+                JOIN exercises e ON s.exercise_id = e.id
+                WHERE e.name = ?
+            )
+            WHERE rank = 1
+            ORDER BY date ASC
+            """,
+            (exercise_name,)
+        )
+
+        rows = cur.fetchall()
+
+    return [dict(row) for row in rows]
+
+
+def _first_week_start(weeks):
+    """Return the Monday (YYYY-MM-DD) of the week N weeks before today."""
+    start_date = datetime.now() - timedelta(weeks=weeks)
+    monday = start_date - timedelta(days=start_date.weekday())
+    return monday.strftime('%Y-%m-%d')
+
+
+@cached
+def get_weekly_volume(weeks=12, exercise_name=None):
+    """
+    Calculate total weekly volume (weight × reps) for the last N weeks.
+
+    Reads the pre-aggregated weekly rollups, so the cost depends on the
+    number of weeks rather than the number of sets.
+
+    Args:
+        weeks: Number of weeks to analyze (default 12)
+        exercise_name: Optional exercise to restrict the volume to
+
+    Returns:
+        List of dicts with week_start_date and total_volume
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+
+        cur.execute(
+            """
+            SELECT
+                period_start as week_start,
+                total_volume
+            FROM rollups
+            WHERE period = 'week'
+            AND exercise_name = ?
+            AND period_start >= ?
+            AND total_sets > 0
+            ORDER BY period_start ASC
+            """,
+            (exercise_name or '', _first_week_start(weeks))
+        )
+
+        rows = cur.fetchall()
+
+    return [dict(row) for row in rows]
+
+
+@cached
+def get_cardio_weekly_summary(weeks=12):
+    """
+    Get weekly cardio minutes for the last N weeks.
+
+    Args:
+        weeks: Number of weeks to analyze (default 12)
+
+    Returns:
+        List of dicts with week_start_date, total_minutes, workout_count
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+
+        cur.execute(
+            """
+            SELECT
+                period_start as week_start,
+                cardio_minutes as total_minutes,
+                cardio_workouts as workout_count
+            FROM rollups
+            WHERE period = 'week'
+            AND exercise_name = ''
+            AND period_start >= ?
+            AND cardio_workouts > 0
+            ORDER BY period_start ASC
+            """,
+            (_first_week_start(weeks),)
+        )
+
+        rows = cur.fetchall()
+
+    return [dict(row) for row in rows]
+
+
+@cached
+def get_monthly_summary(months=12):
+    """
+    Get monthly training totals for the last N months.
+
+    Args:
+        months: Number of months to analyze (default 12)
+
+    Returns:
+        List of dicts with month_start, total_volume, total_sets, total_reps,
+        cardio_minutes, workout_count
+    """
+    today = datetime.now()
+    # First day of the month N months ago
+    month_index = today.year * 12 + today.month - 1 - months
+    first_month = f"{month_index // 12:04d}-{month_index % 12 + 1:02d}-01"
+
+    with connection() as conn:
+        cur = conn.cursor()
+
+        cur.execute(
+            """
+            SELECT
+                period_start as month_start,
+                total_volume,
+                total_sets,
+                total_reps,
+                cardio_minutes,
+                workout_count
+            FROM rollups
+            WHERE period = 'month'
+            AND exercise_name = ''
+            AND period_start >= ?
+            AND workout_count > 0
+            ORDER BY period_start ASC
+            """,
+            (first_month,)
+        )
+
+        rows = cur.fetchall()
+
+    return [dict(row) for row in rows]
+
+
+@cached
+def get_current_week_cardio():
+    """
+    Get total cardio minutes for the current week (Monday-Sunday).
+
+    Returns:
+        Integer representing total minutes this week
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+
+        # Day number of the Monday of the current week
+        today = day_number(datetime.now())
+        monday = today - (today + 3) % 7  # 1970-01-01 was a Thursday
+
+        cur.execute(
+            """
+            SELECT COALESCE(SUM(c.minutes), 0) as total_minutes
+            FROM cardio_sessions c
+            JOIN workouts w ON c.workout_id = w.id
+            WHERE w.day >= ?
+            """,
+            (monday,)
+        )
+
+        result = cur.fetchone()
+
+    return result[0] if result else 0
+
+
+@cached
+def get_exercise_volume_by_type():
+    """
+    Get total volume grouped by exercise for all time.
+
+    Returns:
+        List of dicts with exercise_name, total_volume, total_sets, total_reps
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+
+        cur.execute(
+            """
+            SELECT
+                e.name as exercise_name,
+                SUM(s.volume) as total_volume,
+                COUNT(s.id) as total_sets,
+                SUM(s.reps) as total_reps,
+                AVG(s.weight) as avg_weight
+            FROM sets s
+            JOIN exercises e ON s.exercise_id = e.id
+            GROUP BY s.exercise_id
+            ORDER BY total_volume DESC
+            """
+        )
+
+        rows = cur.fetchall()
+
+    return [dict(row) for row in rows]
+
+
+def calculate_estimated_1rm(weight, reps, formula='epley', rpe=None):
+    """
+    Calculate estimated 1RM of a single set.
+
+    Args:
+        weight: Weight lifted
+        reps: Number of reps performed
+        formula: 'epley' (default), 'brzycki', 'lombardi', 'oconner' or 'rpe'
+        rpe: RPE of the set, used by the 'rpe' formula
+
+    Returns:
+        Estimated 1RM value
+    """
+    return estimate_one(weight, reps, rpe, formula)
+
+
+@cached
+def get_estimated_1rm_progression(exercise_name, formula='epley'):
+    """
+    Get estimated 1RM progression over time for an exercise.
+
+    Args:
+        exercise_name: Name of the exercise
+        formula: e1RM formula, see calculate_estimated_1rm()
+
+    Returns:
+        List of ProgressionPoint records (date, estimated_1rm, actual_weight,
+        reps, rpe)
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+        cur.row_factory = None  # plain tuples, unpacked below
+
+        cur.execute(
+            """
+            SELECT
+                w.date,
+                s.weight,
+                s.reps,
+                s.rpe,
+                s.e1rm
+            FROM sets s
+            JOIN workouts w ON s.workout_id = w.id
+            JOIN exercises e ON s.exercise_id = e.id
+            WHERE e.name = ?
+            ORDER BY w.date ASC
+            """,
+            (exercise_name,)
+        )
+
+        rows = cur.fetchall()
+
+    # Epley estimates are stored in sets.e1rm; other formulas are computed
+    # for all sets at once when NumPy is there
+    if formula == 'epley':
+        estimates = [row[4] for row in rows]
+    elif rows and numpy_available():
+        _, weights, reps, rpes, _ = zip(*rows)
+        estimates = estimate_1rm(weights, reps, rpes, formula).tolist()
+    else:
+        estimates = [estimate_one(weight, reps, rpe, formula) for _, weight, reps, rpe, _ in rows]
+
+    return [
+        ProgressionPoint(date, round(estimated_1rm, 2), weight, reps, rpe)
+        for (date, weight, reps, rpe, _), estimated_1rm in zip(rows, estimates)
+    ]
+
+
+@cached
+def get_daily_estimated_1rm(exercise_name=None, formula='epley', reduce='max'):
+    """
+    Get one estimated 1RM per exercise and day.
+
+    All exercises are read with one query and estimated in one vectorized
+    pass (with NumPy; a plain loop otherwise).
+
+    Args:
+        exercise_name: Optional exercise; all exercises when None
+        formula: e1RM formula, see calculate_estimated_1rm()
+        reduce: How to combine the sets of a day: 'max' (best set, default),
+            'mean' or 'min'
+
+    Returns:
+        Dict mapping exercise name to a list of DailyEstimate records
+        (date, estimated_1rm, sets), oldest first
+
+    Raises:
+        ValueError: If the formula or reduction is unknown
+    """
+    where = "WHERE s.exercise_id = (SELECT id FROM exercises WHERE name = ?)" if exercise_name else ""
+
+    with connection() as conn:
+        cur = conn.cursor()
+        cur.row_factory = None  # plain tuples
+
+        cur.execute("SELECT id, name FROM exercises")
+        names = dict(cur.fetchall())
+
+        # A missing RPE counts as RPE 10, as in calculate_estimated_1rm()
+        cur.execute(
+            f"""
+            SELECT s.exercise_id, w.day, s.weight, s.reps, COALESCE(s.rpe, 10.0)
+            FROM sets s
+            JOIN workouts w ON s.workout_id = w.id
+            {where}
+            """,
+            (exercise_name,) if exercise_name else ()
+        )
+
+        if numpy_available():
+            sets = set_columns(cur)
+            estimates = estimate_1rm(sets['weight'], sets['reps'], sets['rpe'], formula)
+            reduced = reduce_by_day(sets['group'], sets['day'], estimates, reduce)
+            groups = zip(*(column.tolist() for column in reduced))
+        else:
+            groups = _reduce_by_day_loop(cur.fetchall(), formula, reduce)
+
+    daily = defaultdict(list)
+    for exercise_id, day, estimated_1rm, count in groups:
+        daily[names[exercise_id]].append(
+            DailyEstimate(day_to_date(day), round(estimated_1rm, 2), count)
+        )
+    return dict(daily)
+
+
+def _reduce_by_day_loop(rows, formula, reduce):
+    """get_daily_estimated_1rm() without NumPy: (exercise_id, day, value, count) tuples."""
+    if formula not in FORMULAS:
+        raise ValueError(f"Unknown e1RM formula {formula!r}, expected one of {', '.join(FORMULAS)}")
+    if reduce not in REDUCTIONS:
+        raise ValueError(f"Unknown reduction {reduce!r}, expected one of {', '.join(REDUCTIONS)}")
+
+    values = defaultdict(list)
+    for exercise_id, day, weight, reps, rpe in rows:
+        estimated_1rm = estimate_one(weight, reps, rpe, formula)
+        if estimated_1rm == estimated_1rm:  # skip NaN
+            values[exercise_id, day].append(estimated_1rm)
+
+    combine = {'max': max, 'min': min, 'mean': lambda v: sum(v) / len(v)}[reduce]
+    for (exercise_id, day), day_values in sorted(values.items()):
+        yield exercise_id, day, combine(day_values), len(day_values)
+
+
+@cached
+def get_personal_records(exercise_name=None, reps=None):
+    """
+    Get personal records (max weight) for exercises.
+
+    Records are read from the personal_records table, which is kept up to
+    date by triggers on the sets table. Ties on weight go to the set with
+    more reps, then to the earliest date the record was reached.
+
+    Args:
+        exercise_name: Optional specific exercise, or None for all exercises
+        reps: Optional rep count to get rep maxes (heaviest set performed for
+              exactly that many reps) instead of the overall heaviest set
+
+    Returns:
+        List of dicts with exercise_name, max_weight, reps, date
+    """
+    query = """
+        SELECT exercise_name, weight as max_weight, reps, date
+        FROM personal_records
+        WHERE rep_count = ?
+    """
+    params = [reps or 0]
+
+    if exercise_name:
+        query += " AND exercise_name = ?"
+        params.append(exercise_name)
+
+    query += " ORDER BY exercise_name"
+
+    with connection() as conn:
+        cur = conn.cursor()
+        cur.execute(query, params)
+        rows = cur.fetchall()
+
+    return [dict(row) for row in rows]
+
+
+@cached
+def get_estimated_1rm_records(exercise_name=None):
+    """
+    Get the set with the highest estimated 1RM (Epley) for each exercise.
+
+    Each exercise is a seek on the (exercise_id, e1rm) index of the stored
+    sets.e1rm column. Ties go to the set with the earliest date, then the
+    one saved first, as in the personal_records table.
+
+    Args:
+        exercise_name: Optional specific exercise, or None for all exercises
+
+    Returns:
+        List of dicts with exercise_name, estimated_1rm (rounded to 2
+        decimals, as in get_estimated_1rm_progression()), weight, reps, date
+    """
+    query = """
+        SELECT
+            e.name as exercise_name,
+            s.e1rm as estimated_1rm,
+            s.weight,
+            s.reps,
+            w.date
+        FROM exercises e
+        JOIN sets s ON s.id = (
+            SELECT t.id FROM sets t
+            JOIN workouts tw ON t.workout_id = tw.id
+            WHERE t.exercise_id = e.id
+            AND t.e1rm = (SELECT MAX(e1rm) FROM sets WHERE exercise_id = e.id)
+            ORDER BY tw.day ASC, t.id ASC
+            LIMIT 1
+        )
+        JOIN workouts w ON s.workout_id = w.id
+    """
+    params = []
+
+    if exercise_name:
+        query += " WHERE e.name = ?"
+        params.append(exercise_name)
+
+    query += " ORDER BY e.name"
+
+    with connection() as conn:
+        cur = conn.cursor()
+        cur.execute(query, params)
+        rows = cur.fetchall()
+
+    return [
+        {**dict(row), 'estimated_1rm': round(row['estimated_1rm'], 2)}
+        for row in rows
+    ]
+
+
+@cached
+def get_workout_records(workout_id):
+    """
+    Get the personal records set in a workout, e.g. to report them on save.
+
+    Exercises with no sets in an earlier workout are not reported, since
+    their first session is a record by default. Earlier means an earlier
+    date, or the same date and saved before, so a back-dated first session
+    is not reported either.
+
+    Args:
+        workout_id: ID of the workout
+
+    Returns:
+        List of dicts with exercise_name, max_weight, reps, date, rep_count
+        (0 for an overall record, otherwise the rep count of a rep max)
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+
+        cur.execute(
+            """
+            SELECT
+                pr.exercise_name,
+                pr.weight as max_weight,
+                pr.reps,
+                pr.date,
+                pr.rep_count
+            FROM sets s
+            JOIN workouts w ON w.id = s.workout_id
+            JOIN personal_records pr ON pr.set_id = s.id
+            WHERE s.workout_id = ?
+            AND EXISTS (
+                SELECT 1 FROM sets prev
+                JOIN workouts pw ON pw.id = prev.workout_id
+                WHERE prev.exercise_id = s.exercise_id
+                AND (pw.day, pw.id) < (w.day, w.id)
+            )
+            ORDER BY pr.exercise_name, pr.rep_count
+            """,
+            (workout_id,)
+        )
+
+        rows = cur.fetchall()
+
+    return [dict(row) for row in rows]
+
+
+@cached
+def get_workout_frequency(days=30):
+    """
+    Calculate workout frequency for the last N days.
+
+    Args:
+        days: Number of days to analyze (default 30)
+
+    Returns:
+        Dict with total_workouts, days_analyzed, avg_per_week
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+
+        cur.execute(
+            """
+            SELECT COUNT(*) as workout_count
+            FROM workouts
+            WHERE day >= ?
+            """,
+            (day_number(datetime.now()) - days,)
+        )
+
+        result = cur.fetchone()
+
+    workout_count = result[0] if result else 0
+    avg_per_week = (workout_count / days) * 7 if days > 0 else 0
+
+    return {
+        'total_workouts': workout_count,
+        'days_analyzed': days,
+        'avg_per_week': round(avg_per_week, 2)
+    }
@@ -0,0 +1,663 @@
+# workout_tracker/benchmarks.py
+
+"""
+Benchmarks for the database layer.
+
+Run with:
+
+    python -m workout_tracker.benchmarks <name> [--size N]
+
+Every benchmark works on a throwaway database in a temporary directory and
+never touches workouts.db.
+"""
+
+import argparse
+import csv
+import random
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+
+from . import db
+
+EXERCISES = [
+    "Bench Press", "Squat", "Deadlift", "Overhead Press", "Barbell Row",
+    "Pull Up", "Incline Dumbbell Press", "Romanian Deadlift", "Leg Press",
+    "Lat Pulldown", "Bicep Curl", "Tricep Pushdown",
+]
+
+WORKOUT_TYPES = ["Push", "Pull", "Legs", "Upper", "Lower", "Full Body"]
+
+CARDIO_TYPES = ["Running", "Cycling", "Walking", "Rowing"]
+
+
+def synthetic_workouts(count, sets_per_workout=12, seed=0):
+    """
+    Generate workouts shaped like save_workout() keyword arguments.
+
+    Args:
+        count: Number of workouts (one per day, ending today)
+        sets_per_workout: Number of sets in each workout
+        seed: Random seed so runs are comparable
+
+    Yields:
+        Dicts with date, workout_type, sets_data, cardio_minutes, cardio_type
+    """
+    rng = random.Random(seed)
+    first_day = date.today() - timedelta(days=count - 1)
+
+    for day in range(count):
+        exercises = rng.sample(EXERCISES, 3)
+        sets_data = []
+        for i in range(sets_per_workout):
+            sets_data.append({
+                'exercise_name': exercises[i % len(exercises)],
+                'set_number': i // len(exercises) + 1,
+                'reps': rng.randint(1, 12),
+                'weight': rng.randint(20, 160) * 2.5,
+                'rpe': rng.choice([None, 7.0, 8.0, 9.0]),
+            })
+
+        has_cardio = day % 3 == 0
+        yield {
+            'date': (first_day + timedelta(days=day)).isoformat(),
+            'workout_type': rng.choice(WORKOUT_TYPES),
+            'sets_data': sets_data,
+            'cardio_minutes': rng.randint(10, 60) if has_cardio else None,
+            'cardio_type': rng.choice(CARDIO_TYPES) if has_cardio else None,
+        }
+
+
+@contextmanager
+def temp_database(profile=None):
+    """Point the shared connection pool at a fresh temporary database."""
+    previous_path, previous_profile = db.DB_PATH, db.PROFILE
+    with tempfile.TemporaryDirectory() as tmp:
+        db.configure_pool(db_path=Path(tmp) / "bench.db", profile=profile)
+        try:
+            db.create_tables()
+            yield
+        finally:
+            db.configure_pool(db_path=previous_path, profile=previous_profile)
+
+
+def _print_table(headers, rows):
+    """Print rows as a plain aligned text table."""
+    cells = [[str(h) for h in headers]]
+    for row in rows:
+        cells.append([f"{v:,.1f}" if isinstance(v, float) else str(v) for v in row])
+    widths = [max(len(r[i]) for r in cells) for i in range(len(headers))]
+    for n, row in enumerate(cells):
+        print("  ".join(c.rjust(w) for c, w in zip(row, widths)))
+        if n == 0:
+            print("  ".join("-" * w for w in widths))
+
+
+def bench_profiles(size=500, read_rounds=20):
+    """Compare write and read throughput of each PRAGMA profile."""
+    from .services.workout_service import save_workout, get_workouts
+    from .services.analytics_service import (
+        get_exercise_progression,
+        get_weekly_volume,
+        get_personal_records,
+    )
+    from .services.cache import set_cache_enabled
+
+    workouts = list(synthetic_workouts(size))
+    rows = []
+
+    # Measure the database, not cached results
+    cache_was_enabled = set_cache_enabled(False)
+    try:
+        for profile in db.PROFILES:
+            with temp_database(profile):
+                start = time.perf_counter()
+                for workout in workouts:
+                    save_workout(**workout)
+                write_time = time.perf_counter() - start
+
+                start = time.perf_counter()
+                for _ in range(read_rounds):
+                    get_workouts()
+                    get_weekly_volume(52)
+                    get_exercise_progression(EXERCISES[0])
+                    get_personal_records()
+                read_time = time.perf_counter() - start
+
+            rows.append((profile, size / write_time, read_rounds * 4 / read_time))
+    finally:
+        set_cache_enabled(cache_was_enabled)
+
+    print(f"PRAGMA profiles ({size} workouts, one commit each)")
+    _print_table(["profile", "saves/s", "queries/s"], rows)
+
+
+def bench_ingest(size=2000):
+    """Compare save_workout() in a loop with the batched save_workouts()."""
+    from .services.workout_service import save_workout, save_workouts
+
+    workouts = list(synthetic_workouts(size))
+    total_sets = sum(len(w['sets_data']) for w in workouts)
+    rows = []
+
+    with temp_database():
+        start = time.perf_counter()
+        for workout in workouts:
+            save_workout(**workout)
+        seconds = time.perf_counter() - start
+    rows.append(("save_workout() loop", seconds, total_sets / seconds))
+
+    with temp_database():
+        result = save_workouts(workouts)
+    rows.append(("save_workouts()", result['seconds'], result['sets_per_second']))
+
+    print(f"Bulk ingest ({size} workouts, {total_sets} sets)")
+    _print_table(["method", "seconds", "sets/s"], rows)
+
+
+def bench_delete(size=1095, days=365):
+    """Compare deleting the last `days` days of workouts one by one and in bulk."""
+    from .services.workout_service import (
+        save_workouts,
+        get_workouts,
+        delete_workout,
+        delete_workouts,
+        delete_workouts_between,
+    )
+
+    workouts = list(synthetic_workouts(size))
+    end = date.today()
+    start = end - timedelta(days=days - 1)
+    rows = []
+
+    def delete_loop(ids):
+        for workout_id in ids:
+            delete_workout(workout_id)
+
+    cases = [
+        ("delete_workout() loop", delete_loop),
+        ("delete_workouts(ids)", delete_workouts),
+        ("delete_workouts_between()", lambda ids: delete_workouts_between(start, end)),
+    ]
+
+    for name, delete in cases:
+        with temp_database():
+            save_workouts(workouts)
+            ids = [w['id'] for w in get_workouts(start.isoformat(), end.isoformat())]
+            seconds = _time_call(delete, ids)
+            remaining = len(get_workouts(start.isoformat(), end.isoformat()))
+        rows.append((name, len(ids), seconds, len(ids) / seconds, remaining))
+
+    print(f"Delete the last {days} days of a {size}-workout database")
+    _print_table(["method", "workouts", "seconds", "workouts/s", "left"], rows)
+
+
+# Queries replaced in user-facing code, kept here for comparison only
+_LEGACY_TOP_SET_SQL = """
+    SELECT w.date, s.weight, s.reps, s.rpe
+    FROM sets s
+    JOIN workouts w ON s.workout_id = w.id
+    JOIN exercises e ON s.exercise_id = e.id
+    WHERE e.name = ?
+    AND s.weight = (
+        SELECT MAX(s2.weight)
+        FROM sets s2
+        JOIN workouts w2 ON s2.workout_id = w2.id
+        WHERE s2.exercise_id = s.exercise_id
+        AND w2.date = w.date
+    )
+    GROUP BY w.date
+    ORDER BY w.date ASC
+"""
+
+_LEGACY_PR_SQL = """
+    SELECT e.name as exercise_name, MAX(s.weight) as max_weight, s.reps, w.date
+    FROM sets s
+    JOIN workouts w ON s.workout_id = w.id
+    JOIN exercises e ON s.exercise_id = e.id
+    WHERE (s.exercise_id, s.weight) IN (
+        SELECT exercise_id, MAX(weight)
+        FROM sets
+        GROUP BY exercise_id
+    )
+    GROUP BY s.exercise_id
+    ORDER BY e.name
+"""
+
+# The window-function version of get_personal_records(), which now reads
+# the trigger-maintained personal_records table instead
+_WINDOW_PR_SQL = """
+    WITH best AS (
+        SELECT exercise_id, MAX(weight) as max_weight
+        FROM sets
+        GROUP BY exercise_id
+    )
+    SELECT exercise_name, max_weight, reps, date
+    FROM (
+        SELECT
+            e.name as exercise_name,
+            s.weight as max_weight,
+            s.reps,
+            w.date,
+            ROW_NUMBER() OVER (
+                PARTITION BY s.exercise_id
+                ORDER BY s.reps DESC, w.date ASC, s.id ASC
+            ) as rank
+        FROM best b
+        JOIN sets s ON s.exercise_id = b.exercise_id AND s.weight = b.max_weight
+        JOIN workouts w ON s.workout_id = w.id
+        JOIN exercises e ON s.exercise_id = e.id
+    )
+    WHERE rank = 1
+    ORDER BY exercise_name
+"""
+
+
+def _time_sql(sql, params=(), budget=60.0):
+    """
+    Time a query on a fresh connection, aborting it after `budget` seconds.
+
+    Returns:
+        Tuple of (seconds, finished)
+    """
+    conn = db.get_connection()
+    deadline = time.perf_counter() + budget
+    conn.set_progress_handler(lambda: time.perf_counter() > deadline, 100000)
+    start = time.perf_counter()
+    try:
+        conn.execute(sql, params).fetchall()
+        finished = True
+    except sqlite3.OperationalError:  # interrupted by the progress handler
+        finished = False
+    finally:
+        conn.close()
+    return time.perf_counter() - start, finished
+
+
+def _time_call(fn, *args):
+    """Return the wall time of one call."""
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def bench_window(size=1_000_000, budget=60.0):
+    """
+    Compare the window-function best-set queries with the old subqueries.
+
+    Both columns bypass the query cache. get_personal_records() reads the
+    personal_records table now, so its window query is timed as raw SQL and
+    the table lookup is printed separately.
+    """
+    from .services.workout_service import save_workouts
+    from .services.analytics_service import get_top_set_by_date, get_personal_records
+
+    with temp_database():
+        save_workouts(synthetic_workouts(max(size // 12, 1)))
+        exercise = EXERCISES[0]
+
+        cases = [
+            ("get_top_set_by_date", _LEGACY_TOP_SET_SQL, (exercise,),
+             lambda: _time_call(get_top_set_by_date.uncached, exercise)),
+            ("personal records", _LEGACY_PR_SQL, (),
+             lambda: _time_sql(_WINDOW_PR_SQL, (), budget)[0]),
+        ]
+
+        rows = []
+        for name, legacy_sql, params, time_window in cases:
+            legacy, finished = _time_sql(legacy_sql, params, budget)
+            window = time_window()
+            bound = "" if finished else ">"
+            rows.append((name, f"{bound}{legacy:.3f}", f"{window:.3f}",
+                         f"{bound}{legacy / window:,.0f}x"))
+
+        table = _time_call(get_personal_records.uncached)
+
+    print(f"Best-set queries ({size:,} sets)")
+    _print_table(["query", "subquery s", "window s", "speedup"], rows)
+    print(f"get_personal_records() from the personal_records table: {table:.4f} s")
+
+
+def _measure(build):
+    """
+    Time building a result, then build it again to measure the memory it holds.
+
+    Returns:
+        Tuple of (seconds, bytes)
+    """
+    seconds = _time_call(build)
+    tracemalloc.start()
+    try:
+        result = build()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return seconds, size
+
+
+_SETS_SQL = """
+    SELECT e.name as exercise_name, s.set_number, s.reps, s.weight, s.rpe
+    FROM sets s
+    JOIN exercises e ON s.exercise_id = e.id
+    ORDER BY s.id
+"""
+
+
+def bench_records(size=120_000):
+    """Compare dict rows with the record types in time and memory."""
+    from .services.workout_service import save_workouts, workout_summary_query
+    from .services.analytics_service import (
+        calculate_estimated_1rm,
+        get_estimated_1rm_progression,
+    )
+    from .services.records import WorkoutSummary, SetRecord, row_factory
+
+    def fetch(sql, params=(), factory=None):
+        with db.connection() as conn:
+            cur = conn.cursor()
+            if factory is not None:
+                cur.row_factory = factory
+            cur.execute(sql, params)
+            return cur.fetchall()
+
+    def legacy_progression(exercise):
+        # Two dicts per set, as before the record types
+        sql = """
+            SELECT w.date, s.weight, s.reps, s.rpe
+            FROM sets s
+            JOIN workouts w ON s.workout_id = w.id
+            JOIN exercises e ON s.exercise_id = e.id
+            WHERE e.name = ?
+            ORDER BY w.date ASC
+        """
+        progression = []
+        for row in fetch(sql, (exercise,)):
+            row_dict = dict(row)
+            progression.append({
+                'date': row_dict['date'],
+                'estimated_1rm': round(calculate_estimated_1rm(row_dict['weight'], row_dict['reps']), 2),
+                'actual_weight': row_dict['weight'],
+                'reps': row_dict['reps'],
+                'rpe': row_dict['rpe']
+            })
+        return progression
+
+    with temp_database():
+        summary_sql, _ = workout_summary_query()
+        save_workouts(synthetic_workouts(max(size // 12, 1)))
+        exercise = EXERCISES[0]
+
+        cases = [
+            ("workouts", len(fetch(summary_sql)),
+             lambda: [dict(row) for row in fetch(summary_sql)],
+             lambda: fetch(summary_sql, factory=row_factory(WorkoutSummary))),
+            ("sets", len(fetch(_SETS_SQL)),
+             lambda: [dict(row) for row in fetch(_SETS_SQL)],
+             lambda: fetch(_SETS_SQL, factory=row_factory(SetRecord))),
+            ("1RM progression", len(legacy_progression(exercise)),
+             lambda: legacy_progression(exercise),
+             lambda: get_estimated_1rm_progression.uncached(exercise)),
+        ]
+
+        rows = []
+        for name, count, as_dicts, as_records in cases:
+            dict_time, dict_bytes = _measure(as_dicts)
+            record_time, record_bytes = _measure(as_records)
+            rows.append((name, count, f"{dict_time:.3f}", f"{record_time:.3f}",
+                         dict_bytes / count, record_bytes / count))
+
+    print(f"Dict rows vs record types ({size:,} sets)")
+    _print_table(["result", "rows", "dict s", "record s", "dict B/row", "record B/row"], rows)
+
+
+def bench_e1rm(size=1_000_000):
+    """Compare the scalar e1RM loop with the vectorized engine, per exercise and day."""
+    from .services.workout_service import save_workouts
+    from .services.analytics_service import get_daily_estimated_1rm
+    from .services.e1rm import (
+        FORMULAS,
+        estimate_one,
+        estimate_1rm,
+        reduce_by_day,
+        set_columns,
+        numpy_available,
+    )
+
+    if not numpy_available():
+        print("NumPy is not installed; the e1RM benchmark needs it")
+        return
+
+    with temp_database():
+        save_workouts(synthetic_workouts(max(size // 12, 1)))
+        with db.connection() as conn:
+            cur = conn.cursor()
+            cur.row_factory = None
+            cur.execute(
+                """
+                SELECT s.exercise_id, w.day, s.weight, s.reps, COALESCE(s.rpe, 10.0)
+                FROM sets s
+                JOIN workouts w ON s.workout_id = w.id
+                """
+            )
+            rows = cur.fetchall()
+
+        def scalar_loop(formula):
+            best = {}
+            for exercise_id, day, weight, reps, rpe in rows:
+                value = estimate_one(weight, reps, rpe, formula)
+                key = (exercise_id, day)
+                if value > best.get(key, float('-inf')):
+                    best[key] = value
+            return best
+
+        def vectorized(sets, formula):
+            estimates = estimate_1rm(sets['weight'], sets['reps'], sets['rpe'], formula)
+            return reduce_by_day(sets['group'], sets['day'], estimates, 'max')
+
+        convert = _time_call(set_columns, rows)
+        sets = set_columns(rows)
+
+        results = []
+        for formula in FORMULAS:
+            loop = _time_call(scalar_loop, formula)
+            compute = _time_call(vectorized, sets, formula)
+            results.append((formula, f"{loop:.3f}", f"{compute:.3f}", f"{loop / compute:,.1f}x",
+                            f"{loop / (convert + compute):,.1f}x"))
+
+        end_to_end = _time_call(get_daily_estimated_1rm.uncached)
+
+    print(f"Best e1RM per exercise and day ({len(rows):,} sets, rows already fetched)")
+    _print_table(["formula", "loop s", "NumPy s", "speedup", "incl. convert"], results)
+    print(f"Converting the rows to NumPy columns: {convert:.3f} s")
+    print(f"get_daily_estimated_1rm() including the query: {end_to_end:.3f} s")
+
+
+def bench_export(size=400_000):
+    """Compare peak memory of a streamed sets export with reading every row first."""
+    from .services.workout_service import save_workouts
+    from .export import export_sets_to_csv, _SETS_EXPORT_SQL, SETS_HEADER
+
+    def fetch_all_then_write(path):
+        # As before streaming: the whole result is read before writing
+        with db.connection() as conn:
+            rows = conn.execute(_SETS_EXPORT_SQL).fetchall()
+        with open(path, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(SETS_HEADER)
+            writer.writerows(rows)
+        return len(rows)
+
+    def peak(export, path):
+        tracemalloc.start()
+        try:
+            start = time.perf_counter()
+            count = export(path)
+            seconds = time.perf_counter() - start
+            _, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return count, seconds, peak_bytes
+
+    rows = []
+    for workouts in (max(size // 48, 1), max(size // 12, 1)):
+        with temp_database(), tempfile.TemporaryDirectory() as tmp:
+            save_workouts(synthetic_workouts(workouts))
+            path = Path(tmp) / "sets.csv"
+            for name, export in (("fetchall", fetch_all_then_write),
+                                 ("streamed", export_sets_to_csv)):
+                count, seconds, peak_bytes = peak(export, path)
+                rows.append((name, f"{count:,}", f"{seconds:.3f}", peak_bytes / 1024))
+
+    print("Sets CSV export, traced Python memory")
+    _print_table(["method", "sets", "seconds", "peak KiB"], rows)
+
+
+def bench_columnar(size=1_000_000):
+    """Compare CSV with Parquet and Arrow exports in time, size and load time."""
+    from .services.workout_service import save_workouts
+    from .export import FORMATS, export_all_data
+    from .columnar import pyarrow_available, read_export, load_export
+
+    if not pyarrow_available():
+        print("pyarrow is not installed; the columnar benchmark needs it")
+        return
+    try:
+        import pandas
+    except ImportError:
+        pandas = None
+
+    def load_csv(path):
+        if pandas is not None:
+            return pandas.read_csv(path)
+        with open(path, newline='', encoding='utf-8') as csvfile:
+            return list(csv.reader(csvfile))
+
+    def load_columnar(path):
+        return load_export(path) if pandas is not None else read_export(path)
+
+    rows = []
+    with temp_database(), tempfile.TemporaryDirectory() as tmp:
+        save_workouts(synthetic_workouts(max(size // 12, 1)))
+        for format in FORMATS:
+            start = time.perf_counter()
+            result = export_all_data(Path(tmp) / format, format=format)
+            seconds = time.perf_counter() - start
+            path = Path(result['sets_file'])
+            load = _time_call(load_csv if format == 'csv' else load_columnar, path)
+            rows.append((format, f"{seconds:.3f}", path.stat().st_size / 2**20, f"{load:.3f}"))
+
+    loader = "pandas" if pandas is not None else "csv.reader / pyarrow (pandas not installed)"
+    print(f"export_all_data() by format ({size:,} sets); sets file loaded with {loader}")
+    _print_table(["format", "export s", "sets MiB", "load s"], rows)
+
+
+def bench_compression(size=1_000_000):
+    """Compare the CSV compression codecs in size and throughput."""
+    from .services.workout_service import save_workouts
+    from .export import (
+        COMPRESSIONS,
+        SETS_HEADER,
+        _SETS_EXPORT_SQL,
+        _iter_chunks,
+        _write_csv,
+        export_all_data,
+    )
+
+    rows = []
+    with temp_database(), tempfile.TemporaryDirectory() as tmp:
+        save_workouts(synthetic_workouts(max(size // 12, 1)))
+        with db.connection() as conn:
+            cur = conn.cursor()
+            cur.row_factory = None
+            chunks = list(_iter_chunks(cur.execute(_SETS_EXPORT_SQL)))
+        count = sum(len(chunk) for chunk in chunks)
+
+        plain_bytes = None
+        for compression in (None, *COMPRESSIONS):
+            name = compression or "none"
+            path = Path(tmp) / f"sets_{name}.csv"
+            try:
+                seconds = _time_call(_write_csv, path, SETS_HEADER, chunks, compression)
+            except ImportError as e:
+                print(f"Skipping {name}: {e}")
+                continue
+            file_bytes = path.stat().st_size
+            plain_bytes = plain_bytes or file_bytes
+            start = time.perf_counter()
+            export_all_data(Path(tmp) / name, compression=compression)
+            export_seconds = time.perf_counter() - start
+            rows.append((name, file_bytes / 2**20, f"{plain_bytes / file_bytes:.1f}x",
+                         f"{seconds:.3f}", plain_bytes / 2**20 / seconds, f"{export_seconds:.3f}"))
+
+    print(f"Sets CSV by compression codec ({count:,} sets)")
+    _print_table(["codec", "MiB", "ratio", "write s", "CSV MiB/s", "export_all_data s"], rows)
+
+
+def bench_delta(size=1_000_000, days=7):
+    """Compare nightly full exports with incremental deltas and compaction."""
+    from .services.workout_service import save_workouts
+    from .export import export_all_data
+    from .delta import compact, export_delta
+
+    rows = []
+    with temp_database(), tempfile.TemporaryDirectory() as tmp:
+        history = max(size // 12, 1)
+        save_workouts(synthetic_workouts(history))
+        backups = Path(tmp) / "deltas"
+
+        start = time.perf_counter()
+        first = export_delta(backups)
+        rows.append(("first delta (full history)", first['workouts'], time.perf_counter() - start))
+
+        for day in range(days):
+            save_workouts(synthetic_workouts(1, seed=day + 1))
+            start = time.perf_counter()
+            result = export_delta(backups)
+            delta_seconds = time.perf_counter() - start
+        rows.append(("nightly delta (1 workout)", result['workouts'], delta_seconds))
+
+        start = time.perf_counter()
+        export_all_data(Path(tmp) / "full")
+        rows.append(("nightly export_all_data()", history + days, time.perf_counter() - start))
+
+        start = time.perf_counter()
+        result = compact(backups)
+        rows.append((f"compact ({result['deltas']} deltas)", result['workouts'],
+                     time.perf_counter() - start))
+
+    print(f"Incremental backups ({history:,} workouts of history)")
+    _print_table(["operation", "workouts", "seconds"],
+                 [(name, f"{count:,}", f"{seconds:.3f}") for name, count, seconds in rows])
+
+
+BENCHMARKS = {
+    'profiles': bench_profiles,
+    'ingest': bench_ingest,
+    'window': bench_window,
+    'delete': bench_delete,
+    'records': bench_records,
+    'e1rm': bench_e1rm,
+    'export': bench_export,
+    'columnar': bench_columnar,
+    'compression': bench_compression,
+    'delta': bench_delta,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Workout Tracker benchmarks")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--size", type=int, help="Override the data set size")
+    args = parser.parse_args(argv)
+
+    kwargs = {'size': args.size} if args.size else {}
+    BENCHMARKS[args.benchmark](**kwargs)
+
+
+if __name__ == "__main__":
+    main()
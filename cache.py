@@ -0,0 +1,177 @@
+# workout_tracker/services/cache.py
+
+"""
+Result cache for the read-only service functions.
+
+Results are keyed on the function and its arguments and stamped with the
+database version they were read at: the write generation of this process,
+PRAGMA data_version (which also moves when another process commits) and
+the current day, since several analytics are relative to today. A lookup
+whose stamp no longer matches drops the whole cache.
+
+Disable it with query_cache = off in workout_tracker.ini, the
+WORKOUT_TRACKER_QUERY_CACHE=0 environment variable or set_cache_enabled().
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+from datetime import date
+
+from .. import db
+
+
+class QueryCache:
+    """
+    Bounded LRU mapping of call keys to results, valid for one database
+    version at a time.
+    """
+
+    def __init__(self, maxsize=db.QUERY_CACHE_SIZE, enabled=db.QUERY_CACHE):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self._entries = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def current_version():
+        """Return the stamp identifying the data cached results were read from."""
+        return (db.write_generation(), db.data_version(), date.today().toordinal())
+
+    def get(self, key, version):
+        """
+        Return (True, result) for a cached call, or (False, None) on a miss.
+
+        Entries read at another version are discarded first.
+        """
+        with self._lock:
+            if version != self._version:
+                if self._entries:
+                    self.invalidations += 1
+                self._entries.clear()
+                self._version = version
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, version, result):
+        """Store a result read at `version`, evicting the oldest entries if full."""
+        with self._lock:
+            if version != self._version or self.maxsize <= 0:
+                return
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every cached result and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self):
+        """Return hit/miss statistics and the current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations
+            }
+
+
+_cache = QueryCache()
+
+
+def _freeze(value):
+    """Turn list/dict/set arguments into hashable equivalents for the cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+def _copy(value):
+    """
+    Copy the lists and dicts of a result. Service results only nest these
+    around immutable values, so this is a much cheaper deep copy.
+    """
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    return value
+
+
+def cached(fn):
+    """
+    Cache the results of a read-only service function.
+
+    Callers get their own copy of the cached result, so mutating it does not
+    affect later calls. Calls with unhashable arguments are not cached.
+    The undecorated function stays available as `fn.uncached`.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not _cache.enabled:
+            return fn(*args, **kwargs)
+
+        try:
+            key = (fn.__module__, fn.__qualname__, _freeze(args), _freeze(kwargs))
+            hash(key)
+        except TypeError:
+            return fn(*args, **kwargs)
+
+        version = _cache.current_version()
+        hit, result = _cache.get(key, version)
+        if hit:
+            return _copy(result)
+
+        result = fn(*args, **kwargs)
+        _cache.put(key, version, _copy(result))
+        return result
+
+    wrapper.uncached = fn
+    return wrapper
+
+
+def cache_stats():
+    """Return hit/miss statistics of the query cache."""
+    return _cache.stats()
+
+
+def clear_cache():
+    """Drop all cached results and reset the statistics."""
+    _cache.clear()
+
+
+def set_cache_enabled(enabled):
+    """
+    Turn the query cache on or off for this process.
+
+    Returns:
+        The previous setting
+    """
+    previous, _cache.enabled = _cache.enabled, bool(enabled)
+    if not enabled:
+        _cache.clear()
+    return previous
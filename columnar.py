@@ -0,0 +1,284 @@
+# workout_tracker/columnar.py
+
+"""
+Columnar (Parquet and Arrow IPC) export files.
+
+The CSV exports write every value as text. The columnar formats keep the
+types: dates are dates, weights are floats, a missing RPE is null, and
+repeated strings such as exercise names are dictionary-encoded, so they
+load into pandas as categoricals. Rows are written in batches as they are
+read, like the CSV exports.
+
+pyarrow is imported on first use, so the rest of the application runs
+without it; the functions here raise ImportError when it is missing.
+"""
+
+import functools
+from pathlib import Path
+
+# File extension of each columnar format. Arrow files use the IPC stream
+# format, which allows the dictionaries to grow from one batch to the next.
+FORMATS = {
+    'parquet': '.parquet',
+    'arrow': '.arrows',
+}
+
+# Rows per record batch (and per Parquet row group)
+BATCH_SIZE = 65536
+
+# Compression codecs each format can apply inside the file. Parquet files
+# are Snappy-compressed when no codec is given.
+CODECS = {
+    'parquet': ('gzip', 'zstd'),
+    'arrow': ('zstd',),
+}
+
+
+@functools.cache
+def _pyarrow():
+    """Return the pyarrow module, or None when it is not installed."""
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def pyarrow_available():
+    """Return True if columnar files can be written and read."""
+    return _pyarrow() is not None
+
+
+def _require_pyarrow():
+    pa = _pyarrow()
+    if pa is None:
+        raise ImportError("pyarrow is required for Parquet and Arrow exports")
+    return pa
+
+
+def check_format(format):
+    """
+    Raise ValueError unless `format` is one of FORMATS.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown columnar format {format!r}, expected one of {', '.join(FORMATS)}")
+
+
+def check_compression(format, compression):
+    """
+    Raise ValueError unless `format` can be compressed with `compression`.
+    """
+    if compression is not None and compression not in CODECS[format]:
+        raise ValueError(
+            f"{format} files cannot be compressed with {compression!r}; "
+            f"supported codecs: {', '.join(CODECS[format])}"
+        )
+
+
+# Column names and types of each export, in the column order of the export
+# queries in export.py. 'dict' columns are dictionary-encoded strings.
+SCHEMAS = {
+    'workouts': [
+        ('workout_id', 'int64'),
+        ('date', 'date'),
+        ('workout_type', 'dict'),
+        ('notes', 'string'),
+        ('total_sets', 'int64'),
+        ('total_volume', 'float64'),
+        ('cardio_minutes', 'int64'),
+    ],
+    'sets': [
+        ('set_id', 'int64'),
+        ('workout_id', 'int64'),
+        ('date', 'date'),
+        ('workout_type', 'dict'),
+        ('exercise', 'dict'),
+        ('set_number', 'int32'),
+        ('reps', 'int32'),
+        ('weight', 'float64'),
+        ('rpe', 'float64'),
+    ],
+    'cardio': [
+        ('cardio_id', 'int64'),
+        ('workout_id', 'int64'),
+        ('date', 'date'),
+        ('workout_type', 'dict'),
+        ('cardio_type', 'dict'),
+        ('minutes', 'int32'),
+    ],
+    'exercise': [
+        ('set_id', 'int64'),
+        ('date', 'date'),
+        ('workout_type', 'dict'),
+        ('exercise', 'dict'),
+        ('set_number', 'int32'),
+        ('reps', 'int32'),
+        ('weight', 'float64'),
+        ('rpe', 'float64'),
+        ('workout_notes', 'string'),
+    ],
+}
+
+
+def _arrow_type(pa, kind):
+    if kind == 'dict':
+        return pa.dictionary(pa.int32(), pa.string())
+    if kind == 'date':
+        return pa.date32()
+    return getattr(pa, kind)()
+
+
+def arrow_schema(name):
+    """
+    Return the pyarrow schema of an export.
+
+    Args:
+        name: Key of SCHEMAS
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    pa = _require_pyarrow()
+    return pa.schema([(column, _arrow_type(pa, kind)) for column, kind in SCHEMAS[name]])
+
+
+class _DictionaryEncoder:
+    """
+    Dictionary-encode one string column across all batches of a file.
+
+    New values are appended to the dictionary, so every batch's dictionary
+    extends the previous one and Arrow writes only the new entries.
+    """
+
+    def __init__(self, pa):
+        self.pa = pa
+        self.index = {}
+        self.values = []
+
+    def encode(self, strings):
+        pa = self.pa
+        local = pa.array(strings, pa.string()).dictionary_encode()
+
+        # Map the batch's own (small) dictionary onto the file-wide one
+        mapping = []
+        for value in local.dictionary.to_pylist():
+            i = self.index.get(value)
+            if i is None:
+                i = self.index[value] = len(self.values)
+                self.values.append(value)
+            mapping.append(i)
+
+        indices = pa.compute.take(pa.array(mapping, pa.int32()), local.indices)
+        return pa.DictionaryArray.from_arrays(indices, pa.array(self.values, pa.string()))
+
+
+def _record_batch(pa, schema, rows, encoders):
+    """Build a record batch from a list of row tuples."""
+    arrays = []
+    for field, values in zip(schema, zip(*rows)):
+        if field.name in encoders:
+            arrays.append(encoders[field.name].encode(values))
+        elif field.type == pa.date32():
+            # YYYY-MM-DD text, parsed in C
+            arrays.append(pa.array(values, pa.string()).cast(pa.date32()))
+        else:
+            arrays.append(pa.array(values, field.type))
+    return pa.record_batch(arrays, schema=schema)
+
+
+def _open_writer(pa, path, schema, format, compression):
+    if format == 'parquet':
+        return pa.parquet.ParquetWriter(path, schema, compression=compression or 'snappy')
+    options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True, compression=compression)
+    return pa.ipc.new_stream(path, schema, options=options)
+
+
+def write_batches(output_path, name, chunks, format='parquet', compression=None):
+    """
+    Write chunks of export rows to a Parquet or Arrow IPC stream file.
+
+    Each chunk becomes one record batch (one Parquet row group), so only
+    one chunk is held in memory at a time.
+
+    Args:
+        output_path: Path to the output file
+        name: Key of SCHEMAS describing the rows
+        chunks: Iterable of lists of row tuples, in schema column order
+        format: One of FORMATS
+        compression: None or one of the format's CODECS
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        ValueError: If the format is unknown or cannot use the codec
+        ImportError: If pyarrow is not installed
+    """
+    check_format(format)
+    check_compression(format, compression)
+    pa = _require_pyarrow()
+    schema = arrow_schema(name)
+    encoders = {
+        field.name: _DictionaryEncoder(pa)
+        for field in schema
+        if pa.types.is_dictionary(field.type)
+    }
+
+    count = 0
+    with _open_writer(pa, output_path, schema, format, compression) as writer:
+        for rows in chunks:
+            writer.write_batch(_record_batch(pa, schema, rows, encoders))
+            count += len(rows)
+    return count
+
+
+def read_export(path, columns=None):
+    """
+    Read a Parquet or Arrow file written by the exporters.
+
+    The format is taken from the file extension (see FORMATS).
+
+    Args:
+        path: Path to a .parquet or .arrows file
+        columns: Optional list of column names to read
+
+    Returns:
+        pyarrow.Table
+
+    Raises:
+        ValueError: If the extension is not a columnar format
+        ImportError: If pyarrow is not installed
+    """
+    pa = _require_pyarrow()
+    suffix = Path(path).suffix
+    if suffix == FORMATS['parquet']:
+        return pa.parquet.read_table(path, columns=columns)
+    if suffix == FORMATS['arrow']:
+        with pa.memory_map(str(path)) as source:
+            table = pa.ipc.open_stream(source).read_all()
+        return table.select(columns) if columns is not None else table
+    raise ValueError(f"{path} is not a Parquet or Arrow export")
+
+
+def load_export(path, columns=None):
+    """
+    Load a Parquet or Arrow export into a pandas DataFrame.
+
+    Dictionary-encoded columns become categoricals and dates become
+    datetime64 columns.
+
+    Args:
+        path: Path to a .parquet or .arrows file
+        columns: Optional list of column names to read
+
+    Returns:
+        pandas.DataFrame
+
+    Raises:
+        ValueError: If the extension is not a columnar format
+        ImportError: If pyarrow or pandas is not installed
+    """
+    return read_export(path, columns).to_pandas(date_as_object=False)
@@ -1,65 +1,359 @@
-# workout_tracker/db.py
-
-import sqlite3
-from pathlib import Path
-
-# SQLite database file in the same folder as db.py
-DB_PATH = Path(__file__).resolve().parent / "workouts.db"
-
-
-def get_connection():
-    """Return a connection to the SQLite database."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row  # return rows as dictionaries
-    return conn
-
-
-def create_tables():
-    """Create the database tables if they don't already exist."""
-    conn = get_connection()
-    cur = conn.cursor()
-
-    # Workouts table
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS workouts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            date TEXT NOT NULL,
-            workout_type TEXT NOT NULL,
-            name TEXT,
-            notes TEXT
-        );
-        """
-    )
-
-    # Sets table
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS sets (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            workout_id INTEGER NOT NULL,
-            exercise_name TEXT NOT NULL,
-            set_number INTEGER NOT NULL,
-            reps INTEGER NOT NULL,
-            weight REAL NOT NULL,
-            rpe REAL,
-            FOREIGN KEY (workout_id) REFERENCES workouts(id)
-        );
-        """
-    )
-
-    # Cardio sessions table
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS cardio_sessions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            workout_id INTEGER NOT NULL,
-            cardio_type TEXT,
-            minutes INTEGER NOT NULL,
-            FOREIGN KEY (workout_id) REFERENCES workouts(id)
-        );
-        """
-    )
-
-    conn.commit()
-    conn.close()
+# workout_tracker/db.py
+
+import atexit
+import configparser
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from .migrations import migrate
+
+# SQLite database file in the same folder as db.py
+DB_PATH = Path(__file__).resolve().parent / "workouts.db"
+
+# Optional settings file; environment variables take precedence over it.
+#
+#   [database]
+#   profile = balanced
+#   pool_size = 4
+#   query_cache = on
+#   query_cache_size = 256
+CONFIG_PATH = Path(__file__).resolve().parent / "workout_tracker.ini"
+
+# Named PRAGMA performance profiles applied to every new connection.
+# cache_size is negative to express KiB rather than pages.
+PROFILES = {
+    # Fsync on every commit; survives power loss with no lost transactions
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -2000,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+    },
+    # Fsync only at checkpoints; a power cut can lose the last commits but
+    # never corrupts the file
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,
+        "mmap_size": 64 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+    # Large page cache and memory-mapped reads for analytics-heavy use
+    "fast-read": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+}
+
+DEFAULT_PROFILE = "balanced"
+
+
+def _load_settings():
+    """Read the [database] section of the config file, if there is one."""
+    parser = configparser.ConfigParser()
+    parser.read(CONFIG_PATH)
+    if parser.has_section("database"):
+        return dict(parser["database"])
+    return {}
+
+
+_settings = _load_settings()
+
+# Maximum number of connections the shared pool has open at once
+POOL_SIZE = int(
+    os.environ.get("WORKOUT_TRACKER_POOL_SIZE", _settings.get("pool_size", "4"))
+)
+
+# Performance profile used for new connections (one of PROFILES)
+PROFILE = os.environ.get(
+    "WORKOUT_TRACKER_DB_PROFILE", _settings.get("profile", DEFAULT_PROFILE)
+)
+
+# Whether read-only service results are cached (see services/cache.py)
+QUERY_CACHE = os.environ.get(
+    "WORKOUT_TRACKER_QUERY_CACHE", _settings.get("query_cache", "on")
+).strip().lower() not in ("0", "off", "false", "no")
+
+# Maximum number of cached results kept before the least recently used is evicted
+QUERY_CACHE_SIZE = int(
+    os.environ.get(
+        "WORKOUT_TRACKER_QUERY_CACHE_SIZE", _settings.get("query_cache_size", "256")
+    )
+)
+
+
+def apply_profile(conn, profile):
+    """
+    Apply a named PRAGMA performance profile to a connection.
+
+    Args:
+        conn: Open SQLite connection
+        profile: Name of a profile in PROFILES
+
+    Raises:
+        ValueError: If the profile name is unknown
+    """
+    if profile not in PROFILES:
+        raise ValueError(
+            f"Unknown database profile {profile!r}; "
+            f"expected one of {', '.join(PROFILES)}"
+        )
+    for pragma, value in PROFILES[profile].items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+
+
+def get_connection(profile=None):
+    """Return a new connection to the SQLite database."""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.row_factory = sqlite3.Row  # return rows as dictionaries
+    conn.execute("PRAGMA foreign_keys = ON")  # off by default in SQLite
+    apply_profile(conn, profile or PROFILE)
+    return conn
+
+
+class ConnectionPool:
+    """
+    Small pool of long-lived SQLite connections.
+
+    Connections are reused across service calls so that each one keeps its
+    parsed schema and prepared statement cache. At most `size` connections
+    are checked out at once; further callers wait in acquire() until one is
+    released. Borrowing a second connection while holding one can therefore
+    deadlock, so services never nest connection() blocks.
+    """
+
+    def __init__(self, size=POOL_SIZE, factory=get_connection):
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size!r}")
+        self.size = size
+        self._factory = factory
+        self._idle = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def acquire(self):
+        """
+        Take an idle connection from the pool, opening one if none is free.
+
+        Blocks while `size` connections are checked out.
+        """
+        self._slots.acquire()
+        try:
+            with self._lock:
+                if self._idle:
+                    return self._idle.pop()
+            return self._factory()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, conn):
+        """Return a connection to the pool and wake one waiting acquire()."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            with self._lock:
+                self._idle.append(conn)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a connection for the duration of a with-block.
+
+        The transaction is committed when the block exits normally and
+        rolled back if it raises.
+        """
+        conn = self.acquire()
+        changes = conn.total_changes
+        try:
+            yield conn
+            conn.commit()
+            if conn.total_changes != changes:
+                _bump_write_generation()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self.release(conn)
+
+    def close(self):
+        """Close every idle connection held by the pool."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+# Incremented after every committed write made through the pool, so that
+# cached query results can tell they are out of date
+_write_generation = 0
+_generation_lock = threading.Lock()
+
+
+def _bump_write_generation():
+    """Mark every cached query result as out of date."""
+    global _write_generation
+    with _generation_lock:
+        _write_generation += 1
+
+
+def write_generation():
+    """Return the number of write transactions committed through the pool."""
+    return _write_generation
+
+
+# Connection that never writes, used only to read PRAGMA data_version
+_watcher = None
+_watcher_lock = threading.Lock()
+
+
+def data_version():
+    """
+    Return PRAGMA data_version of a dedicated read-only connection.
+
+    The value changes whenever any other connection commits to the database
+    file, including connections in other processes.
+    """
+    global _watcher
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = sqlite3.connect(DB_PATH, check_same_thread=False)
+        return _watcher.execute("PRAGMA data_version").fetchone()[0]
+
+
+_pool = ConnectionPool()
+
+
+def connection():
+    """Borrow a connection from the shared pool (use as a context manager)."""
+    return _pool.connection()
+
+
+def configure_pool(size=None, db_path=None, profile=None):
+    """
+    Replace the shared connection pool.
+
+    Args:
+        size: Optional maximum number of open connections (default POOL_SIZE)
+        db_path: Optional path to a different database file
+        profile: Optional performance profile name for new connections
+    """
+    global _pool, DB_PATH, PROFILE
+    if profile is not None and profile not in PROFILES:
+        raise ValueError(f"Unknown database profile {profile!r}")
+    close_pool()
+    if db_path is not None:
+        DB_PATH = Path(db_path)
+    if profile is not None:
+        PROFILE = profile
+    _pool = ConnectionPool(size if size is not None else POOL_SIZE)
+    _bump_write_generation()  # The database may have changed
+
+
+def close_pool():
+    """
+    Close all pooled connections and the data_version watcher. Registered to
+    run at interpreter exit.
+    """
+    global _watcher
+    _pool.close()
+    with _watcher_lock:
+        if _watcher is not None:
+            _watcher.close()
+            _watcher = None
+
+
+atexit.register(close_pool)
+
+
+# Ordinal of 1970-01-01, day 0 of the workouts.day column
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def day_number(value):
+    """
+    Convert a date to the integer day number stored in workouts.day.
+
+    Args:
+        value: date/datetime or YYYY-MM-DD string
+
+    Returns:
+        Days since 1970-01-01
+
+    Raises:
+        ValueError: If a string is not a valid YYYY-MM-DD date
+    """
+    if isinstance(value, str):
+        try:
+            value = date.fromisoformat(value)
+        except ValueError:
+            raise ValueError(f"Invalid date {value!r}, expected YYYY-MM-DD") from None
+    return value.toordinal() - _EPOCH_ORDINAL
+
+
+def day_to_date(day):
+    """Convert a day number from workouts.day back to a YYYY-MM-DD string."""
+    return date.fromordinal(int(day) + _EPOCH_ORDINAL).isoformat()
+
+
+def create_tables():
+    """
+    Create the database tables if they don't already exist and apply any
+    pending schema migrations.
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+
+        # Workouts table
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS workouts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date TEXT NOT NULL,
+                workout_type TEXT NOT NULL,
+                name TEXT,
+                notes TEXT
+            );
+            """
+        )
+
+        # Sets table
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sets (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                workout_id INTEGER NOT NULL,
+                exercise_name TEXT NOT NULL,
+                set_number INTEGER NOT NULL,
+                reps INTEGER NOT NULL,
+                weight REAL NOT NULL,
+                rpe REAL,
+                FOREIGN KEY (workout_id) REFERENCES workouts(id)
+            );
+            """
+        )
+
+        # Cardio sessions table
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cardio_sessions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                workout_id INTEGER NOT NULL,
+                cardio_type TEXT,
+                minutes INTEGER NOT NULL,
+                FOREIGN KEY (workout_id) REFERENCES workouts(id)
+            );
+            """
+        )
+
+        # Bring existing database files up to the current schema version
+        migrate(conn)
@@ -0,0 +1,348 @@
+# workout_tracker/delta.py
+
+"""
+Incremental backups in JSON Lines.
+
+export_delta() writes only the workouts added, changed or deleted since the
+previous delta in a directory, using the workout_changes log. Each line is
+one whole workout with its sets and cardio sessions (or a deletion), so a
+later line for the same workout replaces an earlier one. compact() merges a
+directory's deltas into a single snapshot file.
+
+File names carry the change sequence range they cover, zero-padded so they
+sort in order:
+
+    delta_<since>_<watermark>.jsonl    changes with since < seq <= watermark
+    snapshot_<watermark>.jsonl         every workout as of watermark
+
+Run with:
+
+    python -m workout_tracker.delta export <directory> [--compression CODEC]
+    python -m workout_tracker.delta compact <directory> [--compression CODEC]
+"""
+
+import argparse
+import json
+import os
+import re
+from pathlib import Path
+
+from .db import connection, create_tables
+from .export import CHUNK_SIZE, COMPRESSIONS, compression_for, open_csv
+from .services.records import CardioSession, SetRecord, Workout
+
+_SEQ_WIDTH = 12
+
+_SUFFIXES = "|".join(re.escape(suffix) for suffix in COMPRESSIONS.values())
+_DELTA_NAME = re.compile(rf"delta_(\d+)_(\d+)\.jsonl(?:{_SUFFIXES})?")
+_SNAPSHOT_NAME = re.compile(rf"snapshot_(\d+)\.jsonl(?:{_SUFFIXES})?")
+
+
+def _scan(directory):
+    """
+    Return the newest snapshot and the deltas in a backup directory.
+
+    Returns:
+        Tuple of ((watermark, path) or None, [(since, watermark, path), ...]
+        sorted by sequence)
+    """
+    snapshot = None
+    deltas = []
+    directory = Path(directory)
+    if not directory.is_dir():
+        return snapshot, deltas
+
+    for path in directory.iterdir():
+        match = _DELTA_NAME.fullmatch(path.name)
+        if match:
+            deltas.append((int(match.group(1)), int(match.group(2)), path))
+            continue
+        match = _SNAPSHOT_NAME.fullmatch(path.name)
+        if match and (snapshot is None or int(match.group(1)) > snapshot[0]):
+            snapshot = (int(match.group(1)), path)
+
+    deltas.sort()
+    return snapshot, deltas
+
+
+def get_watermark(directory):
+    """
+    Return the change sequence number a backup directory is complete up to.
+
+    Returns:
+        Highest watermark of its snapshot and deltas, or 0 if it has none
+    """
+    snapshot, deltas = _scan(directory)
+    watermarks = [watermark for _, watermark, _ in deltas]
+    if snapshot:
+        watermarks.append(snapshot[0])
+    return max(watermarks, default=0)
+
+
+def _dumps(record):
+    return json.dumps(record, separators=(',', ':'))
+
+
+def _changed_workouts(conn, since, chunk_size):
+    """
+    Yield one delta record per workout changed after `since`, in seq order.
+    """
+    changes = conn.cursor()
+    changes.row_factory = None
+    changes.execute(
+        """
+        SELECT workout_id, seq, deleted
+        FROM workout_changes
+        WHERE seq > ?
+        ORDER BY seq
+        """,
+        (since,)
+    )
+
+    cur = conn.cursor()
+    cur.row_factory = None
+    while True:
+        rows = changes.fetchmany(chunk_size)
+        if not rows:
+            break
+
+        ids = json.dumps([workout_id for workout_id, _, deleted in rows if not deleted])
+        cur.execute(
+            """
+            SELECT id, date, workout_type, notes
+            FROM workouts
+            WHERE id IN (SELECT value FROM json_each(?))
+            """,
+            (ids,)
+        )
+        workouts = {
+            row[0]: {'workout': dict(zip(Workout._fields, row)), 'sets': [], 'cardio': []}
+            for row in cur
+        }
+
+        cur.execute(
+            """
+            SELECT s.workout_id, e.name, s.set_number, s.reps, s.weight, s.rpe
+            FROM sets s
+            JOIN exercises e ON s.exercise_id = e.id
+            WHERE s.workout_id IN (SELECT value FROM json_each(?))
+            ORDER BY s.id
+            """,
+            (ids,)
+        )
+        for workout_id, *values in cur:
+            workouts[workout_id]['sets'].append(dict(zip(SetRecord._fields, values)))
+
+        cur.execute(
+            """
+            SELECT workout_id, cardio_type, minutes
+            FROM cardio_sessions
+            WHERE workout_id IN (SELECT value FROM json_each(?))
+            ORDER BY id
+            """,
+            (ids,)
+        )
+        for workout_id, *values in cur:
+            workouts[workout_id]['cardio'].append(dict(zip(CardioSession._fields, values)))
+
+        for workout_id, seq, _ in rows:
+            details = workouts.get(workout_id)
+            if details is None:
+                yield {'seq': seq, 'op': 'delete', 'workout': {'id': workout_id}}
+            else:
+                yield {'seq': seq, 'op': 'upsert', **details}
+
+
+def export_delta(output_dir, since=None, chunk_size=CHUNK_SIZE, compression=None):
+    """
+    Write the workouts changed since the last backup to a new delta file.
+
+    Reads one snapshot of the database, so the delta and its watermark are
+    consistent even if workouts are saved meanwhile. Nothing is written if
+    nothing changed.
+
+    Args:
+        output_dir: Backup directory (created if needed)
+        since: Watermark to export from (default: get_watermark(output_dir))
+        chunk_size: Number of changed workouts read at a time
+        compression: None or one of export.COMPRESSIONS
+
+    Returns:
+        Dictionary with the number of workouts written and deleted, the
+        previous and new watermark, and the delta file (None if no changes)
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    if since is None:
+        since = get_watermark(output_path)
+
+    suffix = COMPRESSIONS[compression] if compression else ''
+    partial = output_path / f".delta_{since:0{_SEQ_WIDTH}d}.jsonl{suffix}.partial"
+    upserts = deletes = 0
+    watermark = since
+
+    try:
+        with connection() as conn:
+            conn.execute("BEGIN")
+            with open_csv(partial, 'w', compression) as f:
+                for record in _changed_workouts(conn, since, chunk_size):
+                    f.write(_dumps(record))
+                    f.write('\n')
+                    watermark = record['seq']
+                    if record['op'] == 'delete':
+                        deletes += 1
+                    else:
+                        upserts += 1
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+    delta_file = None
+    if watermark == since:
+        partial.unlink()
+    else:
+        delta_file = output_path / (
+            f"delta_{since:0{_SEQ_WIDTH}d}_{watermark:0{_SEQ_WIDTH}d}.jsonl{suffix}"
+        )
+        os.replace(partial, delta_file)
+
+    return {
+        'workouts': upserts,
+        'deleted': deletes,
+        'since': since,
+        'watermark': watermark,
+        'delta_file': str(delta_file) if delta_file else None
+    }
+
+
+def _read_lines(path):
+    """Yield (workout ID, record, line) for each line of a delta or snapshot."""
+    with open_csv(path, 'r', compression_for(path)) as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield record['workout']['id'], record, line.rstrip('\n')
+
+
+def compact(directory, compression=None):
+    """
+    Merge a backup directory's deltas into one snapshot file.
+
+    The latest record of each workout wins and deleted workouts are dropped.
+    The old snapshot is streamed through line by line, so only the records
+    in the deltas are held in memory. The merged deltas and the old
+    snapshot are removed once the new snapshot is in place.
+
+    Args:
+        directory: Backup directory written by export_delta()
+        compression: None or one of export.COMPRESSIONS for the snapshot
+
+    Returns:
+        Dictionary with the number of workouts in the snapshot, the number
+        of deltas merged, the watermark and the snapshot file (None if the
+        directory has no backups)
+
+    Raises:
+        ValueError: If a delta is missing between the snapshot and the
+            newest delta
+    """
+    directory = Path(directory)
+    snapshot, deltas = _scan(directory)
+    watermark = snapshot[0] if snapshot else 0
+
+    # Latest line per workout from the deltas; None marks a deletion
+    changed = {}
+    merged = []
+    for since, delta_watermark, path in deltas:
+        if delta_watermark <= watermark:
+            merged.append(path)  # Already in the snapshot
+            continue
+        if since > watermark:
+            raise ValueError(
+                f"Missing delta between change {watermark} and {since} in {directory}"
+            )
+        for workout_id, record, line in _read_lines(path):
+            changed[workout_id] = None if record['op'] == 'delete' else line
+        watermark = delta_watermark
+        merged.append(path)
+
+    if snapshot is None and not merged:
+        return {'workouts': 0, 'deltas': 0, 'watermark': 0, 'snapshot_file': None}
+    if snapshot and snapshot[0] == watermark:
+        for path in merged:
+            path.unlink()
+        return {
+            'workouts': sum(1 for _ in _read_lines(snapshot[1])),
+            'deltas': len(merged),
+            'watermark': watermark,
+            'snapshot_file': str(snapshot[1])
+        }
+
+    suffix = COMPRESSIONS[compression] if compression else ''
+    snapshot_file = directory / f"snapshot_{watermark:0{_SEQ_WIDTH}d}.jsonl{suffix}"
+    partial = directory / f".{snapshot_file.name}.partial"
+
+    # Both inputs are in workout ID order; merge them into the new snapshot
+    pending = sorted(changed.items())
+    count = 0
+    try:
+        with open_csv(partial, 'w', compression) as out:
+            def write(line):
+                nonlocal count
+                if line is not None:
+                    out.write(line)
+                    out.write('\n')
+                    count += 1
+
+            i = 0
+            if snapshot:
+                for workout_id, _, line in _read_lines(snapshot[1]):
+                    while i < len(pending) and pending[i][0] < workout_id:
+                        write(pending[i][1])
+                        i += 1
+                    if i < len(pending) and pending[i][0] == workout_id:
+                        write(pending[i][1])
+                        i += 1
+                    else:
+                        write(line)
+            for _, line in pending[i:]:
+                write(line)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+    os.replace(partial, snapshot_file)
+    for path in merged:
+        path.unlink()
+    if snapshot and snapshot[1] != snapshot_file:
+        snapshot[1].unlink()
+
+    return {
+        'workouts': count,
+        'deltas': len(merged),
+        'watermark': watermark,
+        'snapshot_file': str(snapshot_file)
+    }
+
+
+COMMANDS = {
+    'export': export_delta,
+    'compact': compact,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Workout Tracker incremental backups")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    parser.add_argument("directory", help="Backup directory")
+    parser.add_argument("--compression", choices=sorted(COMPRESSIONS),
+                        help="Compress new files with this codec")
+    args = parser.parse_args(argv)
+
+    create_tables()
+    result = COMMANDS[args.command](args.directory, compression=args.compression)
+    print(f"{args.command}: {result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+# workout_tracker/services/e1rm.py
+
+"""
+Estimated one-rep max (e1RM) formulas.
+
+set_columns(), estimate_1rm() and reduce_by_day() work on whole columns of
+sets at once with NumPy. NumPy is imported on first use, so the rest of the services
+run without it; estimate_one() computes the same values for a single set
+in plain Python.
+"""
+
+import functools
+import math
+
+# Fraction of 1RM that can be lifted for 1-12 reps to failure (RPE 10), from
+# the RTS RPE chart. Each RPE point below 10 counts as one rep in reserve, so
+# a set of 5 at RPE 8 is read as 7 reps to failure; half points interpolate.
+_RPE_REPS = tuple(range(1, 13))
+_RPE_PERCENT = (
+    1.000, 0.955, 0.922, 0.892, 0.863, 0.837,
+    0.811, 0.786, 0.762, 0.739, 0.707, 0.680,
+)
+
+
+def _epley(weight, reps):
+    return weight * (1 + reps / 30)
+
+
+def _brzycki(weight, reps):
+    return weight * 36 / (37 - reps)
+
+
+def _lombardi(weight, reps):
+    return weight * reps ** 0.10
+
+
+def _oconner(weight, reps):
+    return weight * (1 + reps / 40)
+
+
+# Rep-based formulas; they work on scalars and NumPy arrays alike
+_REP_FORMULAS = {
+    'epley': _epley,
+    'brzycki': _brzycki,
+    'lombardi': _lombardi,
+    'oconner': _oconner,
+}
+
+FORMULAS = tuple(_REP_FORMULAS) + ('rpe',)
+
+REDUCTIONS = ('max', 'mean', 'min')
+
+
+@functools.cache
+def _numpy():
+    """Return the numpy module, or None when it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def numpy_available():
+    """Return True if the vectorized functions can be used."""
+    return _numpy() is not None
+
+
+def _require_numpy():
+    np = _numpy()
+    if np is None:
+        raise ImportError("NumPy is required for vectorized e1RM calculations")
+    return np
+
+
+def _check_formula(formula):
+    if formula not in FORMULAS:
+        raise ValueError(f"Unknown e1RM formula {formula!r}, expected one of {', '.join(FORMULAS)}")
+
+
+def _rpe_percent(reps_to_failure):
+    """Interpolate the RPE chart, clamped to 1-12 reps to failure."""
+    x = min(max(reps_to_failure, _RPE_REPS[0]), _RPE_REPS[-1])
+    i = min(int(x), _RPE_REPS[-1] - 1)
+    lo, hi = _RPE_PERCENT[i - 1], _RPE_PERCENT[i]
+    return lo + (hi - lo) * (x - i)
+
+
+def set_columns(rows):
+    """
+    Read set rows into NumPy columns without building per-column lists.
+
+    Args:
+        rows: Iterable of (group, day, weight, reps, rpe) tuples, e.g. a
+            cursor; no value may be NULL (select COALESCE(rpe, 10))
+
+    Returns:
+        Structured array with fields group, day, weight, reps and rpe
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    np = _require_numpy()
+    dtype = [('group', 'i8'), ('day', 'i8'), ('weight', 'f8'), ('reps', 'f8'), ('rpe', 'f8')]
+    return np.fromiter(rows, dtype=dtype)
+
+
+def estimate_one(weight, reps, rpe=None, formula='epley'):
+    """
+    Estimate the 1RM of a single set.
+
+    Args:
+        weight: Weight lifted
+        reps: Number of reps performed
+        rpe: RPE of the set, used by the 'rpe' formula (None means RPE 10)
+        formula: One of FORMULAS
+
+    Returns:
+        Estimated 1RM, or NaN where the formula is undefined (Brzycki from
+        37 reps on)
+
+    Raises:
+        ValueError: If the formula is unknown
+    """
+    _check_formula(formula)
+
+    if formula == 'rpe':
+        in_reserve = 0 if rpe is None else 10 - rpe
+        return weight / _rpe_percent(reps + in_reserve)
+    # A single rep is the 1RM itself
+    if reps == 1:
+        return weight
+    if formula == 'brzycki' and reps >= 37:
+        return math.nan
+    return _REP_FORMULAS[formula](weight, reps)
+
+
+def estimate_1rm(weights, reps, rpe=None, formula='epley'):
+    """
+    Estimate the 1RM of many sets at once.
+
+    Gives the same values as estimate_one() for each set.
+
+    Args:
+        weights: Sequence or array of weights
+        reps: Sequence or array of reps, same length
+        rpe: Optional sequence or array of RPEs for the 'rpe' formula; None
+            entries (or no RPEs at all) mean RPE 10
+        formula: One of FORMULAS
+
+    Returns:
+        NumPy float array of estimates
+
+    Raises:
+        ValueError: If the formula is unknown
+        ImportError: If NumPy is not installed
+    """
+    _check_formula(formula)
+    np = _require_numpy()
+
+    weights = np.asarray(weights, dtype=float)
+    reps = np.asarray(reps, dtype=float)
+
+    if formula == 'rpe':
+        in_reserve = 0.0
+        if rpe is not None:
+            # None becomes NaN in a float array
+            in_reserve = np.nan_to_num(10 - np.asarray(rpe, dtype=float), nan=0.0)
+        return weights / np.interp(reps + in_reserve, _RPE_REPS, _RPE_PERCENT)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        estimates = _REP_FORMULAS[formula](weights, reps)
+    if formula == 'brzycki':
+        estimates = np.where(reps >= 37, np.nan, estimates)
+    return np.where(reps == 1, weights, estimates)
+
+
+def reduce_by_day(groups, days, values, how='max'):
+    """
+    Reduce per-set values to one value per group and day, in one pass.
+
+    Sets with a NaN value are left out.
+
+    Args:
+        groups: Integer array of group keys (e.g. exercise IDs)
+        days: Integer array of day numbers
+        values: Float array of values (e.g. e1RM estimates)
+        how: One of REDUCTIONS
+
+    Returns:
+        Tuple of arrays (groups, days, values, counts), sorted by group then
+        day; `counts` is the number of sets in each group and day
+
+    Raises:
+        ValueError: If the reduction is unknown
+        ImportError: If NumPy is not installed
+    """
+    if how not in REDUCTIONS:
+        raise ValueError(f"Unknown reduction {how!r}, expected one of {', '.join(REDUCTIONS)}")
+    np = _require_numpy()
+
+    values = np.asarray(values, dtype=float)
+    keep = ~np.isnan(values)
+    groups = np.asarray(groups, dtype=np.int64)[keep]
+    days = np.asarray(days, dtype=np.int64)[keep]
+    values = values[keep]
+    if values.size == 0:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, values, empty
+
+    # One sort on a combined (group, day) key, then one reduce per run
+    key = (groups << 32) | (days - days.min())
+    order = np.argsort(key, kind='stable')
+    key = key[order]
+    starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+    counts = np.diff(np.r_[starts, len(key)])
+
+    ufunc = {'max': np.maximum, 'min': np.minimum, 'mean': np.add}[how]
+    reduced = ufunc.reduceat(values[order], starts)
+    if how == 'mean':
+        reduced = reduced / counts
+
+    first = order[starts]
+    return groups[first], days[first], reduced, counts
@@ -0,0 +1,95 @@
+# workout_tracker/services/events.py
+
+"""
+Change notifications from the service layer to the views.
+
+Services publish an event after each committed change; views subscribe to
+the event types they care about and update only what the event touches
+instead of reloading everything. Callbacks run synchronously on the thread
+that made the change (the Tk main loop for changes made from the UI).
+"""
+
+import threading
+import traceback
+from collections import namedtuple
+
+# Event types
+WORKOUT_SAVED = "workout_saved"        # New workouts, or sets/cardio added to them
+WORKOUT_DELETED = "workout_deleted"    # Workouts deleted with their sets and cardio
+EXERCISE_ADDED = "exercise_added"      # Exercise names logged for the first time
+
+EVENT_TYPES = (WORKOUT_SAVED, WORKOUT_DELETED, EXERCISE_ADDED)
+
+# type: one of EVENT_TYPES
+# workout_ids: tuple of affected workout IDs
+# dates: sorted tuple of the distinct YYYY-MM-DD dates of those workouts
+# exercises: sorted tuple of the affected exercise names
+Event = namedtuple("Event", ["type", "workout_ids", "dates", "exercises"])
+
+_subscribers = {event_type: [] for event_type in EVENT_TYPES}
+_lock = threading.Lock()
+
+
+def _check_type(event_type):
+    """Raise ValueError for an unknown event type."""
+    if event_type not in _subscribers:
+        raise ValueError(f"Unknown event type {event_type!r}")
+
+
+def subscribe(event_type, callback):
+    """
+    Call `callback(event)` every time an event of this type is published.
+
+    Args:
+        event_type: One of EVENT_TYPES
+        callback: Function taking an Event
+
+    Returns:
+        The callback, so it can be passed to unsubscribe() later
+
+    Raises:
+        ValueError: If the event type is unknown
+    """
+    _check_type(event_type)
+    with _lock:
+        _subscribers[event_type].append(callback)
+    return callback
+
+
+def unsubscribe(event_type, callback):
+    """Stop calling a callback registered with subscribe(); unknown ones are ignored."""
+    _check_type(event_type)
+    with _lock:
+        if callback in _subscribers[event_type]:
+            _subscribers[event_type].remove(callback)
+
+
+def publish(event_type, workout_ids=(), dates=(), exercises=()):
+    """
+    Notify the subscribers of an event type.
+
+    A failing callback is reported and does not stop the others, and never
+    fails the change that was already committed.
+
+    Returns:
+        The published Event
+    """
+    _check_type(event_type)
+    event = Event(
+        event_type,
+        tuple(workout_ids),
+        tuple(sorted(set(dates))),
+        tuple(sorted(set(exercises)))
+    )
+
+    with _lock:
+        callbacks = list(_subscribers[event_type])
+
+    for callback in callbacks:
+        try:
+            callback(event)
+        except Exception:
+            print(f"Error in {event_type} subscriber {callback!r}:")
+            traceback.print_exc()
+
+    return event
@@ -1,390 +1,552 @@
-# workout_tracker/export.py
-
-import csv
-from pathlib import Path
-from datetime import datetime
-from .db import get_connection
-
-
-def export_workouts_to_csv(output_path):
-    """
-    Export all workouts to a CSV file.
-
-    Args:
-        output_path: Path to the output CSV file
-
-    Returns:
-        Number of workouts exported
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    # Get all workouts with summary data
-    cur.execute(
-        """
-        SELECT
-            w.id,
-            w.date,
-            w.workout_type,
-            w.notes,
-            COUNT(DISTINCT s.id) as total_sets,
-            SUM(s.reps * s.weight) as total_volume,
-            COALESCE(SUM(c.minutes), 0) as cardio_minutes
-        FROM workouts w
-        LEFT JOIN sets s ON w.id = s.workout_id
-        LEFT JOIN cardio_sessions c ON w.id = c.workout_id
-        GROUP BY w.id
-        ORDER BY w.date DESC
-        """
-    )
-
-    workouts = cur.fetchall()
-    conn.close()
-
-    # Write to CSV
-    with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.writer(csvfile)
-
-        # Write header
-        writer.writerow([
-            'Workout ID',
-            'Date',
-            'Workout Type',
-            'Total Sets',
-            'Total Volume (lbs)',
-            'Cardio Minutes',
-            'Notes'
-        ])
-
-        # Write data
-        for workout in workouts:
-            writer.writerow([
-                workout['id'],
-                workout['date'],
-                workout['workout_type'],
-                workout['total_sets'] or 0,
-                f"{workout['total_volume']:.2f}" if workout['total_volume'] else "0.00",
-                workout['cardio_minutes'] or 0,
-                workout['notes'] or ''
-            ])
-
-    return len(workouts)
-
-
-def export_sets_to_csv(output_path):
-    """
-    Export all sets to a CSV file.
-
-    Args:
-        output_path: Path to the output CSV file
-
-    Returns:
-        Number of sets exported
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    # Get all sets with workout info
-    cur.execute(
-        """
-        SELECT
-            s.id,
-            w.date,
-            w.workout_type,
-            s.exercise_name,
-            s.set_number,
-            s.reps,
-            s.weight,
-            s.rpe,
-            w.id as workout_id
-        FROM sets s
-        JOIN workouts w ON s.workout_id = w.id
-        ORDER BY w.date DESC, s.id ASC
-        """
-    )
-
-    sets = cur.fetchall()
-    conn.close()
-
-    # Write to CSV
-    with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.writer(csvfile)
-
-        # Write header
-        writer.writerow([
-            'Set ID',
-            'Workout ID',
-            'Date',
-            'Workout Type',
-            'Exercise',
-            'Set Number',
-            'Reps',
-            'Weight (lbs)',
-            'RPE'
-        ])
-
-        # Write data
-        for set_row in sets:
-            writer.writerow([
-                set_row['id'],
-                set_row['workout_id'],
-                set_row['date'],
-                set_row['workout_type'],
-                set_row['exercise_name'],
-                set_row['set_number'],
-                set_row['reps'],
-                set_row['weight'],
-                set_row['rpe'] if set_row['rpe'] else ''
-            ])
-
-    return len(sets)
-
-
-def export_cardio_to_csv(output_path):
-    """
-    Export all cardio sessions to a CSV file.
-
-    Args:
-        output_path: Path to the output CSV file
-
-    Returns:
-        Number of cardio sessions exported
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    # Get all cardio sessions with workout info
-    cur.execute(
-        """
-        SELECT
-            c.id,
-            w.date,
-            w.workout_type,
-            c.cardio_type,
-            c.minutes,
-            w.id as workout_id
-        FROM cardio_sessions c
-        JOIN workouts w ON c.workout_id = w.id
-        ORDER BY w.date DESC
-        """
-    )
-
-    cardio_sessions = cur.fetchall()
-    conn.close()
-
-    # Write to CSV
-    with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.writer(csvfile)
-
-        # Write header
-        writer.writerow([
-            'Cardio ID',
-            'Workout ID',
-            'Date',
-            'Workout Type',
-            'Cardio Type',
-            'Minutes'
-        ])
-
-        # Write data
-        for cardio in cardio_sessions:
-            writer.writerow([
-                cardio['id'],
-                cardio['workout_id'],
-                cardio['date'],
-                cardio['workout_type'],
-                cardio['cardio_type'] or 'General',
-                cardio['minutes']
-            ])
-
-    return len(cardio_sessions)
-
-
-def export_all_data(output_dir):
-    """
-    Export all workout data to separate CSV files in the specified directory.
-
-    Args:
-        output_dir: Directory path where CSV files will be saved
-
-    Returns:
-        Dictionary with counts of exported records
-    """
-    # Ensure output directory exists
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    # Generate timestamped filenames
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-    workouts_file = output_path / f"workouts_{timestamp}.csv"
-    sets_file = output_path / f"sets_{timestamp}.csv"
-    cardio_file = output_path / f"cardio_{timestamp}.csv"
-
-    # Export each dataset
-    workouts_count = export_workouts_to_csv(workouts_file)
-    sets_count = export_sets_to_csv(sets_file)
-    cardio_count = export_cardio_to_csv(cardio_file)
-
-    return {
-        'workouts': workouts_count,
-        'sets': sets_count,
-        'cardio': cardio_count,
-        'workouts_file': str(workouts_file),
-        'sets_file': str(sets_file),
-        'cardio_file': str(cardio_file)
-    }
-
-
-def export_exercise_data(exercise_name, output_path):
-    """
-    Export all sets for a specific exercise to CSV.
-
-    Args:
-        exercise_name: Name of the exercise
-        output_path: Path to the output CSV file
-
-    Returns:
-        Number of sets exported
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    # Get all sets for the exercise
-    cur.execute(
-        """
-        SELECT
-            s.id,
-            w.date,
-            w.workout_type,
-            s.exercise_name,
-            s.set_number,
-            s.reps,
-            s.weight,
-            s.rpe,
-            w.notes
-        FROM sets s
-        JOIN workouts w ON s.workout_id = w.id
-        WHERE s.exercise_name = ?
-        ORDER BY w.date ASC
-        """,
-        (exercise_name,)
-    )
-
-    sets = cur.fetchall()
-    conn.close()
-
-    # Write to CSV
-    with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.writer(csvfile)
-
-        # Write header
-        writer.writerow([
-            'Set ID',
-            'Date',
-            'Workout Type',
-            'Exercise',
-            'Set Number',
-            'Reps',
-            'Weight (lbs)',
-            'RPE',
-            'Workout Notes'
-        ])
-
-        # Write data
-        for set_row in sets:
-            writer.writerow([
-                set_row['id'],
-                set_row['date'],
-                set_row['workout_type'],
-                set_row['exercise_name'],
-                set_row['set_number'],
-                set_row['reps'],
-                set_row['weight'],
-                set_row['rpe'] if set_row['rpe'] else '',
-                set_row['notes'] or ''
-            ])
-
-    return len(sets)
-
-
-def export_date_range(start_date, end_date, output_dir):
-    """
-    Export workouts within a date range to CSV files.
-
-    Args:
-        start_date: Start date (YYYY-MM-DD)
-        end_date: End date (YYYY-MM-DD)
-        output_dir: Directory path where CSV files will be saved
-
-    Returns:
-        Dictionary with counts of exported records
-    """
-    # Ensure output directory exists
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    # Generate filenames
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    workouts_file = output_path / f"workouts_{start_date}_to_{end_date}_{timestamp}.csv"
-
-    conn = get_connection()
-    cur = conn.cursor()
-
-    # Get workouts in date range
-    cur.execute(
-        """
-        SELECT
-            w.id,
-            w.date,
-            w.workout_type,
-            w.notes,
-            COUNT(DISTINCT s.id) as total_sets,
-            SUM(s.reps * s.weight) as total_volume,
-            COALESCE(SUM(c.minutes), 0) as cardio_minutes
-        FROM workouts w
-        LEFT JOIN sets s ON w.id = s.workout_id
-        LEFT JOIN cardio_sessions c ON w.id = c.workout_id
-        WHERE w.date BETWEEN ? AND ?
-        GROUP BY w.id
-        ORDER BY w.date DESC
-        """,
-        (start_date, end_date)
-    )
-
-    workouts = cur.fetchall()
-    conn.close()
-
-    # Write to CSV
-    with open(workouts_file, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.writer(csvfile)
-
-        # Write header
-        writer.writerow([
-            'Workout ID',
-            'Date',
-            'Workout Type',
-            'Total Sets',
-            'Total Volume (lbs)',
-            'Cardio Minutes',
-            'Notes'
-        ])
-
-        # Write data
-        for workout in workouts:
-            writer.writerow([
-                workout['id'],
-                workout['date'],
-                workout['workout_type'],
-                workout['total_sets'] or 0,
-                f"{workout['total_volume']:.2f}" if workout['total_volume'] else "0.00",
-                workout['cardio_minutes'] or 0,
-                workout['notes'] or ''
-            ])
-
-    return {
-        'workouts': len(workouts),
-        'workouts_file': str(workouts_file),
-        'start_date': start_date,
-        'end_date': end_date
-    }
+# workout_tracker/export.py
+
+import csv
+import functools
+import gzip
+import hashlib
+import json
+import lzma
+from pathlib import Path
+from datetime import datetime
+from . import columnar
+from .db import connection
+from .services.workout_service import workout_summary_query
+
+# Number of rows fetched from the cursor at a time while writing a file
+CHUNK_SIZE = 1000
+
+# Format of the manifest written by export_all_data()
+MANIFEST_VERSION = 1
+
+# File extension of each export format; see columnar.py for the typed ones
+FORMATS = {'csv': '.csv', **columnar.FORMATS}
+
+# Suffix added to CSV file names by each compression codec. Parquet and
+# Arrow files are compressed inside the file instead (see columnar.CODECS).
+COMPRESSIONS = {
+    'gzip': '.gz',
+    'xz': '.xz',
+    'zstd': '.zst',
+}
+
+# Compression level used by each codec. xz is kept at a low preset: at its
+# default of 6 it compresses a few times slower than the CSV is written.
+COMPRESSION_LEVELS = {
+    'gzip': 6,
+    'xz': 1,
+    'zstd': 3,
+}
+
+WORKOUT_HEADER = [
+    'Workout ID',
+    'Date',
+    'Workout Type',
+    'Total Sets',
+    'Total Volume (lbs)',
+    'Cardio Minutes',
+    'Notes'
+]
+
+SETS_HEADER = [
+    'Set ID',
+    'Workout ID',
+    'Date',
+    'Workout Type',
+    'Exercise',
+    'Set Number',
+    'Reps',
+    'Weight (lbs)',
+    'RPE'
+]
+
+# All sets with workout info, in SETS_HEADER column order. An RPE of 0 is
+# written as an empty field, like a missing one. CROSS JOIN keeps
+# workouts as the outer loop: they are walked in date order on
+# idx_workouts_date and each one's sets are found on idx_sets_workout, so
+# only the sets of one date are sorted by id at a time, never the whole table.
+_SETS_EXPORT_SQL = """
+    SELECT
+        s.id,
+        w.id as workout_id,
+        w.date,
+        w.workout_type,
+        e.name as exercise_name,
+        s.set_number,
+        s.reps,
+        s.weight,
+        NULLIF(s.rpe, 0) as rpe
+    FROM workouts w
+    CROSS JOIN sets s ON s.workout_id = w.id
+    JOIN exercises e ON s.exercise_id = e.id
+    ORDER BY w.date DESC, s.id ASC
+"""
+
+CARDIO_HEADER = [
+    'Cardio ID',
+    'Workout ID',
+    'Date',
+    'Workout Type',
+    'Cardio Type',
+    'Minutes'
+]
+
+# All cardio sessions with workout info, in CARDIO_HEADER column order. A
+# missing or empty cardio type is written as 'General'.
+_CARDIO_EXPORT_SQL = """
+    SELECT
+        c.id,
+        w.id as workout_id,
+        w.date,
+        w.workout_type,
+        COALESCE(NULLIF(c.cardio_type, ''), 'General') as cardio_type,
+        c.minutes
+    FROM cardio_sessions c
+    JOIN workouts w ON c.workout_id = w.id
+    ORDER BY w.date DESC
+"""
+
+
+@functools.cache
+def _zstd():
+    """Return a zstd module with an open() function, or None when there is none."""
+    try:
+        from compression import zstd  # Python 3.14+
+    except ImportError:
+        try:
+            import zstandard as zstd
+        except ImportError:
+            return None
+    return zstd
+
+
+def compression_for(path):
+    """Return the compression codec implied by a file name's suffix, or None."""
+    suffix = Path(path).suffix
+    for codec, extension in COMPRESSIONS.items():
+        if suffix == extension:
+            return codec
+    return None
+
+
+def open_csv(path, mode='r', compression=None):
+    """
+    Open a CSV file in text mode, through a streaming compressor if asked.
+
+    Data is compressed or decompressed as it is written or read; no
+    temporary file is used.
+
+    Args:
+        path: Path to the file
+        mode: 'r' or 'w'
+        compression: None or one of COMPRESSIONS
+
+    Raises:
+        ValueError: If the codec is unknown
+        ImportError: If zstd is requested and neither compression.zstd
+            (Python 3.14+) nor the zstandard package is available
+    """
+    if compression is None:
+        return open(path, mode, newline='', encoding='utf-8')
+
+    mode += 't'
+    level = COMPRESSION_LEVELS.get(compression)
+    writing = mode.startswith('w')
+    if compression == 'gzip':
+        return gzip.open(path, mode, compresslevel=level, newline='', encoding='utf-8')
+    if compression == 'xz':
+        preset = level if writing else None
+        return lzma.open(path, mode, preset=preset, newline='', encoding='utf-8')
+    if compression == 'zstd':
+        zstd = _zstd()
+        if zstd is None:
+            raise ImportError("zstd compression needs Python 3.14+ or the zstandard package")
+        if zstd.__name__ == 'zstandard':
+            cctx = zstd.ZstdCompressor(level=level) if writing else None
+            return zstd.open(path, mode, cctx=cctx, newline='', encoding='utf-8')
+        return zstd.open(path, mode, level=level if writing else None, newline='', encoding='utf-8')
+    raise ValueError(f"Unknown compression {compression!r}, expected one of {', '.join(COMPRESSIONS)}")
+
+
+def _iter_chunks(cur, chunk_size=CHUNK_SIZE):
+    """
+    Yield the rows of an executed query as lists of up to `chunk_size` rows.
+
+    Only one chunk is held in memory, however many rows the query returns.
+    """
+    while True:
+        rows = cur.fetchmany(chunk_size)
+        if not rows:
+            break
+        yield rows
+
+
+def _write_csv(output_path, header, chunks, compression=None):
+    """
+    Write a header and a stream of row chunks to a CSV file.
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    with open_csv(output_path, 'w', compression) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(header)
+        for rows in chunks:
+            writer.writerows(rows)
+            count += len(rows)
+    return count
+
+
+def _workout_chunks(chunks):
+    """Format chunks of workout_summary_query() rows as workouts CSV rows."""
+    for rows in chunks:
+        yield [
+            (
+                workout_id,
+                date,
+                workout_type,
+                total_sets or 0,
+                f"{total_volume:.2f}" if total_volume else "0.00",
+                cardio_minutes or 0,
+                notes or ''
+            )
+            for workout_id, date, workout_type, notes, total_sets, total_volume, cardio_minutes in rows
+        ]
+
+
+def _check_format(format, compression=None):
+    if format not in FORMATS:
+        raise ValueError(f"Unknown export format {format!r}, expected one of {', '.join(FORMATS)}")
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression {compression!r}, expected one of {', '.join(COMPRESSIONS)}")
+    # Fail before any file is created
+    if format != 'csv':
+        if not columnar.pyarrow_available():
+            raise ImportError(f"pyarrow is required for {format} exports")
+        columnar.check_compression(format, compression)
+    elif compression == 'zstd' and _zstd() is None:
+        raise ImportError("zstd compression needs Python 3.14+ or the zstandard package")
+
+
+def _chunk_size(format, chunk_size):
+    """Default chunk size: small for CSV, one full record batch for the columnar formats."""
+    if chunk_size is not None:
+        return chunk_size
+    return CHUNK_SIZE if format == 'csv' else columnar.BATCH_SIZE
+
+
+def _write_workouts(conn, output_path, chunk_size, format='csv', compression=None,
+                    query=None, params=()):
+    """Stream a workout summary query (all workouts by default) to a file."""
+    if query is None:
+        query, params = workout_summary_query()
+    cur = conn.cursor()
+    cur.row_factory = None  # plain tuples, unpacked by _workout_chunks()
+    cur.execute(query, params)
+    chunks = _iter_chunks(cur, chunk_size)
+    if format == 'csv':
+        return _write_csv(output_path, WORKOUT_HEADER, _workout_chunks(chunks), compression)
+    return columnar.write_batches(output_path, 'workouts', chunks, format, compression)
+
+
+def _write_sets(conn, output_path, chunk_size, format='csv', compression=None):
+    """Stream all sets to a file."""
+    cur = conn.cursor()
+    cur.row_factory = None  # plain tuples, written as they are
+    cur.execute(_SETS_EXPORT_SQL)
+    chunks = _iter_chunks(cur, chunk_size)
+    if format == 'csv':
+        return _write_csv(output_path, SETS_HEADER, chunks, compression)
+    return columnar.write_batches(output_path, 'sets', chunks, format, compression)
+
+
+def _write_cardio(conn, output_path, chunk_size, format='csv', compression=None):
+    """Stream all cardio sessions to a file."""
+    cur = conn.cursor()
+    cur.row_factory = None
+    cur.execute(_CARDIO_EXPORT_SQL)
+    chunks = _iter_chunks(cur, chunk_size)
+    if format == 'csv':
+        return _write_csv(output_path, CARDIO_HEADER, chunks, compression)
+    return columnar.write_batches(output_path, 'cardio', chunks, format, compression)
+
+
+def _file_checksum(path):
+    """Return the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def export_workouts_to_csv(output_path, chunk_size=CHUNK_SIZE, compression=None):
+    """
+    Export all workouts to a CSV file.
+
+    Rows are streamed from the database to the file, so memory use does not
+    grow with the number of workouts.
+
+    Args:
+        output_path: Path to the output CSV file
+        chunk_size: Number of rows fetched at a time
+        compression: None or one of COMPRESSIONS; the path is used as given
+
+    Returns:
+        Number of workouts exported
+
+    Raises:
+        ValueError: If the compression is unknown
+    """
+    _check_format('csv', compression)
+    with connection() as conn:
+        return _write_workouts(conn, output_path, chunk_size, compression=compression)
+
+
+def export_sets_to_csv(output_path, chunk_size=CHUNK_SIZE, compression=None):
+    """
+    Export all sets to a CSV file.
+
+    Rows are streamed from the database to the file, so memory use does not
+    grow with the number of sets.
+
+    Args:
+        output_path: Path to the output CSV file
+        chunk_size: Number of rows fetched at a time
+        compression: None or one of COMPRESSIONS; the path is used as given
+
+    Returns:
+        Number of sets exported
+
+    Raises:
+        ValueError: If the compression is unknown
+    """
+    _check_format('csv', compression)
+    with connection() as conn:
+        return _write_sets(conn, output_path, chunk_size, compression=compression)
+
+
+def export_cardio_to_csv(output_path, chunk_size=CHUNK_SIZE, compression=None):
+    """
+    Export all cardio sessions to a CSV file.
+
+    Rows are streamed from the database to the file, so memory use does not
+    grow with the number of sessions.
+
+    Args:
+        output_path: Path to the output CSV file
+        chunk_size: Number of rows fetched at a time
+        compression: None or one of COMPRESSIONS; the path is used as given
+
+    Returns:
+        Number of cardio sessions exported
+
+    Raises:
+        ValueError: If the compression is unknown
+    """
+    _check_format('csv', compression)
+    with connection() as conn:
+        return _write_cardio(conn, output_path, chunk_size, compression=compression)
+
+
+def export_all_data(output_dir, chunk_size=None, format='csv', compression=None):
+    """
+    Export all workout data to separate files in the specified directory.
+
+    The three files are written one after another in one read transaction,
+    so they always come from the same database state even if a workout is
+    saved during the export. A JSON manifest with the row count and SHA-256
+    checksum of each file is written last.
+
+    Args:
+        output_dir: Directory path where the files will be saved
+        chunk_size: Number of rows fetched at a time (default CHUNK_SIZE
+            for CSV, columnar.BATCH_SIZE for Parquet and Arrow)
+        format: One of FORMATS; 'parquet' and 'arrow' write typed columnar
+            files (see columnar.py) and need pyarrow
+        compression: None or one of COMPRESSIONS. CSV files are streamed
+            through the compressor and get its suffix (sets_....csv.gz);
+            Parquet and Arrow files use the codec internally.
+
+    Returns:
+        Dictionary with counts of exported records
+
+    Raises:
+        ValueError: If the format or compression is unknown, or the format
+            does not support the codec
+        ImportError: If a columnar format is requested without pyarrow, or
+            zstd without a zstd module
+    """
+    _check_format(format, compression)
+    chunk_size = _chunk_size(format, chunk_size)
+    extension = FORMATS[format]
+    if format == 'csv' and compression is not None:
+        extension += COMPRESSIONS[compression]
+
+    # Ensure output directory exists
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    # Generate timestamped filenames
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+
+    files = {
+        'workouts': (output_path / f"workouts_{timestamp}{extension}", _write_workouts),
+        'sets': (output_path / f"sets_{timestamp}{extension}", _write_sets),
+        'cardio': (output_path / f"cardio_{timestamp}{extension}", _write_cardio),
+    }
+    manifest_file = output_path / f"manifest_{timestamp}.json"
+
+    results = {}
+    with connection() as conn:
+        # Every query below reads the snapshot taken by this transaction
+        conn.execute("BEGIN")
+        schema_version = conn.execute("PRAGMA user_version").fetchone()[0]
+        for name, (path, write) in files.items():
+            count = write(conn, path, chunk_size, format, compression)
+            results[name] = (count, _file_checksum(path))
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'created': now.isoformat(timespec='seconds'),
+        'schema_version': schema_version,
+        'format': format,
+        'compression': compression,
+        'files': {
+            name: {
+                'file': path.name,
+                'rows': results[name][0],
+                'sha256': results[name][1],
+            }
+            for name, (path, _) in files.items()
+        }
+    }
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    return {
+        'workouts': results['workouts'][0],
+        'sets': results['sets'][0],
+        'cardio': results['cardio'][0],
+        'workouts_file': str(files['workouts'][0]),
+        'sets_file': str(files['sets'][0]),
+        'cardio_file': str(files['cardio'][0]),
+        'manifest_file': str(manifest_file)
+    }
+
+
+def export_exercise_data(exercise_name, output_path, chunk_size=None, format='csv',
+                         compression=None):
+    """
+    Export all sets for a specific exercise to CSV, Parquet or Arrow.
+
+    Rows are streamed from the database to the file, so memory use does not
+    grow with the number of sets.
+
+    Args:
+        exercise_name: Name of the exercise
+        output_path: Path to the output file
+        chunk_size: Number of rows fetched at a time (default depends on
+            the format, see export_all_data())
+        format: One of FORMATS
+        compression: None or one of COMPRESSIONS (see export_all_data());
+            the path is used as given
+
+    Returns:
+        Number of sets exported
+
+    Raises:
+        ValueError: If the format or compression is unknown
+        ImportError: If a columnar format is requested without pyarrow
+    """
+    _check_format(format, compression)
+    chunk_size = _chunk_size(format, chunk_size)
+
+    with connection() as conn:
+        cur = conn.cursor()
+        cur.row_factory = None
+
+        # Get all sets for the exercise, in export column order
+        cur.execute(
+            """
+            SELECT
+                s.id,
+                w.date,
+                w.workout_type,
+                e.name as exercise_name,
+                s.set_number,
+                s.reps,
+                s.weight,
+                NULLIF(s.rpe, 0) as rpe,
+                w.notes
+            FROM sets s
+            JOIN workouts w ON s.workout_id = w.id
+            JOIN exercises e ON s.exercise_id = e.id
+            WHERE e.name = ?
+            ORDER BY w.date ASC
+            """,
+            (exercise_name,)
+        )
+
+        chunks = _iter_chunks(cur, chunk_size)
+        if format != 'csv':
+            return columnar.write_batches(output_path, 'exercise', chunks, format, compression)
+        return _write_csv(
+            output_path,
+            [
+                'Set ID',
+                'Date',
+                'Workout Type',
+                'Exercise',
+                'Set Number',
+                'Reps',
+                'Weight (lbs)',
+                'RPE',
+                'Workout Notes'
+            ],
+            chunks,
+            compression
+        )
+
+
+def export_date_range(start_date, end_date, output_dir, chunk_size=CHUNK_SIZE, compression=None):
+    """
+    Export workouts within a date range to CSV files.
+
+    Args:
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        output_dir: Directory path where CSV files will be saved
+        chunk_size: Number of rows fetched at a time
+        compression: None or one of COMPRESSIONS; the file name gets the
+            codec's suffix
+
+    Returns:
+        Dictionary with counts of exported records
+
+    Raises:
+        ValueError: If the compression is unknown
+    """
+    _check_format('csv', compression)
+    suffix = COMPRESSIONS[compression] if compression else ''
+
+    # Ensure output directory exists
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    # Generate filenames
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    workouts_file = output_path / f"workouts_{start_date}_to_{end_date}_{timestamp}.csv{suffix}"
+
+    query, params = workout_summary_query(start_date, end_date)
+    with connection() as conn:
+        count = _write_workouts(conn, workouts_file, chunk_size, compression=compression,
+                                query=query, params=params)
+
+    return {
+        'workouts': count,
+        'workouts_file': str(workouts_file),
+        'start_date': start_date,
+        'end_date': end_date
+    }
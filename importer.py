@@ -0,0 +1,401 @@
+# workout_tracker/importer.py
+
+import csv
+import re
+from pathlib import Path
+from .db import connection
+from .export import COMPRESSIONS, compression_for, open_csv
+from .services.events import publish, WORKOUT_SAVED, EXERCISE_ADDED
+from .services.workout_service import register_exercises
+
+# Number of CSV rows inserted per transaction
+BATCH_SIZE = 5000
+
+# Columns read from each export file, keyed by the name used in this module.
+# The column headers match those written by export.py.
+WORKOUT_COLUMNS = {
+    'id': 'Workout ID',
+    'date': 'Date',
+    'workout_type': 'Workout Type',
+    'notes': 'Notes',
+}
+
+SET_COLUMNS = {
+    'workout_id': 'Workout ID',
+    'date': 'Date',
+    'workout_type': 'Workout Type',
+    'exercise_name': 'Exercise',
+    'set_number': 'Set Number',
+    'reps': 'Reps',
+    'weight': 'Weight (lbs)',
+    'rpe': 'RPE',
+}
+
+CARDIO_COLUMNS = {
+    'workout_id': 'Workout ID',
+    'date': 'Date',
+    'workout_type': 'Workout Type',
+    'cardio_type': 'Cardio Type',
+    'minutes': 'Minutes',
+}
+
+
+def _read_rows(path, columns):
+    """
+    Stream rows from an exported CSV file one at a time.
+
+    Compressed files (.csv.gz, .csv.xz, .csv.zst) are decompressed as they
+    are read.
+
+    Args:
+        path: Path to the CSV file
+        columns: Mapping of key -> header name for the columns to read
+
+    Yields:
+        Dicts with the requested keys and the raw string values
+
+    Raises:
+        ValueError: If a required column is missing from the header
+    """
+    with open_csv(path, 'r', compression_for(path)) as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        missing = [name for name in columns.values() if name not in header]
+        if missing:
+            raise ValueError(f"{path} is missing column(s): {', '.join(missing)}")
+        index = {key: header.index(name) for key, name in columns.items()}
+
+        for row in reader:
+            if not row:
+                continue
+            yield {key: row[i] for key, i in index.items()}
+
+
+class _WorkoutIdMap:
+    """
+    Map workout IDs found in CSV files to workout IDs in this database.
+
+    A source workout matches an existing workout on the same date with the
+    same type (and the same notes, when the file has them). Each existing
+    workout is matched at most once, and workouts created by this import are
+    never matched. Unmatched source workouts are inserted as new rows.
+    """
+
+    def __init__(self, cur):
+        self.cur = cur
+        self._ids = {}  # source id -> (database id, created by this import)
+        self._claimed = set()
+        self.created = 0
+        # Changes reported by publish_changes() once the import is committed
+        self.dates = {}  # database id -> date of every workout touched
+        self.exercises = set()
+        self.added_exercises = []
+
+    def resolve(self, source_id, date, workout_type, notes=None):
+        """
+        Return (workout_id, is_new) for a source workout, creating it if needed.
+        """
+        if source_id in self._ids:
+            return self._ids[source_id]
+
+        query = "SELECT id FROM workouts WHERE date = ? AND workout_type = ?"
+        params = [date, workout_type]
+        if notes is not None:
+            query += " AND COALESCE(notes, '') = ?"
+            params.append(notes)
+        self.cur.execute(query + " ORDER BY id", params)
+
+        for (workout_id,) in self.cur.fetchall():
+            if workout_id not in self._claimed:
+                self._claimed.add(workout_id)
+                self._ids[source_id] = (workout_id, False)
+                self.dates[workout_id] = date
+                return self._ids[source_id]
+
+        self.cur.execute(
+            """
+            INSERT INTO workouts (date, workout_type, notes)
+            VALUES (?, ?, ?)
+            """,
+            (date, workout_type, notes or None)
+        )
+        workout_id = self.cur.lastrowid
+        self._claimed.add(workout_id)
+        self._ids[source_id] = (workout_id, True)
+        self.dates[workout_id] = date
+        self.created += 1
+        return self._ids[source_id]
+
+    def publish_changes(self):
+        """Publish the events for the workouts and exercises this import touched."""
+        if self.added_exercises:
+            publish(EXERCISE_ADDED, exercises=self.added_exercises)
+        if self.dates:
+            publish(WORKOUT_SAVED, self.dates.keys(), self.dates.values(), self.exercises)
+
+
+def _import_workouts(conn, path, id_map, batch_size):
+    """Import a workouts CSV, returning the number of rows read."""
+    count = 0
+    for row in _read_rows(path, WORKOUT_COLUMNS):
+        id_map.resolve(row['id'], row['date'], row['workout_type'], row['notes'])
+        count += 1
+        if count % batch_size == 0:
+            conn.commit()
+    conn.commit()
+    return count
+
+
+def _import_sets(conn, path, id_map, batch_size):
+    """Import a sets CSV, returning (inserted, duplicates)."""
+    cur = conn.cursor()
+    batch = []
+    inserted = duplicates = 0
+
+    for row in _read_rows(path, SET_COLUMNS):
+        workout_id, is_new = id_map.resolve(row['workout_id'], row['date'], row['workout_type'])
+        values = (
+            workout_id,
+            row['exercise_name'],
+            int(row['set_number']),
+            int(row['reps']),
+            float(row['weight']),
+            float(row['rpe']) if row['rpe'] else None
+        )
+
+        # Sets of a workout that already existed may already be in the database
+        if not is_new:
+            cur.execute(
+                """
+                SELECT 1 FROM sets
+                WHERE workout_id = ?
+                AND exercise_id = (SELECT id FROM exercises WHERE name = ?)
+                AND set_number = ? AND reps = ? AND weight = ? AND rpe IS ?
+                LIMIT 1
+                """,
+                values
+            )
+            if cur.fetchone():
+                duplicates += 1
+                continue
+
+        batch.append(values)
+        if len(batch) >= batch_size:
+            _insert_sets(cur, batch, id_map)
+            conn.commit()
+            inserted += len(batch)
+            batch = []
+
+    _insert_sets(cur, batch, id_map)
+    conn.commit()
+    inserted += len(batch)
+
+    return inserted, duplicates
+
+
+def _insert_sets(cur, batch, id_map):
+    """Insert a batch of set parameter rows, registering new exercise names."""
+    names = {row[1] for row in batch}
+    id_map.exercises.update(names)
+    id_map.added_exercises += register_exercises(cur, names)
+    cur.executemany(
+        """
+        INSERT INTO sets (workout_id, exercise_id, set_number, reps, weight, rpe)
+        VALUES (?, (SELECT id FROM exercises WHERE name = ?), ?, ?, ?, ?)
+        """,
+        batch
+    )
+
+
+def _import_cardio(conn, path, id_map, batch_size):
+    """Import a cardio CSV, returning (inserted, duplicates)."""
+    cur = conn.cursor()
+    batch = []
+    inserted = duplicates = 0
+
+    for row in _read_rows(path, CARDIO_COLUMNS):
+        workout_id, is_new = id_map.resolve(row['workout_id'], row['date'], row['workout_type'])
+        values = (workout_id, row['cardio_type'] or None, int(row['minutes']))
+
+        if not is_new:
+            cur.execute(
+                """
+                SELECT 1 FROM cardio_sessions
+                WHERE workout_id = ? AND COALESCE(cardio_type, 'General') = COALESCE(?, 'General')
+                AND minutes = ?
+                LIMIT 1
+                """,
+                values
+            )
+            if cur.fetchone():
+                duplicates += 1
+                continue
+
+        batch.append(values)
+        if len(batch) >= batch_size:
+            _insert_cardio(cur, batch)
+            conn.commit()
+            inserted += len(batch)
+            batch = []
+
+    _insert_cardio(cur, batch)
+    conn.commit()
+    inserted += len(batch)
+
+    return inserted, duplicates
+
+
+def _insert_cardio(cur, batch):
+    """Insert a batch of cardio parameter rows."""
+    cur.executemany(
+        """
+        INSERT INTO cardio_sessions (workout_id, cardio_type, minutes)
+        VALUES (?, ?, ?)
+        """,
+        batch
+    )
+
+
+def import_workouts_csv(input_path, batch_size=BATCH_SIZE):
+    """
+    Import workouts from a CSV file written by export_workouts_to_csv().
+
+    Workouts already in the database (same date, type and notes) are skipped.
+
+    Args:
+        input_path: Path to the workouts CSV file
+        batch_size: Number of rows per transaction
+
+    Returns:
+        Number of workouts created
+    """
+    with connection() as conn:
+        id_map = _WorkoutIdMap(conn.cursor())
+        _import_workouts(conn, input_path, id_map, batch_size)
+
+    id_map.publish_changes()
+    return id_map.created
+
+
+def import_sets_csv(input_path, batch_size=BATCH_SIZE):
+    """
+    Import sets from a CSV file written by export_sets_to_csv().
+
+    Rows are streamed and inserted in batches, so memory use does not grow
+    with the number of sets. Workouts referenced by the file are matched to
+    existing workouts by date and type, or created. Sets already recorded on
+    a matched workout are skipped.
+
+    Args:
+        input_path: Path to the sets CSV file
+        batch_size: Number of rows per transaction
+
+    Returns:
+        Dict with counts of workouts created, sets inserted and duplicates skipped
+    """
+    with connection() as conn:
+        id_map = _WorkoutIdMap(conn.cursor())
+        inserted, duplicates = _import_sets(conn, input_path, id_map, batch_size)
+
+    id_map.publish_changes()
+    return {
+        'workouts': id_map.created,
+        'sets': inserted,
+        'duplicates': duplicates
+    }
+
+
+def import_cardio_csv(input_path, batch_size=BATCH_SIZE):
+    """
+    Import cardio sessions from a CSV file written by export_cardio_to_csv().
+
+    Args:
+        input_path: Path to the cardio CSV file
+        batch_size: Number of rows per transaction
+
+    Returns:
+        Dict with counts of workouts created, cardio sessions inserted and
+        duplicates skipped
+    """
+    with connection() as conn:
+        id_map = _WorkoutIdMap(conn.cursor())
+        inserted, duplicates = _import_cardio(conn, input_path, id_map, batch_size)
+
+    id_map.publish_changes()
+    return {
+        'workouts': id_map.created,
+        'cardio': inserted,
+        'duplicates': duplicates
+    }
+
+
+def _latest_export(input_dir, prefix):
+    """
+    Return the newest '<prefix>_<timestamp>.csv' file in a directory, or None.
+
+    Compressed exports ('.csv.gz' and the other COMPRESSIONS suffixes) count
+    as well.
+    """
+    suffixes = "|".join(re.escape(suffix) for suffix in COMPRESSIONS.values())
+    pattern = re.compile(rf"{prefix}_\d{{8}}_\d{{6}}\.csv(?:{suffixes})?")
+    files = sorted(
+        path for path in Path(input_dir).glob(f"{prefix}_*.csv*")
+        if pattern.fullmatch(path.name)
+    )
+    return files[-1] if files else None
+
+
+def import_all_data(input_dir, batch_size=BATCH_SIZE):
+    """
+    Restore a backup written by export_all_data().
+
+    Uses the newest workouts, sets and cardio CSV files in the directory,
+    compressed or not.
+    Workout IDs in the files are remapped to new IDs, and importing the same
+    backup twice does not duplicate any data.
+
+    Args:
+        input_dir: Directory containing the exported CSV files
+        batch_size: Number of rows per transaction
+
+    Returns:
+        Dictionary with counts of imported records
+
+    Raises:
+        FileNotFoundError: If the directory has no exported CSV files
+    """
+    workouts_file = _latest_export(input_dir, "workouts")
+    sets_file = _latest_export(input_dir, "sets")
+    cardio_file = _latest_export(input_dir, "cardio")
+
+    if not (workouts_file or sets_file or cardio_file):
+        raise FileNotFoundError(f"No exported CSV files found in {input_dir}")
+
+    sets_count = cardio_count = duplicates = 0
+
+    with connection() as conn:
+        id_map = _WorkoutIdMap(conn.cursor())
+
+        # Workouts first so that notes and empty workouts are restored too
+        if workouts_file:
+            _import_workouts(conn, workouts_file, id_map, batch_size)
+        if sets_file:
+            sets_count, skipped = _import_sets(conn, sets_file, id_map, batch_size)
+            duplicates += skipped
+        if cardio_file:
+            cardio_count, skipped = _import_cardio(conn, cardio_file, id_map, batch_size)
+            duplicates += skipped
+
+    id_map.publish_changes()
+    return {
+        'workouts': id_map.created,
+        'sets': sets_count,
+        'cardio': cardio_count,
+        'duplicates': duplicates,
+        'workouts_file': str(workouts_file) if workouts_file else None,
+        'sets_file': str(sets_file) if sets_file else None,
+        'cardio_file': str(cardio_file) if cardio_file else None
+    }
@@ -0,0 +1,160 @@
+# workout_tracker/maintenance.py
+
+"""
+Repair commands for the derived tables that are kept in sync incrementally.
+
+Run with:
+
+    python -m workout_tracker.maintenance <command>
+"""
+
+import argparse
+
+from .db import connection, create_tables
+from .migrations import (
+    WORKOUT_TOTALS_SQL,
+    populate_personal_records,
+    populate_rollups,
+    populate_workout_summary,
+)
+
+
+def rebuild_personal_records():
+    """
+    Recompute the personal_records table from scratch.
+
+    Returns:
+        Number of record rows written
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+        populate_personal_records(cur)
+        cur.execute("SELECT COUNT(*) FROM personal_records")
+        count = cur.fetchone()[0]
+
+    return count
+
+
+def rebuild_rollups():
+    """
+    Recompute the weekly/monthly rollups table from scratch.
+
+    Returns:
+        Number of rollup rows written
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+        populate_rollups(cur)
+        cur.execute("SELECT COUNT(*) FROM rollups")
+        count = cur.fetchone()[0]
+
+    return count
+
+
+def rebuild_workout_summary():
+    """
+    Recompute the workout_summary table from scratch.
+
+    Returns:
+        Number of summary rows written
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+        populate_workout_summary(cur)
+        count = cur.rowcount
+
+    return count
+
+
+def check_workout_summary():
+    """
+    Compare workout_summary with totals recomputed from the base tables.
+
+    Returns:
+        List of dicts describing mismatched workouts (workout_id, column,
+        expected, actual); empty when the table is consistent
+    """
+    columns = ['date', 'workout_type', 'notes', 'total_sets', 'total_volume', 'cardio_minutes']
+    problems = []
+
+    with connection() as conn:
+        cur = conn.cursor()
+
+        # Workouts with a wrong or missing summary row
+        cur.execute(
+            f"""
+            SELECT e.*, {', '.join(f'ws.{c} as actual_{c}' for c in columns)},
+                ws.workout_id IS NULL as missing
+            FROM ({WORKOUT_TOTALS_SQL}) e
+            LEFT JOIN workout_summary ws ON ws.workout_id = e.workout_id
+            """
+        )
+        for row in cur:
+            if row['missing']:
+                problems.append({
+                    'workout_id': row['workout_id'],
+                    'column': None,
+                    'expected': 'row',
+                    'actual': None
+                })
+                continue
+            for column in columns:
+                expected, actual = row[column], row[f'actual_{column}']
+                if isinstance(expected, float) and actual is not None:
+                    mismatch = abs(expected - actual) > 1e-6
+                else:
+                    mismatch = expected != actual
+                if mismatch:
+                    problems.append({
+                        'workout_id': row['workout_id'],
+                        'column': column,
+                        'expected': expected,
+                        'actual': actual
+                    })
+
+        # Summary rows left behind by deleted workouts
+        cur.execute(
+            """
+            SELECT ws.workout_id FROM workout_summary ws
+            WHERE NOT EXISTS (SELECT 1 FROM workouts w WHERE w.id = ws.workout_id)
+            """
+        )
+        for row in cur:
+            problems.append({
+                'workout_id': row['workout_id'],
+                'column': None,
+                'expected': None,
+                'actual': 'row'
+            })
+
+    return problems
+
+
+COMMANDS = {
+    'rebuild-records': rebuild_personal_records,
+    'rebuild-rollups': rebuild_rollups,
+    'rebuild-summary': rebuild_workout_summary,
+    'check-summary': check_workout_summary,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Workout Tracker maintenance")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args(argv)
+
+    create_tables()
+    result = COMMANDS[args.command]()
+
+    # Checkers return a list of problems; rebuilds return a row count
+    if isinstance(result, list):
+        for problem in result:
+            print(problem)
+        print(f"{args.command}: {len(result)} problem(s) found")
+        parser.exit(1 if result else 0)
+
+    print(f"{args.command}: {result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1326 @@
+# workout_tracker/migrations.py
+
+"""
+Versioned schema migrations.
+
+The schema version of a database file is stored in SQLite's
+PRAGMA user_version. Each migration upgrades the schema by exactly one
+version and runs in its own transaction together with the version bump, so
+an interrupted upgrade leaves the file at the last completed version.
+
+Migrations must be idempotent: running one against a database that already
+has its changes (e.g. a file restored from a backup with a stale
+user_version) must succeed and leave the schema and the logged data as they
+were. Migrations that fill a derived table rebuild it from the base tables
+as they are now, so a later schema (such as sets.exercise_id from migration
+7) must be handled too.
+"""
+
+
+def _has_exercise_ids(cur):
+    """Return True if sets references the exercises table (migration 7)."""
+    cur.execute("SELECT 1 FROM pragma_table_info('sets') WHERE name = 'exercise_id'")
+    return cur.fetchone() is not None
+
+
+def _exercise_name_sql(cur):
+    """
+    Return (name expression, join clause) for the exercise name of sets `s`,
+    before or after migration 7 moved the names to the exercises table.
+    """
+    if _has_exercise_ids(cur):
+        return "e.name", "JOIN exercises e ON s.exercise_id = e.id"
+    return "s.exercise_name", ""
+
+
+def _add_workout_indexes(cur):
+    """Index workouts for the date-range and type filters used by the services."""
+    # Date range filters and ORDER BY date in get_workouts, the weekly
+    # analytics and the exporters
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_workouts_date ON workouts (date)"
+    )
+    # Workout type filter in get_workouts and DISTINCT in get_workout_types
+    cur.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_workouts_type_date
+        ON workouts (workout_type, date)
+        """
+    )
+
+
+def _add_set_indexes(cur):
+    """Add covering indexes for the per-workout and per-exercise set queries."""
+    # Per-workout set totals (COUNT, SUM(reps * weight)) and the weekly
+    # volume join are answered from the index without touching the table
+    cur.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_sets_workout
+        ON sets (workout_id, reps, weight)
+        """
+    )
+    # Progression, top set and PR lookups filter on exercise and read
+    # weight/reps/workout_id; also serves DISTINCT exercise_name
+    cur.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_sets_exercise
+        ON sets (exercise_name, weight, reps, workout_id)
+        """
+    )
+
+
+def _add_cardio_indexes(cur):
+    """Add a covering index for joining cardio sessions to their workout."""
+    cur.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_cardio_workout
+        ON cardio_sessions (workout_id, minutes)
+        """
+    )
+
+
+def _add_personal_records(cur):
+    """
+    Create the personal_records table and the triggers that maintain it.
+
+    One row per exercise holds the heaviest set at any rep count
+    (rep_count = 0), plus one row per exercise and rep count for rep maxes.
+    Ties on weight go to more reps, then the earliest date, then the
+    lowest set id.
+    """
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS personal_records (
+            exercise_name TEXT NOT NULL,
+            rep_count INTEGER NOT NULL,
+            weight REAL NOT NULL,
+            reps INTEGER NOT NULL,
+            date TEXT NOT NULL,
+            set_id INTEGER NOT NULL,
+            PRIMARY KEY (exercise_name, rep_count)
+        )
+        """
+    )
+    cur.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_personal_records_set
+        ON personal_records (set_id)
+        """
+    )
+
+    # Migration 7 recreates the sets index and triggers against exercise_id
+    if not _has_exercise_ids(cur):
+        _add_personal_records_triggers(cur)
+
+    populate_personal_records(cur)
+
+
+def _add_personal_records_triggers(cur):
+    """Create the exercise_name-based sets triggers of migration 4."""
+    # Lets the delete trigger find the next best rep max with an index seek
+    cur.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_sets_exercise_reps
+        ON sets (exercise_name, reps, weight)
+        """
+    )
+
+    # A new set replaces a record only if it beats it
+    cur.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_sets_records_insert
+        AFTER INSERT ON sets
+        BEGIN
+            INSERT INTO personal_records
+                (exercise_name, rep_count, weight, reps, date, set_id)
+            SELECT NEW.exercise_name, k.rep_count, NEW.weight, NEW.reps, w.date, NEW.id
+            FROM workouts w,
+                 (SELECT 0 as rep_count
+                  UNION ALL
+                  SELECT NEW.reps WHERE NEW.reps > 0) k
+            WHERE w.id = NEW.workout_id
+            ON CONFLICT (exercise_name, rep_count) DO UPDATE SET
+                weight = excluded.weight,
+                reps = excluded.reps,
+                date = excluded.date,
+                set_id = excluded.set_id
+            WHERE excluded.weight > personal_records.weight
+            OR (excluded.weight = personal_records.weight AND (
+                excluded.reps > personal_records.reps
+                OR (excluded.reps = personal_records.reps AND (
+                    excluded.date < personal_records.date
+                    OR (excluded.date = personal_records.date
+                        AND excluded.set_id < personal_records.set_id)
+                ))
+            ));
+        END
+        """
+    )
+
+    # Deleting a record-holding set promotes the next best set
+    cur.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_sets_records_delete
+        AFTER DELETE ON sets
+        WHEN EXISTS (SELECT 1 FROM personal_records WHERE set_id = OLD.id)
+        BEGIN
+            DELETE FROM personal_records WHERE set_id = OLD.id;
+
+            INSERT OR IGNORE INTO personal_records
+                (exercise_name, rep_count, weight, reps, date, set_id)
+            SELECT s.exercise_name, 0, s.weight, s.reps, w.date, s.id
+            FROM sets s
+            JOIN workouts w ON s.workout_id = w.id
+            WHERE s.exercise_name = OLD.exercise_name
+            AND s.weight = (
+                SELECT MAX(weight) FROM sets WHERE exercise_name = OLD.exercise_name
+            )
+            ORDER BY s.reps DESC, w.date ASC, s.id ASC
+            LIMIT 1;
+
+            INSERT OR IGNORE INTO personal_records
+                (exercise_name, rep_count, weight, reps, date, set_id)
+            SELECT s.exercise_name, s.reps, s.weight, s.reps, w.date, s.id
+            FROM sets s
+            JOIN workouts w ON s.workout_id = w.id
+            WHERE s.exercise_name = OLD.exercise_name
+            AND s.reps = OLD.reps
+            AND OLD.reps > 0
+            AND s.weight = (
+                SELECT MAX(weight) FROM sets
+                WHERE exercise_name = OLD.exercise_name AND reps = OLD.reps
+            )
+            ORDER BY w.date ASC, s.id ASC
+            LIMIT 1;
+        END
+        """
+    )
+
+
+
+def populate_personal_records(cur):
+    """
+    Recompute personal_records from the sets table.
+
+    Used by migration 4 and by maintenance.rebuild_personal_records().
+    """
+    name, join = _exercise_name_sql(cur)
+    cur.execute("DELETE FROM personal_records")
+
+    # Heaviest set per exercise at any rep count
+    cur.execute(
+        f"""
+        INSERT INTO personal_records
+            (exercise_name, rep_count, weight, reps, date, set_id)
+        SELECT exercise_name, 0, weight, reps, date, id
+        FROM (
+            SELECT s.id, {name} as exercise_name, s.weight, s.reps, w.date,
+                ROW_NUMBER() OVER (
+                    PARTITION BY {name}
+                    ORDER BY s.weight DESC, s.reps DESC, w.date ASC, s.id ASC
+                ) as rank
+            FROM sets s
+            JOIN workouts w ON s.workout_id = w.id
+            {join}
+        )
+        WHERE rank = 1
+        """
+    )
+
+    # Heaviest set per exercise for each rep count
+    cur.execute(
+        f"""
+        INSERT INTO personal_records
+            (exercise_name, rep_count, weight, reps, date, set_id)
+        SELECT exercise_name, reps, weight, reps, date, id
+        FROM (
+            SELECT s.id, {name} as exercise_name, s.weight, s.reps, w.date,
+                ROW_NUMBER() OVER (
+                    PARTITION BY {name}, s.reps
+                    ORDER BY s.weight DESC, w.date ASC, s.id ASC
+                ) as rank
+            FROM sets s
+            JOIN workouts w ON s.workout_id = w.id
+            {join}
+            WHERE s.reps > 0
+        )
+        WHERE rank = 1
+        """
+    )
+
+
+# Start of the calendar period (Monday-based week or month) containing {date}
+_PERIOD_START_SQL = """
+    CASE {period}
+        WHEN 'week' THEN date({date}, 'weekday 0', '-6 days')
+        ELSE date({date}, 'start of month')
+    END
+"""
+
+_PERIODS_SQL = "(SELECT 'week' as period UNION ALL SELECT 'month')"
+
+
+def _add_rollups(cur):
+    """
+    Create the weekly/monthly rollups table and the triggers that maintain it.
+
+    Rows with exercise_name = '' hold the totals for all exercises, including
+    workout and cardio counts; per-exercise rows hold volume, sets and reps.
+    """
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS rollups (
+            period TEXT NOT NULL,
+            period_start TEXT NOT NULL,
+            exercise_name TEXT NOT NULL,
+            total_volume REAL NOT NULL DEFAULT 0,
+            total_sets INTEGER NOT NULL DEFAULT 0,
+            total_reps INTEGER NOT NULL DEFAULT 0,
+            cardio_minutes INTEGER NOT NULL DEFAULT 0,
+            cardio_workouts INTEGER NOT NULL DEFAULT 0,
+            workout_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (period, exercise_name, period_start)
+        )
+        """
+    )
+
+    new_start = _PERIOD_START_SQL.format(period="p.period", date="NEW.date")
+    old_start = _PERIOD_START_SQL.format(period="p.period", date="OLD.date")
+
+    cur.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_workouts_rollups_insert
+        AFTER INSERT ON workouts
+        BEGIN
+            INSERT INTO rollups (period, period_start, exercise_name, workout_count)
+            SELECT p.period, {new_start}, '', 1
+            FROM {_PERIODS_SQL} p
+            WHERE true
+            ON CONFLICT (period, exercise_name, period_start) DO UPDATE SET
+                workout_count = workout_count + 1;
+        END
+        """
+    )
+    cur.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_workouts_rollups_delete
+        AFTER DELETE ON workouts
+        BEGIN
+            UPDATE rollups SET workout_count = workout_count - 1
+            WHERE exercise_name = ''
+            AND (period, period_start) IN (
+                SELECT p.period, {old_start} FROM {_PERIODS_SQL} p
+            );
+        END
+        """
+    )
+
+    # Migration 7 recreates the sets triggers against exercise_id
+    if not _has_exercise_ids(cur):
+        _add_set_rollups_triggers(cur)
+
+    _add_cardio_rollups_triggers(cur)
+    populate_rollups(cur)
+
+
+def _add_set_rollups_triggers(cur):
+    """Create the exercise_name-based sets triggers of migration 5."""
+    set_start = _PERIOD_START_SQL.format(period="p.period", date="w.date")
+    cur.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_sets_rollups_insert
+        AFTER INSERT ON sets
+        BEGIN
+            INSERT INTO rollups
+                (period, period_start, exercise_name, total_volume, total_sets, total_reps)
+            SELECT p.period, {set_start}, e.name, NEW.reps * NEW.weight, 1, NEW.reps
+            FROM workouts w,
+                 {_PERIODS_SQL} p,
+                 (SELECT '' as name UNION ALL SELECT NEW.exercise_name) e
+            WHERE w.id = NEW.workout_id
+            ON CONFLICT (period, exercise_name, period_start) DO UPDATE SET
+                total_volume = total_volume + excluded.total_volume,
+                total_sets = total_sets + 1,
+                total_reps = total_reps + excluded.total_reps;
+        END
+        """
+    )
+    cur.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_sets_rollups_delete
+        AFTER DELETE ON sets
+        BEGIN
+            UPDATE rollups SET
+                total_volume = total_volume - OLD.reps * OLD.weight,
+                total_sets = total_sets - 1,
+                total_reps = total_reps - OLD.reps
+            WHERE exercise_name IN ('', OLD.exercise_name)
+            AND (period, period_start) IN (
+                SELECT p.period, {set_start}
+                FROM workouts w, {_PERIODS_SQL} p
+                WHERE w.id = OLD.workout_id
+            );
+        END
+        """
+    )
+
+
+def _add_cardio_rollups_triggers(cur):
+    """Create the cardio_sessions triggers of migration 5."""
+    set_start = _PERIOD_START_SQL.format(period="p.period", date="w.date")
+    cur.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_cardio_rollups_insert
+        AFTER INSERT ON cardio_sessions
+        BEGIN
+            INSERT INTO rollups
+                (period, period_start, exercise_name, cardio_minutes, cardio_workouts)
+            SELECT p.period, {set_start}, '', NEW.minutes,
+                NOT EXISTS (
+                    SELECT 1 FROM cardio_sessions c
+                    WHERE c.workout_id = NEW.workout_id AND c.id != NEW.id
+                )
+            FROM workouts w, {_PERIODS_SQL} p
+            WHERE w.id = NEW.workout_id
+            ON CONFLICT (period, exercise_name, period_start) DO UPDATE SET
+                cardio_minutes = cardio_minutes + excluded.cardio_minutes,
+                cardio_workouts = cardio_workouts + excluded.cardio_workouts;
+        END
+        """
+    )
+    cur.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_cardio_rollups_delete
+        AFTER DELETE ON cardio_sessions
+        BEGIN
+            UPDATE rollups SET
+                cardio_minutes = cardio_minutes - OLD.minutes,
+                cardio_workouts = cardio_workouts - NOT EXISTS (
+                    SELECT 1 FROM cardio_sessions c WHERE c.workout_id = OLD.workout_id
+                )
+            WHERE exercise_name = ''
+            AND (period, period_start) IN (
+                SELECT p.period, {set_start}
+                FROM workouts w, {_PERIODS_SQL} p
+                WHERE w.id = OLD.workout_id
+            );
+        END
+        """
+    )
+
+
+def populate_rollups(cur):
+    """
+    Recompute the rollups table from workouts, sets and cardio_sessions.
+
+    Used by migration 5 and by maintenance.rebuild_rollups().
+    """
+    period_start = _PERIOD_START_SQL.format(period="p.period", date="w.date")
+    name, join = _exercise_name_sql(cur)
+    cur.execute("DELETE FROM rollups")
+
+    # Workout counts
+    cur.execute(
+        f"""
+        INSERT INTO rollups (period, period_start, exercise_name, workout_count)
+        SELECT p.period, {period_start} as period_start, '', COUNT(*)
+        FROM workouts w, {_PERIODS_SQL} p
+        GROUP BY p.period, period_start
+        """
+    )
+
+    # Set totals, once for all exercises ('') and once per exercise
+    cur.execute(
+        f"""
+        INSERT INTO rollups
+            (period, period_start, exercise_name, total_volume, total_sets, total_reps)
+        SELECT p.period, {period_start} as period_start,
+            COALESCE(k.name, {name}) as exercise_key,
+            SUM(s.reps * s.weight), COUNT(*), SUM(s.reps)
+        FROM sets s
+        JOIN workouts w ON s.workout_id = w.id
+        {join}
+        CROSS JOIN {_PERIODS_SQL} p
+        CROSS JOIN (SELECT '' as name UNION ALL SELECT NULL) k
+        WHERE true
+        GROUP BY p.period, period_start, exercise_key
+        ON CONFLICT (period, exercise_name, period_start) DO UPDATE SET
+            total_volume = excluded.total_volume,
+            total_sets = excluded.total_sets,
+            total_reps = excluded.total_reps
+        """
+    )
+
+    # Cardio totals
+    cur.execute(
+        f"""
+        INSERT INTO rollups
+            (period, period_start, exercise_name, cardio_minutes, cardio_workouts)
+        SELECT p.period, {period_start} as period_start, '',
+            SUM(c.minutes), COUNT(DISTINCT c.workout_id)
+        FROM cardio_sessions c
+        JOIN workouts w ON c.workout_id = w.id
+        CROSS JOIN {_PERIODS_SQL} p
+        WHERE true
+        GROUP BY p.period, period_start
+        ON CONFLICT (period, exercise_name, period_start) DO UPDATE SET
+            cardio_minutes = excluded.cardio_minutes,
+            cardio_workouts = excluded.cardio_workouts
+        """
+    )
+
+
+def _add_workout_summary(cur):
+    """
+    Create the workout_summary table and the triggers that keep it in sync.
+
+    Holds one row per workout with its date, type and notes copied from
+    workouts plus the set and cardio totals, so history and exports read a
+    single table without joins.
+    """
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS workout_summary (
+            workout_id INTEGER PRIMARY KEY,
+            date TEXT NOT NULL,
+            workout_type TEXT NOT NULL,
+            notes TEXT,
+            total_sets INTEGER NOT NULL DEFAULT 0,
+            total_volume REAL NOT NULL DEFAULT 0,
+            cardio_minutes INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    cur.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_workout_summary_date
+        ON workout_summary (date)
+        """
+    )
+    cur.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_workout_summary_type_date
+        ON workout_summary (workout_type, date)
+        """
+    )
+
+    cur.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_workouts_summary_insert
+        AFTER INSERT ON workouts
+        BEGIN
+            INSERT INTO workout_summary (workout_id, date, workout_type, notes)
+            VALUES (NEW.id, NEW.date, NEW.workout_type, NEW.notes);
+        END
+        """
+    )
+    cur.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_workouts_summary_update
+        AFTER UPDATE OF date, workout_type, notes ON workouts
+        BEGIN
+            UPDATE workout_summary SET
+                date = NEW.date,
+                workout_type = NEW.workout_type,
+                notes = NEW.notes
+            WHERE workout_id = NEW.id;
+        END
+        """
+    )
+    cur.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_workouts_summary_delete
+        AFTER DELETE ON workouts
+        BEGIN
+            DELETE FROM workout_summary WHERE workout_id = OLD.id;
+        END
+        """
+    )
+    cur.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_sets_summary_insert
+        AFTER INSERT ON sets
+        BEGIN
+            UPDATE workout_summary SET
+                total_sets = total_sets + 1,
+                total_volume = total_volume + NEW.reps * NEW.weight
+            WHERE workout_id = NEW.workout_id;
+        END
+        """
+    )
+    cur.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_sets_summary_delete
+        AFTER DELETE ON sets
+        BEGIN
+            UPDATE workout_summary SET
+                total_sets = total_sets - 1,
+                total_volume = total_volume - OLD.reps * OLD.weight
+            WHERE workout_id = OLD.workout_id;
+        END
+        """
+    )
+    cur.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_cardio_summary_insert
+        AFTER INSERT ON cardio_sessions
+        BEGIN
+            UPDATE workout_summary SET cardio_minutes = cardio_minutes + NEW.minutes
+            WHERE workout_id = NEW.workout_id;
+        END
+        """
+    )
+    cur.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_cardio_summary_delete
+        AFTER DELETE ON cardio_sessions
+        BEGIN
+            UPDATE workout_summary SET cardio_minutes = cardio_minutes - OLD.minutes
+            WHERE workout_id = OLD.workout_id;
+        END
+        """
+    )
+
+    populate_workout_summary(cur)
+
+
+# Per-workout totals recomputed from the base tables, in workout_summary
+# column order. reps * weight is read from idx_sets_workout.
+WORKOUT_TOTALS_SQL = """
+    SELECT
+        w.id as workout_id,
+        w.date,
+        w.workout_type,
+        w.notes,
+        (SELECT COUNT(*) FROM sets s WHERE s.workout_id = w.id) as total_sets,
+        (
+            SELECT COALESCE(SUM(s.reps * s.weight), 0)
+            FROM sets s WHERE s.workout_id = w.id
+        ) as total_volume,
+        (
+            SELECT COALESCE(SUM(c.minutes), 0)
+            FROM cardio_sessions c WHERE c.workout_id = w.id
+        ) as cardio_minutes
+    FROM workouts w
+"""
+
+
+def populate_workout_summary(cur):
+    """
+    Recompute workout_summary from the base tables.
+
+    Used by migration 6 and by maintenance.rebuild_workout_summary().
+    """
+    cur.execute("DELETE FROM workout_summary")
+    cur.execute(
+        f"""
+        INSERT INTO workout_summary
+            (workout_id, date, workout_type, notes, total_sets, total_volume, cardio_minutes)
+        {WORKOUT_TOTALS_SQL}
+        """
+    )
+
+
+def _add_exercises(cur):
+    """
+    Move exercise names into an exercises table referenced by sets.exercise_id.
+
+    sets is rebuilt without its exercise_name column, so its indexes and
+    triggers are recreated here against exercise_id. personal_records and
+    rollups stay keyed by exercise name; their triggers look the name up
+    by primary key.
+    """
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS exercises (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE
+        )
+        """
+    )
+
+    if _has_exercise_ids(cur):
+        return
+
+    cur.execute(
+        """
+        INSERT OR IGNORE INTO exercises (name)
+        SELECT DISTINCT exercise_name FROM sets ORDER BY exercise_name
+        """
+    )
+
+    cur.execute(
+        """
+        CREATE TABLE sets_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            workout_id INTEGER NOT NULL,
+            exercise_id INTEGER NOT NULL,
+            set_number INTEGER NOT NULL,
+            reps INTEGER NOT NULL,
+            weight REAL NOT NULL,
+            rpe REAL,
+            FOREIGN KEY (workout_id) REFERENCES workouts(id),
+            FOREIGN KEY (exercise_id) REFERENCES exercises(id)
+        )
+        """
+    )
+    cur.execute(
+        """
+        INSERT INTO sets_new (id, workout_id, exercise_id, set_number, reps, weight, rpe)
+        SELECT s.id, s.workout_id, e.id, s.set_number, s.reps, s.weight, s.rpe
+        FROM sets s
+        JOIN exercises e ON e.name = s.exercise_name
+        """
+    )
+    # Keep AUTOINCREMENT from reusing the ids of sets deleted earlier
+    cur.execute(
+        """
+        UPDATE sqlite_sequence
+        SET seq = (SELECT seq FROM sqlite_sequence WHERE name = 'sets')
+        WHERE name = 'sets_new'
+        AND EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'sets')
+        """
+    )
+    # Dropping sets also drops its indexes and triggers
+    cur.execute("DROP TABLE sets")
+    cur.execute("ALTER TABLE sets_new RENAME TO sets")
+
+    cur.execute(
+        """
+        CREATE INDEX idx_sets_workout
+        ON sets (workout_id, reps, weight)
+        """
+    )
+    cur.execute(
+        """
+        CREATE INDEX idx_sets_exercise
+        ON sets (exercise_id, weight, reps, workout_id)
+        """
+    )
+    cur.execute(
+        """
+        CREATE INDEX idx_sets_exercise_reps
+        ON sets (exercise_id, reps, weight)
+        """
+    )
+
+    cur.execute(
+        """
+        CREATE TRIGGER trg_sets_records_insert
+        AFTER INSERT ON sets
+        BEGIN
+            INSERT INTO personal_records
+                (exercise_name, rep_count, weight, reps, date, set_id)
+            SELECT e.name, k.rep_count, NEW.weight, NEW.reps, w.date, NEW.id
+            FROM workouts w,
+                 exercises e,
+                 (SELECT 0 as rep_count
+                  UNION ALL
+                  SELECT NEW.reps WHERE NEW.reps > 0) k
+            WHERE w.id = NEW.workout_id
+            AND e.id = NEW.exercise_id
+            ON CONFLICT (exercise_name, rep_count) DO UPDATE SET
+                weight = excluded.weight,
+                reps = excluded.reps,
+                date = excluded.date,
+                set_id = excluded.set_id
+            WHERE excluded.weight > personal_records.weight
+            OR (excluded.weight = personal_records.weight AND (
+                excluded.reps > personal_records.reps
+                OR (excluded.reps = personal_records.reps AND (
+                    excluded.date < personal_records.date
+                    OR (excluded.date = personal_records.date
+                        AND excluded.set_id < personal_records.set_id)
+                ))
+            ));
+        END
+        """
+    )
+    cur.execute(
+        """
+        CREATE TRIGGER trg_sets_records_delete
+        AFTER DELETE ON sets
+        WHEN EXISTS (SELECT 1 FROM personal_records WHERE set_id = OLD.id)
+        BEGIN
+            DELETE FROM personal_records WHERE set_id = OLD.id;
+
+            INSERT OR IGNORE INTO personal_records
+                (exercise_name, rep_count, weight, reps, date, set_id)
+            SELECT e.name, 0, s.weight, s.reps, w.date, s.id
+            FROM sets s
+            JOIN workouts w ON s.workout_id = w.id
+            JOIN exercises e ON s.exercise_id = e.id
+            WHERE s.exercise_id = OLD.exercise_id
+            AND s.weight = (
+                SELECT MAX(weight) FROM sets WHERE exercise_id = OLD.exercise_id
+            )
+            ORDER BY s.reps DESC, w.date ASC, s.id ASC
+            LIMIT 1;
+
+            INSERT OR IGNORE INTO personal_records
+                (exercise_name, rep_count, weight, reps, date, set_id)
+            SELECT e.name, s.reps, s.weight, s.reps, w.date, s.id
+            FROM sets s
+            JOIN workouts w ON s.workout_id = w.id
+            JOIN exercises e ON s.exercise_id = e.id
+            WHERE s.exercise_id = OLD.exercise_id
+            AND s.reps = OLD.reps
+            AND OLD.reps > 0
+            AND s.weight = (
+                SELECT MAX(weight) FROM sets
+                WHERE exercise_id = OLD.exercise_id AND reps = OLD.reps
+            )
+            ORDER BY w.date ASC, s.id ASC
+            LIMIT 1;
+        END
+        """
+    )
+
+    set_start = _PERIOD_START_SQL.format(period="p.period", date="w.date")
+    cur.execute(
+        f"""
+        CREATE TRIGGER trg_sets_rollups_insert
+        AFTER INSERT ON sets
+        BEGIN
+            INSERT INTO rollups
+                (period, period_start, exercise_name, total_volume, total_sets, total_reps)
+            SELECT p.period, {set_start}, e.name, NEW.reps * NEW.weight, 1, NEW.reps
+            FROM workouts w,
+                 {_PERIODS_SQL} p,
+                 (SELECT '' as name
+                  UNION ALL
+                  SELECT name FROM exercises WHERE id = NEW.exercise_id) e
+            WHERE w.id = NEW.workout_id
+            ON CONFLICT (period, exercise_name, period_start) DO UPDATE SET
+                total_volume = total_volume + excluded.total_volume,
+                total_sets = total_sets + 1,
+                total_reps = total_reps + excluded.total_reps;
+        END
+        """
+    )
+    cur.execute(
+        f"""
+        CREATE TRIGGER trg_sets_rollups_delete
+        AFTER DELETE ON sets
+        BEGIN
+            UPDATE rollups SET
+                total_volume = total_volume - OLD.reps * OLD.weight,
+                total_sets = total_sets - 1,
+                total_reps = total_reps - OLD.reps
+            WHERE exercise_name IN (
+                '', (SELECT name FROM exercises WHERE id = OLD.exercise_id)
+            )
+            AND (period, period_start) IN (
+                SELECT p.period, {set_start}
+                FROM workouts w, {_PERIODS_SQL} p
+                WHERE w.id = OLD.workout_id
+            );
+        END
+        """
+    )
+
+    cur.execute(
+        """
+        CREATE TRIGGER trg_sets_summary_insert
+        AFTER INSERT ON sets
+        BEGIN
+            UPDATE workout_summary SET
+                total_sets = total_sets + 1,
+                total_volume = total_volume + NEW.reps * NEW.weight
+            WHERE workout_id = NEW.workout_id;
+        END
+        """
+    )
+    cur.execute(
+        """
+        CREATE TRIGGER trg_sets_summary_delete
+        AFTER DELETE ON sets
+        BEGIN
+            UPDATE workout_summary SET
+                total_sets = total_sets - 1,
+                total_volume = total_volume - OLD.reps * OLD.weight
+            WHERE workout_id = OLD.workout_id;
+        END
+        """
+    )
+
+
+def _add_day_numbers(cur):
+    """
+    Add an indexed integer day number next to the text dates.
+
+    workouts.day and workout_summary.day count days since 1970-01-01. They
+    are virtual generated columns (ALTER TABLE cannot add stored ones), so
+    writers need no changes; the indexes below store the computed values.
+    Range filters compare integers, and a Monday-based week start is
+    day - (day + 3) % 7.
+    """
+    day_sql = "CAST(julianday(date) - 2440587.5 AS INTEGER)"
+
+    for table in ("workouts", "workout_summary"):
+        # Generated columns are only listed by table_xinfo
+        cur.execute(
+            f"SELECT 1 FROM pragma_table_xinfo('{table}') WHERE name = 'day'"
+        )
+        if not cur.fetchone():
+            cur.execute(
+                f"""
+                ALTER TABLE {table}
+                ADD COLUMN day INTEGER GENERATED ALWAYS AS ({day_sql}) VIRTUAL
+                """
+            )
+
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_workouts_day ON workouts (day)"
+    )
+    cur.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_workouts_type_day
+        ON workouts (workout_type, day)
+        """
+    )
+
+    # History and exports filter and order workout_summary by day now
+    cur.execute("DROP INDEX IF EXISTS idx_workout_summary_date")
+    cur.execute("DROP INDEX IF EXISTS idx_workout_summary_type_date")
+    cur.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_workout_summary_day
+        ON workout_summary (day)
+        """
+    )
+    cur.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_workout_summary_type_day
+        ON workout_summary (workout_type, day)
+        """
+    )
+
+
+def _rebuild_table(cur, table, create_sql, columns):
+    """
+    Recreate a table from a new definition, keeping its rows, AUTOINCREMENT
+    sequence, indexes and triggers.
+
+    SQLite cannot change constraints in place, so the table is copied into
+    `create_sql` (formatted with {name}), dropped and renamed back.
+    """
+    cur.execute(
+        """
+        SELECT sql FROM sqlite_master
+        WHERE tbl_name = ? AND type IN ('index', 'trigger') AND sql IS NOT NULL
+        ORDER BY type, name
+        """,
+        (table,)
+    )
+    schema = [row[0] for row in cur.fetchall()]
+
+    column_list = ", ".join(columns)
+    cur.execute(create_sql.format(name=f"{table}_new"))
+    cur.execute(
+        f"INSERT INTO {table}_new ({column_list}) SELECT {column_list} FROM {table}"
+    )
+    cur.execute(
+        """
+        UPDATE sqlite_sequence
+        SET seq = (SELECT seq FROM sqlite_sequence WHERE name = ?)
+        WHERE name = ?
+        AND EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = ?)
+        """,
+        (table, f"{table}_new", table)
+    )
+    cur.execute(f"DROP TABLE {table}")
+    cur.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+
+    for sql in schema:
+        cur.execute(sql)
+
+
+def _add_cascading_foreign_keys(cur):
+    """
+    Make sets and cardio_sessions cascade when their workout is deleted.
+
+    Orphaned rows left by earlier versions are removed first, since they
+    would violate the enforced constraints. Cascaded deletes run before the
+    workout's own AFTER DELETE triggers, while its workout_summary row still
+    exists, so the rollup delete triggers now read the workout date from
+    workout_summary instead of workouts.
+    """
+    cur.execute(
+        """
+        SELECT 1 FROM pragma_foreign_key_list('sets')
+        WHERE "table" = 'workouts' AND on_delete = 'CASCADE'
+        """
+    )
+    if cur.fetchone():
+        return
+
+    cur.execute(
+        "DELETE FROM sets WHERE workout_id NOT IN (SELECT id FROM workouts)"
+    )
+    cur.execute(
+        "DELETE FROM cardio_sessions WHERE workout_id NOT IN (SELECT id FROM workouts)"
+    )
+
+    _rebuild_table(
+        cur,
+        "sets",
+        """
+        CREATE TABLE {name} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            workout_id INTEGER NOT NULL,
+            exercise_id INTEGER NOT NULL,
+            set_number INTEGER NOT NULL,
+            reps INTEGER NOT NULL,
+            weight REAL NOT NULL,
+            rpe REAL,
+            FOREIGN KEY (workout_id) REFERENCES workouts(id) ON DELETE CASCADE,
+            FOREIGN KEY (exercise_id) REFERENCES exercises(id)
+        )
+        """,
+        ["id", "workout_id", "exercise_id", "set_number", "reps", "weight", "rpe"]
+    )
+    _rebuild_table(
+        cur,
+        "cardio_sessions",
+        """
+        CREATE TABLE {name} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            workout_id INTEGER NOT NULL,
+            cardio_type TEXT,
+            minutes INTEGER NOT NULL,
+            FOREIGN KEY (workout_id) REFERENCES workouts(id) ON DELETE CASCADE
+        )
+        """,
+        ["id", "workout_id", "cardio_type", "minutes"]
+    )
+
+    period_start = _PERIOD_START_SQL.format(period="p.period", date="ws.date")
+
+    cur.execute("DROP TRIGGER IF EXISTS trg_sets_rollups_delete")
+    cur.execute(
+        f"""
+        CREATE TRIGGER trg_sets_rollups_delete
+        AFTER DELETE ON sets
+        BEGIN
+            UPDATE rollups SET
+                total_volume = total_volume - OLD.reps * OLD.weight,
+                total_sets = total_sets - 1,
+                total_reps = total_reps - OLD.reps
+            WHERE exercise_name IN (
+                '', (SELECT name FROM exercises WHERE id = OLD.exercise_id)
+            )
+            AND (period, period_start) IN (
+                SELECT p.period, {period_start}
+                FROM workout_summary ws, {_PERIODS_SQL} p
+                WHERE ws.workout_id = OLD.workout_id
+            );
+        END
+        """
+    )
+    cur.execute("DROP TRIGGER IF EXISTS trg_cardio_rollups_delete")
+    cur.execute(
+        f"""
+        CREATE TRIGGER trg_cardio_rollups_delete
+        AFTER DELETE ON cardio_sessions
+        BEGIN
+            UPDATE rollups SET
+                cardio_minutes = cardio_minutes - OLD.minutes,
+                cardio_workouts = cardio_workouts - NOT EXISTS (
+                    SELECT 1 FROM cardio_sessions c WHERE c.workout_id = OLD.workout_id
+                )
+            WHERE exercise_name = ''
+            AND (period, period_start) IN (
+                SELECT p.period, {period_start}
+                FROM workout_summary ws, {_PERIODS_SQL} p
+                WHERE ws.workout_id = OLD.workout_id
+            );
+        END
+        """
+    )
+
+
+# Epley estimate, matching calculate_estimated_1rm(): a single rep is the 1RM
+_E1RM_SQL = "CASE WHEN reps = 1 THEN weight ELSE weight * (1 + reps / 30.0) END"
+
+
+def _add_set_volume_e1rm(cur):
+    """
+    Store each set's volume and Epley e1RM in generated columns.
+
+    sets.volume (reps * weight) and sets.e1rm are STORED, which ALTER TABLE
+    cannot add, so sets is rebuilt. The best e1RM of an exercise is a seek
+    on (exercise_id, e1rm); the heaviest set already is one on
+    idx_sets_exercise (exercise_id, weight, ...).
+    """
+    cur.execute("SELECT 1 FROM pragma_table_xinfo('sets') WHERE name = 'e1rm'")
+    if not cur.fetchone():
+        _rebuild_table(
+            cur,
+            "sets",
+            f"""
+            CREATE TABLE {{name}} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                workout_id INTEGER NOT NULL,
+                exercise_id INTEGER NOT NULL,
+                set_number INTEGER NOT NULL,
+                reps INTEGER NOT NULL,
+                weight REAL NOT NULL,
+                rpe REAL,
+                volume REAL GENERATED ALWAYS AS (reps * weight) STORED,
+                e1rm REAL GENERATED ALWAYS AS ({_E1RM_SQL}) STORED,
+                FOREIGN KEY (workout_id) REFERENCES workouts(id) ON DELETE CASCADE,
+                FOREIGN KEY (exercise_id) REFERENCES exercises(id)
+            )
+            """,
+            ["id", "workout_id", "exercise_id", "set_number", "reps", "weight", "rpe"]
+        )
+
+    cur.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_sets_exercise_e1rm
+        ON sets (exercise_id, e1rm)
+        """
+    )
+
+
+# Marks a workout as changed (or deleted, once its row is gone) with the next
+# change sequence number
+_LOG_CHANGE_SQL = """
+            INSERT INTO workout_changes (workout_id, seq, deleted)
+            VALUES (
+                {workout_id},
+                (SELECT COALESCE(MAX(seq), 0) + 1 FROM workout_changes),
+                NOT EXISTS (SELECT 1 FROM workouts WHERE id = {workout_id})
+            )
+            ON CONFLICT (workout_id) DO UPDATE SET
+                seq = excluded.seq,
+                deleted = excluded.deleted;"""
+
+
+def _add_workout_changes(cur):
+    """
+    Create the workout_changes log and the triggers that fill it.
+
+    Holds one row per workout ever written: the sequence number of its
+    latest change, and whether that change deleted it. Any insert, update
+    or delete of the workout, its sets or its cardio sessions moves the
+    workout to the next sequence number, so an incremental export reads the
+    workouts with seq above its watermark. The table grows with the number
+    of workouts, not the number of changes.
+    """
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS workout_changes (
+            workout_id INTEGER PRIMARY KEY,
+            seq INTEGER NOT NULL,
+            deleted INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    cur.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_workout_changes_seq
+        ON workout_changes (seq)
+        """
+    )
+
+    for table, workout_id in (("workouts", "id"),
+                              ("sets", "workout_id"),
+                              ("cardio_sessions", "workout_id")):
+        cur.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_changes_insert
+            AFTER INSERT ON {table}
+            BEGIN{_LOG_CHANGE_SQL.format(workout_id=f"NEW.{workout_id}")}
+            END
+            """
+        )
+        # A row moved to another workout changes both workouts
+        cur.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_changes_update
+            AFTER UPDATE ON {table}
+            BEGIN{_LOG_CHANGE_SQL.format(workout_id=f"OLD.{workout_id}")}{_LOG_CHANGE_SQL.format(workout_id=f"NEW.{workout_id}")}
+            END
+            """
+        )
+        cur.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_changes_delete
+            AFTER DELETE ON {table}
+            BEGIN{_LOG_CHANGE_SQL.format(workout_id=f"OLD.{workout_id}")}
+            END
+            """
+        )
+
+    # Existing workouts count as changed once, in ID order
+    cur.execute(
+        """
+        INSERT OR IGNORE INTO workout_changes (workout_id, seq)
+        SELECT id, id FROM workouts
+        """
+    )
+
+
+# A rollup row with no workouts, sets or cardio left in its period
+_EMPTY_ROLLUP_SQL = "workout_count = 0 AND total_sets = 0 AND cardio_workouts = 0"
+
+
+def _drop_empty_rollups(cur):
+    """
+    Delete rollup rows once a delete leaves all of their totals at zero.
+
+    The delete triggers of migrations 5 and 9 only decremented the totals,
+    so periods and exercises with nothing left stayed in the table. The
+    triggers now remove such rows, and the ones already there are deleted.
+    A period's total_volume is reset to exactly 0 with its last set instead
+    of keeping the rounding error of the subtractions.
+    """
+    old_start = _PERIOD_START_SQL.format(period="p.period", date="OLD.date")
+    period_start = _PERIOD_START_SQL.format(period="p.period", date="ws.date")
+
+    cur.execute("DROP TRIGGER IF EXISTS trg_workouts_rollups_delete")
+    cur.execute(
+        f"""
+        CREATE TRIGGER trg_workouts_rollups_delete
+        AFTER DELETE ON workouts
+        BEGIN
+            UPDATE rollups SET workout_count = workout_count - 1
+            WHERE exercise_name = ''
+            AND (period, period_start) IN (
+                SELECT p.period, {old_start} FROM {_PERIODS_SQL} p
+            );
+            DELETE FROM rollups
+            WHERE exercise_name = ''
+            AND (period, period_start) IN (
+                SELECT p.period, {old_start} FROM {_PERIODS_SQL} p
+            )
+            AND {_EMPTY_ROLLUP_SQL};
+        END
+        """
+    )
+
+    set_periods = f"""(
+                SELECT p.period, {period_start}
+                FROM workout_summary ws, {_PERIODS_SQL} p
+                WHERE ws.workout_id = OLD.workout_id
+            )"""
+
+    cur.execute("DROP TRIGGER IF EXISTS trg_sets_rollups_delete")
+    cur.execute(
+        f"""
+        CREATE TRIGGER trg_sets_rollups_delete
+        AFTER DELETE ON sets
+        BEGIN
+            UPDATE rollups SET
+                total_volume = CASE total_sets
+                    WHEN 1 THEN 0
+                    ELSE total_volume - OLD.reps * OLD.weight
+                END,
+                total_sets = total_sets - 1,
+                total_reps = total_reps - OLD.reps
+            WHERE exercise_name IN (
+                '', (SELECT name FROM exercises WHERE id = OLD.exercise_id)
+            )
+            AND (period, period_start) IN {set_periods};
+            DELETE FROM rollups
+            WHERE exercise_name IN (
+                '', (SELECT name FROM exercises WHERE id = OLD.exercise_id)
+            )
+            AND (period, period_start) IN {set_periods}
+            AND {_EMPTY_ROLLUP_SQL};
+        END
+        """
+    )
+
+    cur.execute("DROP TRIGGER IF EXISTS trg_cardio_rollups_delete")
+    cur.execute(
+        f"""
+        CREATE TRIGGER trg_cardio_rollups_delete
+        AFTER DELETE ON cardio_sessions
+        BEGIN
+            UPDATE rollups SET
+                cardio_minutes = cardio_minutes - OLD.minutes,
+                cardio_workouts = cardio_workouts - NOT EXISTS (
+                    SELECT 1 FROM cardio_sessions c WHERE c.workout_id = OLD.workout_id
+                )
+            WHERE exercise_name = ''
+            AND (period, period_start) IN {set_periods};
+            DELETE FROM rollups
+            WHERE exercise_name = ''
+            AND (period, period_start) IN {set_periods}
+            AND {_EMPTY_ROLLUP_SQL};
+        END
+        """
+    )
+
+    cur.execute(f"DELETE FROM rollups WHERE {_EMPTY_ROLLUP_SQL}")
+
+
+# Ordered list of (version, description, apply). Never edit or renumber a
+# released migration; add a new one with the next version instead.
+MIGRATIONS = [
+    (1, "Index workouts by date and type", _add_workout_indexes),
+    (2, "Covering indexes on sets", _add_set_indexes),
+    (3, "Covering index on cardio_sessions", _add_cardio_indexes),
+    (4, "Trigger-maintained personal_records table", _add_personal_records),
+    (5, "Trigger-maintained weekly/monthly rollups", _add_rollups),
+    (6, "Trigger-maintained workout_summary table", _add_workout_summary),
+    (7, "Exercises table referenced by sets.exercise_id", _add_exercises),
+    (8, "Integer day numbers for workout dates", _add_day_numbers),
+    (9, "Cascade deletes from workouts to sets and cardio", _add_cascading_foreign_keys),
+    (10, "Stored volume and e1RM columns on sets", _add_set_volume_e1rm),
+    (11, "Trigger-maintained workout_changes log", _add_workout_changes),
+    (12, "Delete rollup rows whose totals drop to zero", _drop_empty_rollups),
+]
+
+# Schema version a fully migrated database reports
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn):
+    """Return the schema version stored in the database file."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn, target=LATEST_VERSION):
+    """
+    Upgrade a database in place to the target schema version.
+
+    Args:
+        conn: Open SQLite connection
+        target: Version to migrate to (default: latest)
+
+    Returns:
+        List of migration versions that were applied
+    """
+    conn.commit()  # Each migration runs in its own explicit transaction
+    current = get_schema_version(conn)
+    applied = []
+
+    # Table rebuilds drop and recreate child tables, which must not cascade
+    # or fail constraint checks halfway through; the pragma cannot be
+    # changed inside a transaction
+    foreign_keys = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+    conn.execute("PRAGMA foreign_keys = OFF")
+
+    try:
+        for version, description, apply in MIGRATIONS:
+            if version <= current or version > target:
+                continue
+
+            cur = conn.cursor()
+            cur.execute("BEGIN")
+            try:
+                apply(cur)
+                cur.execute(f"PRAGMA user_version = {int(version)}")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            applied.append(version)
+    finally:
+        conn.execute(f"PRAGMA foreign_keys = {int(foreign_keys)}")
+
+    return applied
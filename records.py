@@ -0,0 +1,107 @@
+# workout_tracker/services/records.py
+
+"""
+Compact record types returned by the services.
+
+Records are named tuples: one small fixed-size object per row instead of a
+dict per row. Fields can be read as attributes (`workout.date`), which is
+the fastest way, or by name like a dict (`workout['date']`,
+`workout.get('notes')`), so code written against the old dict results keeps
+working. `dict(record)` or `record.to_dict()` gives a real dict when one is
+needed, e.g. to modify it or to serialize it.
+"""
+
+from collections import namedtuple
+
+
+class _DictCompat:
+    """
+    Read-only mapping access by field name for named tuple records.
+
+    Lookups by name (`record['date']`, `record.get('date')`), `'date' in
+    record`, `keys()` and `items()` behave like a dict. Everything else is
+    still the tuple's: iteration, `len()` and indexing by position act on
+    the values, `==` compares with tuples rather than dicts, and
+    `json.dumps()` writes a list. Use `to_dict()` for any of those.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key):
+        """Return True if `key` is a field name, as `key in dict` would."""
+        return key in self._fields
+
+    def get(self, key, default=None):
+        """Return a field by name, or `default` if there is no such field."""
+        return getattr(self, key) if key in self._fields else default
+
+    def keys(self):
+        """Return the field names, so that dict(record) works."""
+        return self._fields
+
+    def items(self):
+        """Return (field name, value) pairs."""
+        return zip(self._fields, self)
+
+    def to_dict(self):
+        """Return the record as a new plain dict."""
+        return dict(zip(self._fields, self))
+
+
+class Workout(_DictCompat, namedtuple('Workout', 'id date workout_type notes')):
+    """A row of the workouts table."""
+    __slots__ = ()
+
+
+class WorkoutSummary(_DictCompat, namedtuple(
+        'WorkoutSummary',
+        'id date workout_type notes total_sets total_volume cardio_minutes')):
+    """A workout with its set and cardio totals (see workout_summary_query())."""
+    __slots__ = ()
+
+
+class SetRecord(_DictCompat, namedtuple(
+        'SetRecord', 'exercise_name set_number reps weight rpe')):
+    """One logged set of a workout."""
+    __slots__ = ()
+
+
+class CardioSession(_DictCompat, namedtuple('CardioSession', 'cardio_type minutes')):
+    """One cardio session of a workout."""
+    __slots__ = ()
+
+
+class ProgressionPoint(_DictCompat, namedtuple(
+        'ProgressionPoint', 'date estimated_1rm actual_weight reps rpe')):
+    """Estimated 1RM of one set, for get_estimated_1rm_progression()."""
+    __slots__ = ()
+
+
+class DailyEstimate(_DictCompat, namedtuple('DailyEstimate', 'date estimated_1rm sets')):
+    """Estimated 1RM of one exercise on one day, for get_daily_estimated_1rm()."""
+    __slots__ = ()
+
+
+def row_factory(record_type):
+    """
+    Return a sqlite3 row factory that builds `record_type` records.
+
+    Columns are mapped to fields by position, so the query must select them
+    in field order.
+
+    Usage:
+        cur.row_factory = row_factory(WorkoutSummary)
+    """
+    make = record_type._make
+
+    def factory(cursor, row):
+        return make(row)
+
+    return factory
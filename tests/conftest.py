@@ -0,0 +1,76 @@
+# tests/conftest.py
+
+"""Shared fixtures for the Workout Tracker tests."""
+
+import pytest
+
+from workout_tracker import db
+from workout_tracker.services.cache import clear_cache, set_cache_enabled
+from workout_tracker.services.workout_service import save_workout
+
+
+@pytest.fixture
+def setup_database(tmp_path):
+    """
+    Point the shared connection pool at a fresh, fully migrated database
+    file for the duration of a test.
+
+    Yields:
+        Path to the database file
+    """
+    previous_path, previous_profile = db.DB_PATH, db.PROFILE
+    db_path = tmp_path / "workouts.db"
+    db.configure_pool(db_path=db_path)
+    try:
+        db.create_tables()
+        yield db_path
+    finally:
+        db.configure_pool(db_path=previous_path, profile=previous_profile)
+
+
+@pytest.fixture
+def sample_workouts(setup_database):
+    """
+    Save a few workouts with sets and cardio, two of them on the same day.
+
+    Returns:
+        List of the saved workout IDs, in save order
+    """
+    return [
+        save_workout(
+            "2024-01-01", "Push",
+            [
+                {'exercise_name': "Bench Press", 'set_number': 1, 'reps': 5, 'weight': 185.0, 'rpe': 8.0},
+                {'exercise_name': "Bench Press", 'set_number': 2, 'reps': 5, 'weight': 190.0},
+                {'exercise_name': "Overhead Press", 'set_number': 1, 'reps': 8, 'weight': 95.0},
+            ],
+            cardio_minutes=20, cardio_type="Running", notes="Felt strong"
+        ),
+        save_workout(
+            "2024-01-03", "Pull",
+            [
+                {'exercise_name': "Barbell Row", 'set_number': 1, 'reps': 8, 'weight': 135.0},
+                {'exercise_name': "Barbell Row", 'set_number': 2, 'reps': 8, 'weight': 135.0},
+            ]
+        ),
+        save_workout(
+            "2024-01-03", "Cardio", [],
+            cardio_minutes=45, cardio_type="Cycling"
+        ),
+        save_workout(
+            "2024-01-08", "Push",
+            [
+                {'exercise_name': "Bench Press", 'set_number': 1, 'reps': 3, 'weight': 200.0, 'rpe': 9.5},
+            ]
+        ),
+    ]
+
+
+@pytest.fixture
+def query_cache():
+    """Turn the query cache on and empty it for the duration of a test."""
+    previous = set_cache_enabled(True)
+    clear_cache()
+    yield
+    set_cache_enabled(previous)
+    clear_cache()
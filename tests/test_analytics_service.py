@@ -0,0 +1,58 @@
+# tests/test_analytics_service.py
+
+"""Tests for the analytics queries."""
+
+import pytest
+
+from workout_tracker.services.analytics_service import (
+    get_estimated_1rm_progression,
+    get_estimated_1rm_records,
+    get_workout_records,
+)
+from workout_tracker.services.workout_service import save_workout
+
+
+def _bench(date, weight, reps=5):
+    """Save a one-set Bench Press workout and return its ID."""
+    return save_workout(
+        date, "Push",
+        [{'exercise_name': "Bench Press", 'set_number': 1, 'reps': reps, 'weight': weight}]
+    )
+
+
+def test_workout_records_reports_new_records(setup_database):
+    _bench("2024-01-01", 185.0)
+    later = _bench("2024-01-10", 205.0)
+
+    records = get_workout_records(later)
+
+    assert {(r['max_weight'], r['rep_count']) for r in records} == {(205.0, 0), (205.0, 5)}
+
+
+def test_workout_records_skips_first_session(setup_database):
+    assert get_workout_records(_bench("2024-01-10", 185.0)) == []
+
+
+def test_workout_records_skips_back_dated_first_session(setup_database):
+    """Only earlier workouts count as history, not later-dated ones."""
+    _bench("2024-01-10", 185.0)
+    back_dated = _bench("2024-01-01", 205.0)
+
+    assert get_workout_records(back_dated) == []
+
+
+@pytest.mark.parametrize("dates", [
+    ("2024-01-01", "2024-01-10"),
+    ("2024-01-10", "2024-01-01"),
+])
+def test_estimated_1rm_record_ties_go_to_earliest_date(setup_database, dates):
+    """Whichever order equal sets are saved in, the earliest one holds the record."""
+    for date in dates:
+        _bench(date, 100.0)
+
+    record, = get_estimated_1rm_records("Bench Press")
+
+    assert record['date'] == "2024-01-01"
+    # Rounded like the progression: 100 * (1 + 5/30) = 116.666...
+    assert record['estimated_1rm'] == 116.67
+    assert get_estimated_1rm_progression("Bench Press")[0].estimated_1rm == 116.67
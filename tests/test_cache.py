@@ -0,0 +1,108 @@
+# tests/test_cache.py
+
+"""Tests for the query result cache."""
+
+import sqlite3
+from datetime import date
+
+from workout_tracker.services import cache
+from workout_tracker.services.cache import QueryCache, cache_stats, cached, set_cache_enabled
+from workout_tracker.services.workout_service import get_workout_types, save_workout
+
+calls = []
+
+
+@cached
+def _numbers(count):
+    """A cached function that records each time it really runs."""
+    calls.append(count)
+    return [{'value': n, 'tags': [n]} for n in range(count)]
+
+
+def test_repeated_calls_hit_the_cache(setup_database, query_cache):
+    calls.clear()
+
+    assert _numbers(3) == _numbers(3)
+    _numbers(2)
+
+    assert calls == [3, 2]
+    stats = cache_stats()
+    assert (stats['hits'], stats['misses'], stats['size']) == (1, 2, 2)
+
+
+def test_results_are_copies(setup_database, query_cache):
+    """Mutating a returned result does not change what later calls get."""
+    first = _numbers(2)
+    first[0]['value'] = 99
+    first[1]['tags'].append(99)
+    first.append(None)
+
+    assert _numbers(2) == [{'value': 0, 'tags': [0]}, {'value': 1, 'tags': [1]}]
+
+
+def test_pool_write_invalidates(setup_database, query_cache):
+    assert get_workout_types() == []
+
+    save_workout("2024-01-01", "Push", [])
+
+    assert get_workout_types() == ["Push"]
+    assert cache_stats()['invalidations'] == 1
+
+
+def test_write_from_another_connection_invalidates(setup_database, query_cache):
+    """Commits outside the pool are seen through PRAGMA data_version."""
+    assert get_workout_types() == []
+
+    conn = sqlite3.connect(setup_database)
+    try:
+        conn.execute("INSERT INTO workouts (date, workout_type) VALUES ('2024-01-01', 'Legs')")
+        conn.commit()
+    finally:
+        conn.close()
+
+    assert get_workout_types() == ["Legs"]
+
+
+def test_new_day_invalidates(setup_database, query_cache, monkeypatch):
+    calls.clear()
+    _numbers(1)
+
+    tomorrow = date.fromordinal(date.today().toordinal() + 1)
+
+    class Tomorrow:
+        @staticmethod
+        def today():
+            return tomorrow
+
+    monkeypatch.setattr(cache, "date", Tomorrow)
+    _numbers(1)
+
+    assert calls == [1, 1]
+    assert cache_stats()['invalidations'] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    lru = QueryCache(maxsize=2, enabled=True)
+    version = (0, 0, 0)
+    lru.get('a', version)
+    lru.put('a', version, 1)
+    lru.put('b', version, 2)
+    lru.get('a', version)  # 'b' is now the least recently used
+
+    lru.put('c', version, 3)
+
+    assert lru.get('a', version) == (True, 1)
+    assert lru.get('b', version) == (False, None)
+    assert lru.get('c', version) == (True, 3)
+    assert lru.stats()['evictions'] == 1
+
+
+def test_disabled_cache_always_calls_through(setup_database, query_cache):
+    calls.clear()
+    set_cache_enabled(False)
+
+    _numbers(1)
+    _numbers(1)
+
+    assert calls == [1, 1]
+    assert cache_stats()['size'] == 0
@@ -0,0 +1,58 @@
+# tests/test_db.py
+
+"""Tests for the SQLite connection pool."""
+
+import threading
+
+import pytest
+
+from workout_tracker.db import ConnectionPool
+
+
+def test_pool_bounds_checked_out_connections(setup_database):
+    """A caller beyond `size` waits until a connection is released."""
+    pool = ConnectionPool(size=2)
+    first, second = pool.acquire(), pool.acquire()
+    acquired = threading.Event()
+
+    def borrow():
+        conn = pool.acquire()
+        acquired.set()
+        pool.release(conn)
+
+    waiter = threading.Thread(target=borrow)
+    waiter.start()
+    try:
+        assert not acquired.wait(0.2)
+        pool.release(first)
+        assert acquired.wait(5)
+    finally:
+        waiter.join(5)
+        pool.release(second)
+        pool.close()
+
+
+def test_pool_reuses_connections(setup_database):
+    pool = ConnectionPool(size=2)
+    try:
+        with pool.connection() as conn:
+            pass
+        with pool.connection() as again:
+            assert again is conn
+    finally:
+        pool.close()
+
+
+def test_failed_open_frees_its_slot(setup_database):
+    def fail():
+        raise OSError("disk full")
+
+    pool = ConnectionPool(size=1, factory=fail)
+    for _ in range(2):
+        with pytest.raises(OSError):
+            pool.acquire()
+
+
+def test_pool_size_must_be_positive():
+    with pytest.raises(ValueError):
+        ConnectionPool(size=0)
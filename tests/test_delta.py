@@ -0,0 +1,86 @@
+# tests/test_delta.py
+
+"""Tests for the incremental JSON Lines backups."""
+
+import json
+
+import pytest
+
+from workout_tracker import delta
+from workout_tracker.db import connection
+from workout_tracker.services.workout_service import delete_workout, save_workout
+
+
+def _snapshot_lines(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read().splitlines()
+
+
+def _full_dump(directory):
+    """Back up the whole database into `directory` and return its snapshot lines."""
+    delta.export_delta(directory, since=0)
+    return _snapshot_lines(delta.compact(directory)['snapshot_file'])
+
+
+def test_deltas_compact_to_a_full_dump(sample_workouts, tmp_path):
+    backups = tmp_path / "backups"
+    first = delta.export_delta(backups)
+    assert first['workouts'] == len(sample_workouts)
+    assert first['since'] == 0
+    assert delta.export_delta(backups)['delta_file'] is None
+
+    with connection() as conn:
+        conn.execute("UPDATE workouts SET notes = 'Edited' WHERE id = ?", (sample_workouts[1],))
+    delete_workout(sample_workouts[2])
+    added = save_workout("2024-01-09", "Legs", [
+        {'exercise_name': "Squat", 'set_number': 1, 'reps': 5, 'weight': 225.0},
+    ])
+    second = delta.export_delta(backups)
+    assert (second['since'], second['workouts'], second['deleted']) == (first['watermark'], 2, 1)
+    assert delta.get_watermark(backups) == second['watermark']
+
+    result = delta.compact(backups)
+
+    assert result['deltas'] == 2
+    assert result['workouts'] == len(sample_workouts)
+    assert [path.name for path in backups.iterdir()] == [
+        f"snapshot_{second['watermark']:012d}.jsonl"
+    ]
+    lines = _snapshot_lines(result['snapshot_file'])
+    assert lines == _full_dump(tmp_path / "full")
+
+    records = {record['workout']['id']: record for record in map(json.loads, lines)}
+    assert sample_workouts[2] not in records
+    assert records[sample_workouts[1]]['workout']['notes'] == "Edited"
+    assert records[added]['sets'][0]['exercise_name'] == "Squat"
+    assert list(records) == sorted(records)
+
+
+def test_compact_merges_into_existing_snapshot(sample_workouts, tmp_path):
+    delta.export_delta(tmp_path / "backups", compression='gzip')
+    delta.compact(tmp_path / "backups")
+
+    delete_workout(sample_workouts[0])
+    delta.export_delta(tmp_path / "backups", compression='gzip')
+    result = delta.compact(tmp_path / "backups", compression='gzip')
+
+    assert result['snapshot_file'].endswith(".jsonl.gz")
+    assert [record['workout']['id'] for _, record, _ in delta._read_lines(result['snapshot_file'])] == (
+        sample_workouts[1:]
+    )
+
+
+def test_compact_refuses_a_gap(sample_workouts, tmp_path):
+    backups = tmp_path / "backups"
+    first = delta.export_delta(backups)
+    delete_workout(sample_workouts[0])
+    second = delta.export_delta(backups)
+    delete_workout(sample_workouts[1])
+    delta.export_delta(backups)
+
+    (backups / second['delta_file']).unlink()
+
+    with pytest.raises(ValueError, match="Missing delta"):
+        delta.compact(backups)
+    assert delta.get_watermark(backups) > first['watermark']
+    assert len(list(backups.iterdir())) == 2
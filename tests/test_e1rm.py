@@ -0,0 +1,85 @@
+# tests/test_e1rm.py
+
+"""Tests for the e1RM formulas and the vectorized engine."""
+
+import math
+
+import pytest
+
+from workout_tracker.services.e1rm import FORMULAS, estimate_1rm, estimate_one, reduce_by_day
+
+
+@pytest.mark.parametrize("formula, expected", [
+    ('epley', 200 * (1 + 5 / 30)),       # 233.33
+    ('brzycki', 200 * 36 / 32),          # 225.0
+    ('lombardi', 200 * 5 ** 0.10),       # 234.92
+    ('oconner', 200 * (1 + 5 / 40)),     # 225.0
+    ('rpe', 200 / 0.863),                # 5 reps to failure: 231.75
+])
+def test_formulas_for_five_reps_with_200(formula, expected):
+    assert estimate_one(200.0, 5, formula=formula) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("rpe, percent", [
+    (10, 0.863),                        # 5 reps to failure
+    (8, 0.811),                         # 7 reps to failure
+    (8.5, (0.837 + 0.811) / 2),         # 6.5 reps, interpolated
+    (None, 0.863),                      # no RPE counts as RPE 10
+])
+def test_rpe_chart(rpe, percent):
+    assert estimate_one(200.0, 5, rpe=rpe, formula='rpe') == pytest.approx(200 / percent)
+
+
+@pytest.mark.parametrize("formula", ['epley', 'brzycki', 'lombardi', 'oconner'])
+def test_single_rep_is_the_1rm(formula):
+    assert estimate_one(315.0, 1, formula=formula) == 315.0
+
+
+def test_brzycki_is_undefined_from_37_reps():
+    assert math.isnan(estimate_one(50.0, 37, formula='brzycki'))
+
+
+def test_unknown_formula():
+    with pytest.raises(ValueError):
+        estimate_one(100.0, 5, formula='wathan')
+
+
+@pytest.mark.parametrize("formula", FORMULAS)
+def test_vectorized_matches_scalar(formula):
+    pytest.importorskip("numpy")
+    sets = [
+        (weight, reps, rpe)
+        for weight in (45.0, 135.0, 402.5)
+        for reps in (1, 2, 5, 8, 12, 15, 40)
+        for rpe in (None, 6.0, 7.5, 10.0)
+    ]
+    weights, reps, rpes = zip(*sets)
+
+    estimates = estimate_1rm(weights, reps, rpes, formula=formula)
+
+    expected = [estimate_one(w, r, rpe, formula) for w, r, rpe in sets]
+    assert estimates.tolist() == pytest.approx(expected, nan_ok=True)
+
+
+@pytest.mark.parametrize("how, expected", [
+    ('max', [120.0, 110.0, 90.0]),
+    ('mean', [110.0, 110.0, 90.0]),
+    ('min', [100.0, 110.0, 90.0]),
+])
+def test_reduce_by_day(how, expected):
+    pytest.importorskip("numpy")
+    groups = [2, 1, 1, 1, 1]
+    days = [19000, 19001, 19000, 19000, 19000]
+    values = [90.0, 110.0, 100.0, 120.0, math.nan]
+
+    out_groups, out_days, reduced, counts = reduce_by_day(groups, days, values, how)
+
+    assert out_groups.tolist() == [1, 1, 2]
+    assert out_days.tolist() == [19000, 19001, 19000]
+    assert reduced.tolist() == expected
+    assert counts.tolist() == [2, 1, 1]
+
+
+def test_reduce_by_day_unknown_reduction():
+    with pytest.raises(ValueError):
+        reduce_by_day([1], [1], [1.0], 'median')
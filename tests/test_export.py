@@ -0,0 +1,277 @@
+# tests/test_export.py
+
+"""Tests for the CSV exporters."""
+
+import csv
+import hashlib
+import io
+import json
+import tracemalloc
+from datetime import date
+
+import pytest
+
+from workout_tracker import export
+from workout_tracker.columnar import FORMATS, load_export, read_export
+from workout_tracker.db import connection
+from workout_tracker.export import (
+    CARDIO_HEADER,
+    COMPRESSIONS,
+    MANIFEST_VERSION,
+    SETS_HEADER,
+    _SETS_EXPORT_SQL,
+    compression_for,
+    export_all_data,
+    export_cardio_to_csv,
+    export_exercise_data,
+    export_sets_to_csv,
+    open_csv,
+)
+from workout_tracker.migrations import LATEST_VERSION
+from workout_tracker.services.workout_service import save_workout, save_workouts
+
+
+def _save_history(workouts, sets_per_workout=10):
+    """Bulk-save `workouts` workouts, two per day, with the same sets each."""
+    save_workouts(
+        {
+            'date': f"{2000 + i // 730}-{(i // 60) % 12 + 1:02d}-{(i // 2) % 28 + 1:02d}",
+            'workout_type': "Push",
+            'sets_data': [
+                {'exercise_name': f"Exercise {n % 4}", 'set_number': n + 1,
+                 'reps': 5, 'weight': 100.0 + n, 'rpe': 8.0 if n % 2 else None}
+                for n in range(sets_per_workout)
+            ],
+        }
+        for i in range(workouts)
+    )
+
+
+def _export_peak(path):
+    """Export all sets and return (rows exported, peak traced bytes)."""
+    tracemalloc.start()
+    try:
+        count = export_sets_to_csv(path)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return count, peak
+
+
+def test_sets_export_order_and_contents(sample_workouts, tmp_path):
+    """Sets are written newest date first, then by set id."""
+    path = tmp_path / "sets.csv"
+
+    assert export_sets_to_csv(path) == 6
+
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    keys = [(row['Date'], -int(row['Set ID'])) for row in rows]
+    assert keys == sorted(keys, reverse=True)
+    assert rows[0]['Exercise'] == "Bench Press"
+    assert rows[0]['RPE'] == "9.5"
+    assert rows[-1]['RPE'] == ""
+
+
+def test_sets_export_plan_sorts_one_date_at_a_time(setup_database):
+    """The export never sorts the whole sets table in a temp B-tree."""
+    with connection() as conn:
+        conn.execute("ANALYZE")
+        plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {_SETS_EXPORT_SQL}")]
+
+    assert plan[0].startswith("SCAN w USING")
+    assert "USE TEMP B-TREE FOR ORDER BY" not in plan
+
+
+def test_sets_export_memory_does_not_grow(setup_database, tmp_path):
+    """Peak Python memory stays flat as the number of exported sets grows."""
+    _save_history(200)
+    small_count, small_peak = _export_peak(tmp_path / "small.csv")
+    _save_history(1800)
+    large_count, large_peak = _export_peak(tmp_path / "large.csv")
+
+    assert (small_count, large_count) == (2000, 20000)
+    # Fetching every row at once would take several MB for 20,000 sets
+    assert large_peak < 2 * 1024 * 1024
+    assert large_peak < small_peak * 1.5
+
+
+def _csv_text(header, rows):
+    """Write rows the way the original exporters did, with csv.writer."""
+    out = io.StringIO(newline='')
+    writer = csv.writer(out)
+    writer.writerow(header)
+    writer.writerows(rows)
+    return out.getvalue()
+
+
+def test_edge_values_match_original_formatting(setup_database, tmp_path):
+    """RPE 0 is written as an empty field; an empty cardio type as 'General'."""
+    workout_id = save_workout(
+        "2024-02-01", "Push",
+        [
+            {'exercise_name': "Squat", 'set_number': 1, 'reps': 5, 'weight': 225.0, 'rpe': 0},
+            {'exercise_name': "Squat", 'set_number': 2, 'reps': 5, 'weight': 225.0},
+            {'exercise_name': "Squat", 'set_number': 3, 'reps': 3, 'weight': 245.0, 'rpe': 8.5},
+        ]
+    )
+    with connection() as conn:
+        conn.executemany(
+            "INSERT INTO cardio_sessions (workout_id, cardio_type, minutes) VALUES (?, ?, ?)",
+            [(workout_id, '', 10), (workout_id, None, 15), (workout_id, "Rowing", 20)]
+        )
+        sets = conn.execute(
+            """
+            SELECT s.id, s.workout_id, w.date, w.workout_type, e.name,
+                s.set_number, s.reps, s.weight, s.rpe, w.notes
+            FROM sets s
+            JOIN workouts w ON s.workout_id = w.id
+            JOIN exercises e ON s.exercise_id = e.id
+            ORDER BY s.id
+            """
+        ).fetchall()
+        cardio = conn.execute(
+            """
+            SELECT c.id, c.workout_id, w.date, w.workout_type, c.cardio_type, c.minutes
+            FROM cardio_sessions c JOIN workouts w ON c.workout_id = w.id
+            ORDER BY c.id
+            """
+        ).fetchall()
+
+    export_sets_to_csv(tmp_path / "sets.csv")
+    export_cardio_to_csv(tmp_path / "cardio.csv")
+    export_exercise_data("Squat", tmp_path / "squat.csv")
+
+    def read(name):
+        with open(tmp_path / name, newline='', encoding='utf-8') as f:
+            return f.read()
+
+    assert read("sets.csv") == _csv_text(SETS_HEADER, [
+        (*row[:8], row[8] if row[8] else '') for row in sets
+    ])
+    assert read("cardio.csv") == _csv_text(CARDIO_HEADER, [
+        (*row[:4], row[4] or 'General', row[5]) for row in cardio
+    ])
+    exercise_header = [
+        'Set ID', 'Date', 'Workout Type', 'Exercise', 'Set Number', 'Reps',
+        'Weight (lbs)', 'RPE', 'Workout Notes',
+    ]
+    assert read("squat.csv") == _csv_text(exercise_header, [
+        (row[0], *row[2:8], row[8] if row[8] else '', row[9] or '') for row in sets
+    ])
+
+
+def test_manifest_counts_and_checksums(sample_workouts, tmp_path):
+    result = export_all_data(tmp_path)
+
+    with open(result['manifest_file'], encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    assert manifest['version'] == MANIFEST_VERSION
+    assert manifest['schema_version'] == LATEST_VERSION
+    assert (manifest['format'], manifest['compression']) == ('csv', None)
+    assert set(manifest['files']) == {'workouts', 'sets', 'cardio'}
+    for name, rows in (('workouts', 4), ('sets', 6), ('cardio', 2)):
+        entry = manifest['files'][name]
+        path = tmp_path / entry['file']
+        assert str(path) == result[f'{name}_file']
+        assert entry['rows'] == result[name] == rows
+        with open(path, newline='', encoding='utf-8') as f:
+            assert sum(1 for _ in csv.reader(f)) == rows + 1
+        assert entry['sha256'] == hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@pytest.mark.parametrize("format", ['parquet', 'arrow'])
+def test_columnar_round_trip(sample_workouts, tmp_path, format):
+    """Typed exports read back with the same values, nulls and dates."""
+    pytest.importorskip("pyarrow")
+    result = export_all_data(tmp_path, format=format)
+
+    sets = read_export(result['sets_file'])
+    assert sets.num_rows == result['sets'] == 6
+    assert sets.column_names == [
+        'set_id', 'workout_id', 'date', 'workout_type', 'exercise',
+        'set_number', 'reps', 'weight', 'rpe',
+    ]
+    first = sets.slice(0, 1).to_pylist()[0]
+    assert first['date'] == date(2024, 1, 8)
+    assert (first['exercise'], first['reps'], first['weight'], first['rpe']) == (
+        "Bench Press", 3, 200.0, 9.5
+    )
+    assert sets.column('rpe').null_count == 4
+
+    with open(export_all_data(tmp_path / "csv")['sets_file'], newline='') as f:
+        csv_rows = list(csv.reader(f))[1:]
+    assert [str(row['set_id']) for row in sets.to_pylist()] == [row[0] for row in csv_rows]
+
+    workouts = read_export(result['workouts_file'], columns=['workout_id', 'notes', 'cardio_minutes'])
+    assert workouts.to_pylist()[-1] == {
+        'workout_id': sample_workouts[0], 'notes': "Felt strong", 'cardio_minutes': 20,
+    }
+
+    bench = tmp_path / f"bench{FORMATS[format]}"
+    assert export_exercise_data("Bench Press", bench, format=format) == 3
+    assert read_export(bench).column('exercise').to_pylist() == ["Bench Press"] * 3
+
+
+def test_columnar_export_loads_into_pandas(sample_workouts, tmp_path):
+    pytest.importorskip("pyarrow")
+    pytest.importorskip("pandas")
+    result = export_all_data(tmp_path, format='parquet')
+
+    frame = load_export(result['sets_file'])
+
+    assert len(frame) == 6
+    assert frame['exercise'].dtype == 'category'
+    assert str(frame['date'].dtype).startswith('datetime64')
+
+
+def test_columnar_export_without_pyarrow_fails_early(setup_database, tmp_path, monkeypatch):
+    from workout_tracker import columnar
+    monkeypatch.setattr(columnar, "pyarrow_available", lambda: False)
+
+    with pytest.raises(ImportError):
+        export_all_data(tmp_path / "out", format='parquet')
+    assert not (tmp_path / "out").exists()
+
+
+@pytest.mark.parametrize("compression", list(COMPRESSIONS))
+def test_compressed_csv_round_trip(sample_workouts, tmp_path, compression):
+    """Compressed exports decompress to exactly the plain CSV export."""
+    if compression == 'zstd' and export._zstd() is None:
+        pytest.skip("no zstd module")
+    plain = export_all_data(tmp_path / "plain")
+    packed = export_all_data(tmp_path / "packed", compression=compression)
+
+    assert packed['sets'] == plain['sets'] == 6
+    for name in ('workouts_file', 'sets_file', 'cardio_file'):
+        assert packed[name].endswith(".csv" + COMPRESSIONS[compression])
+        assert compression_for(packed[name]) == compression
+        with open_csv(packed[name], 'r', compression) as f:
+            text = f.read()
+        with open(plain[name], newline='', encoding='utf-8') as f:
+            assert text == f.read()
+
+    with open(packed['sets_file'], 'rb') as f:
+        assert b"Bench Press" not in f.read()
+
+
+@pytest.mark.parametrize("format, compression", [
+    ('xlsx', None),
+    ('csv', 'bz2'),
+    ('arrow', 'gzip'),
+    ('parquet', 'xz'),
+])
+def test_unsupported_format_or_codec(setup_database, tmp_path, format, compression):
+    """Bad combinations are rejected before any output is written."""
+    if format in ('arrow', 'parquet'):
+        pytest.importorskip("pyarrow")
+    out = tmp_path / "out"
+    out.mkdir()
+
+    with pytest.raises(ValueError):
+        export_all_data(out / "all", format=format, compression=compression)
+    with pytest.raises(ValueError):
+        export_exercise_data("Bench Press", out / "bench", format=format, compression=compression)
+
+    assert list(out.iterdir()) == []
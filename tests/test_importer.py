@@ -0,0 +1,110 @@
+# tests/test_importer.py
+
+"""Tests for restoring exported backups with the streaming importer."""
+
+import pytest
+
+from workout_tracker import db
+from workout_tracker.db import connection
+from workout_tracker.export import export_all_data
+from workout_tracker.importer import import_all_data, import_sets_csv
+from workout_tracker.services.workout_service import save_workout
+
+
+def _history():
+    """Return every workout with its sets and cardio, independent of IDs."""
+    with connection() as conn:
+        workouts = conn.execute(
+            "SELECT id, date, workout_type, notes FROM workouts"
+        ).fetchall()
+        history = []
+        for workout_id, date, workout_type, notes in workouts:
+            sets = conn.execute(
+                """
+                SELECT e.name, s.set_number, s.reps, s.weight, s.rpe
+                FROM sets s JOIN exercises e ON s.exercise_id = e.id
+                WHERE s.workout_id = ?
+                """,
+                (workout_id,)
+            ).fetchall()
+            cardio = conn.execute(
+                "SELECT cardio_type, minutes FROM cardio_sessions WHERE workout_id = ?",
+                (workout_id,)
+            ).fetchall()
+            history.append((
+                date, workout_type, notes,
+                sorted(tuple(row) for row in sets),
+                sorted(tuple(row) for row in cardio),
+            ))
+    return sorted(history, key=repr)
+
+
+def _use_empty_database(path):
+    """Point the pool at a new, empty database (setup_database restores it)."""
+    db.configure_pool(db_path=path)
+    db.create_tables()
+
+
+@pytest.fixture
+def backup(sample_workouts, tmp_path):
+    """Export the sample workouts; returns (backup directory, their history)."""
+    backup_dir = tmp_path / "backup"
+    export_all_data(backup_dir)
+    return backup_dir, _history()
+
+
+def test_round_trip_into_empty_database(backup, tmp_path):
+    backup_dir, expected = backup
+    _use_empty_database(tmp_path / "restored.db")
+
+    result = import_all_data(backup_dir)
+
+    assert (result['workouts'], result['sets'], result['cardio']) == (4, 6, 2)
+    assert result['duplicates'] == 0
+    assert _history() == expected
+
+
+def test_reimport_adds_nothing(backup):
+    """Every row of a backup of this same database is a duplicate."""
+    backup_dir, expected = backup
+
+    result = import_all_data(backup_dir)
+
+    assert (result['workouts'], result['sets'], result['cardio']) == (0, 0, 0)
+    assert result['duplicates'] == 6 + 2
+    assert _history() == expected
+
+
+def test_same_date_and_type_map_to_different_workouts(setup_database, tmp_path):
+    """Each existing workout is matched by at most one source workout."""
+    for weight in (135.0, 225.0):
+        save_workout(
+            "2024-05-01", "Push",
+            [{'exercise_name': "Bench Press", 'set_number': 1, 'reps': 5, 'weight': weight}]
+        )
+    backup_dir = tmp_path / "backup"
+    export_all_data(backup_dir)
+    expected = _history()
+
+    _use_empty_database(tmp_path / "restored.db")
+    assert import_all_data(backup_dir)['workouts'] == 2
+    assert _history() == expected
+
+    # Matched again on re-import, one existing workout each
+    result = import_all_data(backup_dir)
+    assert (result['workouts'], result['sets'], result['duplicates']) == (0, 0, 2)
+    assert _history() == expected
+
+
+def test_gzip_backup(sample_workouts, tmp_path):
+    backup_dir = tmp_path / "backup"
+    export_all_data(backup_dir, compression='gzip')
+    expected = _history()
+    sets_file, = backup_dir.glob("sets_*.csv.gz")
+
+    _use_empty_database(tmp_path / "restored.db")
+    assert import_sets_csv(sets_file)['sets'] == 6
+
+    _use_empty_database(tmp_path / "restored_all.db")
+    assert import_all_data(backup_dir)['sets'] == 6
+    assert _history() == expected
@@ -0,0 +1,144 @@
+# tests/test_maintenance.py
+
+"""
+Tests that the trigger-maintained tables match a full rebuild.
+
+Each test makes a random mix of writes through the services and plain SQL,
+then compares a derived table with what maintenance.rebuild_*() computes
+from the base tables.
+"""
+
+import random
+
+import pytest
+
+from workout_tracker import maintenance
+from workout_tracker.db import connection
+from workout_tracker.services.workout_service import (
+    delete_workout,
+    delete_workouts,
+    delete_workouts_between,
+    save_workout,
+    save_workouts,
+)
+
+EXERCISES = ["Bench Press", "Squat", "Deadlift", "Barbell Row"]
+WORKOUT_TYPES = ["Push", "Pull", "Legs", "Full Body"]
+
+
+def _random_workout(rng):
+    """Return save_workout() arguments for a random workout in early 2024."""
+    sets = [
+        {
+            'exercise_name': rng.choice(EXERCISES),
+            'set_number': n + 1,
+            'reps': rng.randint(1, 6),
+            # Few distinct weights, so records are often tied
+            'weight': rng.choice([95.0, 135.0, 185.0, 225.0]),
+            'rpe': rng.choice([None, 7.5, 9.0]),
+        }
+        for n in range(rng.randint(0, 5))
+    ]
+    return {
+        'date': f"2024-{rng.randint(1, 3):02d}-{rng.randint(1, 28):02d}",
+        'workout_type': rng.choice(WORKOUT_TYPES),
+        'sets_data': sets,
+        'cardio_minutes': rng.choice([None, None, 20, 35]),
+        'cardio_type': "Running",
+        'notes': rng.choice([None, "Felt good"]),
+    }
+
+
+def _workout_ids():
+    with connection() as conn:
+        return [row[0] for row in conn.execute("SELECT id FROM workouts ORDER BY id")]
+
+
+def _mixed_writes(rng, rounds=40):
+    """Insert, update and delete workouts, sets and cardio sessions at random."""
+    for _ in range(rounds):
+        ids = _workout_ids()
+        action = rng.choice([
+            'save', 'save', 'save_many', 'update', 'delete', 'delete_many',
+            'delete_range', 'cascade', 'delete_set', 'add_cardio',
+        ])
+
+        if action == 'save' or not ids:
+            save_workout(**_random_workout(rng))
+        elif action == 'save_many':
+            save_workouts([_random_workout(rng) for _ in range(rng.randint(2, 6))], batch_size=3)
+        elif action == 'update':
+            with connection() as conn:
+                conn.execute(
+                    "UPDATE workouts SET workout_type = ?, notes = ? WHERE id = ?",
+                    (rng.choice(WORKOUT_TYPES), rng.choice([None, "Edited"]), rng.choice(ids))
+                )
+        elif action == 'delete':
+            delete_workout(rng.choice(ids))
+        elif action == 'delete_many':
+            delete_workouts(rng.sample(ids, min(len(ids), 3)))
+        elif action == 'delete_range':
+            day = rng.randint(1, 27)
+            delete_workouts_between(f"2024-02-{day:02d}", f"2024-02-{day + 1:02d}")
+        elif action == 'cascade':
+            # Sets and cardio go through ON DELETE CASCADE
+            with connection() as conn:
+                conn.execute("DELETE FROM workouts WHERE id = ?", (rng.choice(ids),))
+        elif action == 'delete_set':
+            with connection() as conn:
+                set_ids = [row[0] for row in conn.execute("SELECT id FROM sets ORDER BY id")]
+                if set_ids:
+                    conn.execute("DELETE FROM sets WHERE id = ?", (rng.choice(set_ids),))
+        elif action == 'add_cardio':
+            with connection() as conn:
+                conn.execute(
+                    "INSERT INTO cardio_sessions (workout_id, cardio_type, minutes) VALUES (?, ?, ?)",
+                    (rng.choice(ids), "Cycling", rng.randint(5, 40))
+                )
+
+
+def _table_rows(table):
+    """Return a table's rows sorted, with floats rounded."""
+    with connection() as conn:
+        rows = [
+            tuple(round(value, 6) if isinstance(value, float) else value for value in row)
+            for row in conn.execute(f"SELECT * FROM {table}")
+        ]
+    return sorted(rows, key=repr)
+
+
+@pytest.fixture(params=[1, 2, 3])
+def mixed_history(setup_database, request):
+    """A database after a seeded random mix of writes."""
+    _mixed_writes(random.Random(request.param))
+
+
+def test_personal_records_match_rebuild(mixed_history):
+    maintained = _table_rows("personal_records")
+    assert maintained
+
+    maintenance.rebuild_personal_records()
+
+    assert _table_rows("personal_records") == maintained
+
+
+def test_rollups_match_rebuild(mixed_history):
+    maintained = _table_rows("rollups")
+    assert maintained
+    # The delete triggers remove periods that have nothing left
+    assert all(any(row[3:]) for row in maintained)
+    assert all(value >= 0 for row in maintained for value in row[3:])
+
+    maintenance.rebuild_rollups()
+
+    assert _table_rows("rollups") == maintained
+
+
+def test_workout_summary_matches_rebuild(mixed_history):
+    maintained = _table_rows("workout_summary")
+    assert maintained
+    assert maintenance.check_workout_summary() == []
+
+    maintenance.rebuild_workout_summary()
+
+    assert _table_rows("workout_summary") == maintained
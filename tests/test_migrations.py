@@ -0,0 +1,135 @@
+# tests/test_migrations.py
+
+"""Tests for the versioned schema migrations."""
+
+import pytest
+
+from workout_tracker import db
+from workout_tracker.migrations import LATEST_VERSION, MIGRATIONS, get_schema_version, migrate
+from workout_tracker.services.workout_service import (
+    delete_workout,
+    delete_workouts_between,
+    save_workout,
+)
+
+
+def _snapshot(conn):
+    """Return the schema and the rows of every table of a database."""
+    schema = sorted(
+        tuple(row) for row in conn.execute(
+            """
+            SELECT type, name, tbl_name, sql FROM sqlite_master
+            WHERE name NOT LIKE 'sqlite_autoindex_%'
+            """
+        )
+    )
+
+    tables = {}
+    for (table,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'"):
+        rows = [tuple(row) for row in conn.execute(f'SELECT * FROM "{table}"')]
+        tables[table] = sorted(rows, key=repr)
+
+    return schema, tables
+
+
+@pytest.fixture
+def legacy_connection(tmp_path, monkeypatch):
+    """
+    Open a database with the original, unmigrated schema and some data.
+
+    Yields:
+        Connection to the database at schema version 0
+    """
+    previous_path, previous_profile = db.DB_PATH, db.PROFILE
+    db.configure_pool(db_path=tmp_path / "legacy.db")
+    monkeypatch.setattr(db, "migrate", lambda conn: [])
+    conn = None
+    try:
+        db.create_tables()
+        conn = db.get_connection()
+        conn.executemany(
+            "INSERT INTO workouts (id, date, workout_type, notes) VALUES (?, ?, ?, ?)",
+            [
+                (1, "2024-01-01", "Push", "Felt strong"),
+                (2, "2024-01-03", "Pull", None),
+                (3, "2024-02-05", "Cardio", None),
+            ]
+        )
+        conn.executemany(
+            """
+            INSERT INTO sets (workout_id, exercise_name, set_number, reps, weight, rpe)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (1, "Bench Press", 1, 5, 185.0, 8.0),
+                (1, "Bench Press", 2, 5, 190.0, None),
+                (1, "Overhead Press", 1, 8, 95.0, None),
+                (2, "Barbell Row", 1, 8, 135.0, None),
+                (2, "Barbell Row", 2, 8, 135.0, 9.0),
+            ]
+        )
+        conn.executemany(
+            "INSERT INTO cardio_sessions (workout_id, cardio_type, minutes) VALUES (?, ?, ?)",
+            [(1, "Running", 20), (3, "Cycling", 45)]
+        )
+        conn.commit()
+        yield conn
+    finally:
+        if conn is not None:
+            conn.close()
+        db.configure_pool(db_path=previous_path, profile=previous_profile)
+
+
+@pytest.mark.parametrize(
+    "version, description, apply",
+    MIGRATIONS,
+    ids=[f"v{version}" for version, _, _ in MIGRATIONS]
+)
+def test_migration_is_idempotent(legacy_connection, version, description, apply):
+    """Running a migration a second time leaves the database unchanged."""
+    conn = legacy_connection
+    migrate(conn, target=version - 1)
+    assert migrate(conn, target=version) == [version]
+    before = _snapshot(conn)
+
+    cur = conn.cursor()
+    cur.execute("BEGIN")
+    apply(cur)
+    conn.commit()
+
+    assert _snapshot(conn) == before
+
+
+def test_reapplying_all_migrations_to_latest_schema(setup_database):
+    """A fully migrated database with a stale user_version migrates cleanly."""
+    save_workout(
+        "2024-01-01", "Push",
+        [
+            {'exercise_name': "Bench Press", 'set_number': 1, 'reps': 5, 'weight': 185.0},
+            {'exercise_name': "Bench Press", 'set_number': 2, 'reps': 3, 'weight': 205.0},
+        ],
+        cardio_minutes=15, cardio_type="Rowing"
+    )
+    record_holder = save_workout(
+        "2024-01-02", "Push",
+        [{'exercise_name': "Bench Press", 'set_number': 1, 'reps': 3, 'weight': 215.0}]
+    )
+    save_workout("2024-03-04", "Cardio", [], cardio_minutes=30, cardio_type="Running")
+    save_workout(
+        "2024-03-06", "Legs",
+        [{'exercise_name': "Squat", 'set_number': 1, 'reps': 5, 'weight': 275.0, 'rpe': 8.5}]
+    )
+    delete_workout(record_holder)
+    delete_workouts_between("2024-03-01", "2024-03-05")
+
+    conn = db.get_connection()
+    try:
+        before = _snapshot(conn)
+        conn.execute("PRAGMA user_version = 0")
+
+        assert migrate(conn) == [version for version, _, _ in MIGRATIONS]
+        assert get_schema_version(conn) == LATEST_VERSION
+        assert _snapshot(conn) == before
+        assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+    finally:
+        conn.close()
@@ -0,0 +1,104 @@
+# tests/test_records.py
+
+"""Tests for the record types, their row factory and their dict compatibility."""
+
+import json
+import sqlite3
+
+import pytest
+
+from workout_tracker.services.analytics_service import (
+    get_daily_estimated_1rm,
+    get_estimated_1rm_progression,
+)
+from workout_tracker.services.records import (
+    CardioSession,
+    DailyEstimate,
+    ProgressionPoint,
+    SetRecord,
+    Workout,
+    WorkoutSummary,
+    row_factory,
+)
+from workout_tracker.services.workout_service import get_workout_details, get_workouts
+
+RECORD_TYPES = [Workout, WorkoutSummary, SetRecord, CardioSession, ProgressionPoint, DailyEstimate]
+
+
+@pytest.mark.parametrize("record_type", RECORD_TYPES, ids=lambda t: t.__name__)
+def test_records_are_compact_and_immutable(record_type):
+    record = record_type._make(range(len(record_type._fields)))
+
+    assert not hasattr(record, '__dict__')
+    with pytest.raises(AttributeError):
+        record.extra = 1
+    with pytest.raises(AttributeError):
+        setattr(record, record_type._fields[0], 1)
+
+
+def test_row_factory_builds_records_by_position():
+    conn = sqlite3.connect(":memory:")
+    try:
+        cur = conn.cursor()
+        cur.row_factory = row_factory(SetRecord)
+        cur.execute("SELECT 'Squat', 2, 5, 225.0, NULL UNION ALL SELECT 'Squat', 3, 3, 245.0, 9")
+        rows = cur.fetchall()
+    finally:
+        conn.close()
+
+    assert all(type(row) is SetRecord for row in rows)
+    assert [(row.set_number, row.weight, row.rpe) for row in rows] == [(2, 225.0, None), (3, 245.0, 9)]
+
+
+def test_lookup_by_field_name():
+    workout = Workout(1, "2024-01-01", "Push", None)
+
+    assert workout['date'] == workout.date == "2024-01-01"
+    assert workout.get('notes', "none") is None
+    assert workout.get('missing', "none") == "none"
+    with pytest.raises(KeyError):
+        workout['missing']
+
+
+def test_membership_tests_field_names():
+    """`in` checks field names like a dict, not values like a tuple."""
+    workout = Workout(1, "2024-01-01", "Push", None)
+
+    assert 'workout_type' in workout
+    assert 'missing' not in workout
+    assert "Push" not in workout
+    assert list(workout.keys()) == ['id', 'date', 'workout_type', 'notes']
+
+
+def test_to_dict_for_equality_and_json():
+    """Iteration, == and json.dumps() keep tuple semantics; to_dict() does not."""
+    record = SetRecord("Bench Press", 1, 5, 185.0, None)
+    expected = {
+        'exercise_name': "Bench Press", 'set_number': 1, 'reps': 5, 'weight': 185.0, 'rpe': None,
+    }
+
+    assert list(record) == ["Bench Press", 1, 5, 185.0, None]
+    assert record != expected
+    assert dict(record) == record.to_dict() == dict(record.items()) == expected
+    assert json.loads(json.dumps(record.to_dict())) == expected
+
+
+def test_service_records(sample_workouts):
+    details = get_workout_details(sample_workouts[0])
+
+    assert details['workout']['notes'] == "Felt strong"
+    assert all('rpe' in s for s in details['sets'])
+    assert [s['weight'] for s in details['sets']] == [185.0, 190.0, 95.0]
+
+
+def test_services_return_records(sample_workouts):
+    details = get_workout_details(sample_workouts[0])
+
+    assert all(type(w) is WorkoutSummary for w in get_workouts())
+    assert type(details['workout']) is Workout
+    assert {type(s) for s in details['sets']} == {SetRecord}
+    assert {type(c) for c in details['cardio']} == {CardioSession}
+    assert {type(p) for p in get_estimated_1rm_progression("Bench Press")} == {ProgressionPoint}
+    daily = get_daily_estimated_1rm("Bench Press")["Bench Press"]
+    assert {type(d) for d in daily} == {DailyEstimate}
+    assert [d.date for d in daily] == ["2024-01-01", "2024-01-08"]
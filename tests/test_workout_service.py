@@ -0,0 +1,253 @@
+# tests/test_workout_service.py
+
+"""Tests for workout CRUD operations and the workout history queries."""
+
+import base64
+from datetime import date
+
+import pytest
+
+from workout_tracker.db import connection
+from workout_tracker.services.cache import cache_stats
+from workout_tracker.services.events import (
+    EXERCISE_ADDED,
+    WORKOUT_SAVED,
+    subscribe,
+    unsubscribe,
+)
+from workout_tracker.services.workout_service import (
+    delete_workout,
+    delete_workouts,
+    delete_workouts_between,
+    get_workout_details_many,
+    get_workouts,
+    get_workouts_page,
+    iter_workouts,
+    save_workouts,
+    workout_summary_query,
+)
+
+
+def _naive_totals(workout_id):
+    """Count a workout's sets, volume and cardio minutes one table at a time."""
+    with connection() as conn:
+        total_sets, total_volume = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(reps * weight), 0) FROM sets WHERE workout_id = ?",
+            (workout_id,)
+        ).fetchone()
+        cardio_minutes = conn.execute(
+            "SELECT COALESCE(SUM(minutes), 0) FROM cardio_sessions WHERE workout_id = ?",
+            (workout_id,)
+        ).fetchone()[0]
+    return total_sets, total_volume, cardio_minutes
+
+
+def test_workout_totals_match_naive_counts(sample_workouts):
+    """Several sets and several cardio sessions must not multiply each other."""
+    # A second cardio session next to three sets would double the set
+    # totals of a sets x cardio join
+    with connection() as conn:
+        conn.execute(
+            "INSERT INTO cardio_sessions (workout_id, cardio_type, minutes) VALUES (?, ?, ?)",
+            (sample_workouts[0], "Walking", 10)
+        )
+
+    workouts = get_workouts()
+
+    assert sorted(w.id for w in workouts) == sorted(sample_workouts)
+    for workout in workouts:
+        expected = _naive_totals(workout.id)
+        assert (workout.total_sets, workout.total_volume, workout.cardio_minutes) == expected
+    assert workouts[-1].cardio_minutes == 30
+
+
+def test_workouts_are_newest_first(sample_workouts):
+    """Ties on the same day are ordered by descending id."""
+    first, second, third, fourth = sample_workouts
+
+    assert [w.id for w in get_workouts()] == [fourth, third, second, first]
+
+
+@pytest.mark.parametrize("filters", [
+    {},
+    {'start_date': "2024-01-02", 'end_date': "2024-01-31"},
+    {'workout_type': "Push"},
+    {'workout_type': "Push", 'start_date': "2024-01-02"},
+    {'after': (19725, 3), 'limit': 10},
+    {'workout_type': "Push", 'after': (19725, 3), 'limit': 10},
+])
+def test_summary_query_plan_uses_index_order(setup_database, filters):
+    """History pages are index seeks on workout_summary with no join or sort."""
+    query, params = workout_summary_query(**filters)
+
+    with connection() as conn:
+        plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params)]
+
+    assert len(plan) == 1
+    assert "USING INDEX idx_workout_summary_" in plan[0]
+    assert not any("TEMP B-TREE" in step for step in plan)
+    assert not any("sets" in step or "cardio" in step for step in plan)
+
+
+def test_pages_round_trip(sample_workouts):
+    """Following next_cursor visits every workout once, in history order."""
+    seen = []
+    cursor = None
+    while True:
+        page = get_workouts_page(cursor, limit=1)
+        seen += [w.id for w in page['workouts']]
+        cursor = page['next_cursor']
+        if cursor is None:
+            break
+
+    assert seen == [w.id for w in get_workouts()]
+    assert list(w.id for w in iter_workouts(page_size=3)) == seen
+
+
+def test_page_boundary_between_workouts_on_the_same_day(sample_workouts):
+    """A page ending between two workouts on one day continues with the other."""
+    first, second, third, fourth = sample_workouts
+
+    page = get_workouts_page(limit=2)
+    assert [w.id for w in page['workouts']] == [fourth, third]
+
+    page = get_workouts_page(page['next_cursor'], limit=2)
+    assert [w.id for w in page['workouts']] == [second, first]
+    assert page['next_cursor'] is None
+
+
+def test_filtered_pages(sample_workouts):
+    """Filters apply to every page, not only the first."""
+    first, _, _, fourth = sample_workouts
+    filters = {'workout_type': "Push"}
+
+    page = get_workouts_page(limit=1, filters=filters)
+    assert [w.id for w in page['workouts']] == [fourth]
+
+    page = get_workouts_page(page['next_cursor'], limit=1, filters=filters)
+    assert [w.id for w in page['workouts']] == [first]
+    assert page['next_cursor'] is None
+
+    page = get_workouts_page(limit=10, filters={'start_date': "2024-01-02", 'end_date': "2024-01-07"})
+    assert {w.date for w in page['workouts']} == {"2024-01-03"}
+
+
+def test_iterating_does_not_fill_the_cache(setup_database, query_cache):
+    """Neither history pages nor bulk details are kept in the query cache."""
+    save_workouts(
+        {'date': f"2024-02-{day:02d}", 'workout_type': "Push", 'sets_data': []}
+        for day in range(1, 29)
+    )
+    get_workouts()
+    size = cache_stats()['size']
+
+    sizes = []
+    for _ in iter_workouts(page_size=3):
+        sizes.append(cache_stats()['size'])
+    get_workout_details_many(range(1, 29))
+
+    assert len(sizes) == 28
+    assert set(sizes) == {size}
+    assert cache_stats()['size'] == size
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor",
+    base64.urlsafe_b64encode(b'{"day": 1}').decode('ascii'),
+    base64.urlsafe_b64encode(b'[19725, "7"]').decode('ascii'),
+])
+def test_invalid_cursor(setup_database, cursor):
+    with pytest.raises(ValueError):
+        get_workouts_page(cursor)
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_invalid_page_limit(setup_database, limit):
+    with pytest.raises(ValueError):
+        get_workouts_page(limit=limit)
+
+
+@pytest.fixture
+def published():
+    """Collect the WORKOUT_SAVED and EXERCISE_ADDED events of a test."""
+    events = []
+    for event_type in (WORKOUT_SAVED, EXERCISE_ADDED):
+        subscribe(event_type, events.append)
+    yield events
+    for event_type in (WORKOUT_SAVED, EXERCISE_ADDED):
+        unsubscribe(event_type, events.append)
+
+
+def test_failed_bulk_save_publishes_committed_batches(setup_database, published):
+    """Batches committed before a failure are kept and announced."""
+    def workouts():
+        for day in range(1, 6):
+            yield {
+                'date': f"2024-01-{day:02d}",
+                'workout_type': "Push",
+                'sets_data': [{'exercise_name': f"Exercise {day}", 'set_number': 1,
+                               'reps': 5, 'weight': 100.0}],
+            }
+        # Missing workout_type, in the third batch
+        yield {'date': "2024-01-06", 'sets_data': []}
+
+    with pytest.raises(TypeError):
+        save_workouts(workouts(), batch_size=2)
+
+    saved = [w.id for w in get_workouts()]
+    assert len(saved) == 4
+    added, saved_event = published
+    assert added.type == EXERCISE_ADDED
+    assert added.exercises == ("Exercise 1", "Exercise 2", "Exercise 3", "Exercise 4")
+    assert saved_event.type == WORKOUT_SAVED
+    assert sorted(saved_event.workout_ids) == sorted(saved)
+    assert saved_event.dates == ("2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04")
+    assert saved_event.exercises == added.exercises
+
+
+def _row_counts():
+    """Return the number of workouts, sets and cardio sessions."""
+    with connection() as conn:
+        return tuple(
+            conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("workouts", "sets", "cardio_sessions")
+        )
+
+
+def test_delete_workouts_by_range_and_list(sample_workouts):
+    first, second, third, fourth = sample_workouts
+
+    assert delete_workouts(range(first, third + 1)) == 3
+    assert _row_counts() == (1, 1, 0)
+    assert [w.id for w in get_workouts()] == [fourth]
+
+    # Unknown IDs are ignored
+    assert delete_workouts([first, fourth, fourth + 100]) == 1
+    assert delete_workouts([]) == 0
+    assert _row_counts() == (0, 0, 0)
+
+
+def test_delete_workout(sample_workouts):
+    assert delete_workout(sample_workouts[0]) is True
+    assert delete_workout(sample_workouts[0]) is False
+    assert _row_counts() == (3, 3, 1)
+
+
+def test_delete_workouts_between(sample_workouts):
+    """Both bounds are inclusive; strings and dates are accepted."""
+    assert delete_workouts_between("2024-01-02", "2024-01-02") == 0
+    assert delete_workouts_between(date(2024, 1, 3), "2024-01-08") == 3
+    assert _row_counts() == (1, 3, 1)
+    assert [w.date for w in get_workouts()] == ["2024-01-01"]
+
+    with pytest.raises(ValueError):
+        delete_workouts_between("2024-13-01", "2024-12-31")
+
+
+def test_deleting_a_workout_cascades(sample_workouts):
+    """A plain DELETE of a workout removes its sets and cardio sessions."""
+    with connection() as conn:
+        conn.execute("DELETE FROM workouts WHERE id = ?", (sample_workouts[0],))
+
+    assert _row_counts() == (3, 3, 1)
+    assert [w.total_sets for w in get_workouts()] == [1, 0, 2]
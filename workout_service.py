@@ -1,263 +1,720 @@
-# workout_tracker/services/workout_service.py
-
-from datetime import datetime
-from ..db import get_connection
-
-
-def save_workout(date, workout_type, sets_data, cardio_minutes=None, cardio_type=None, notes=None):
-    """
-    Save a complete workout with sets and optional cardio.
-
-    Args:
-        date: Date of workout (string, format: YYYY-MM-DD)
-        workout_type: Type of workout (e.g., "Push", "Pull", "Legs", "Full Body")
-        sets_data: List of dicts with keys: exercise_name, set_number, reps, weight, rpe (optional)
-        cardio_minutes: Optional cardio duration in minutes
-        cardio_type: Optional cardio type (e.g., "Running", "Cycling", "Walking")
-        notes: Optional workout notes
-
-    Returns:
-        workout_id: The ID of the newly created workout
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    # Insert workout record
-    cur.execute(
-        """
-        INSERT INTO workouts (date, workout_type, notes)
-        VALUES (?, ?, ?)
-        """,
-        (date, workout_type, notes)
-    )
-    workout_id = cur.lastrowid
-
-    # Insert sets
-    for set_data in sets_data:
-        cur.execute(
-            """
-            INSERT INTO sets (workout_id, exercise_name, set_number, reps, weight, rpe)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                workout_id,
-                set_data['exercise_name'],
-                set_data['set_number'],
-                set_data['reps'],
-                set_data['weight'],
-                set_data.get('rpe')  # Optional
-            )
-        )
-
-    # Insert cardio if provided
-    if cardio_minutes and cardio_minutes > 0:
-        cur.execute(
-            """
-            INSERT INTO cardio_sessions (workout_id, cardio_type, minutes)
-            VALUES (?, ?, ?)
-            """,
-            (workout_id, cardio_type, cardio_minutes)
-        )
-
-    conn.commit()
-    conn.close()
-
-    return workout_id
-
-
-def get_workouts(start_date=None, end_date=None, workout_type=None):
-    """
-    Retrieve workouts with optional filtering.
-
-    Args:
-        start_date: Optional start date filter (YYYY-MM-DD)
-        end_date: Optional end date filter (YYYY-MM-DD)
-        workout_type: Optional workout type filter
-
-    Returns:
-        List of workout dictionaries with summary data
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    # Build query with optional filters
-    query = """
-        SELECT
-            w.id,
-            w.date,
-            w.workout_type,
-            w.notes,
-            COUNT(DISTINCT s.id) as total_sets,
-            SUM(s.reps * s.weight) as total_volume,
-            COALESCE(SUM(c.minutes), 0) as cardio_minutes
-        FROM workouts w
-        LEFT JOIN sets s ON w.id = s.workout_id
-        LEFT JOIN cardio_sessions c ON w.id = c.workout_id
-        WHERE 1=1
-    """
-    params = []
-
-    if start_date:
-        query += " AND w.date >= ?"
-        params.append(start_date)
-
-    if end_date:
-        query += " AND w.date <= ?"
-        params.append(end_date)
-
-    if workout_type:
-        query += " AND w.workout_type = ?"
-        params.append(workout_type)
-
-    query += """
-        GROUP BY w.id
-        ORDER BY w.date DESC
-    """
-
-    cur.execute(query, params)
-    rows = cur.fetchall()
-    conn.close()
-
-    return [dict(row) for row in rows]
-
-
-def get_workout_details(workout_id):
-    """
-    Get detailed information about a specific workout including all sets and cardio.
-
-    Args:
-        workout_id: ID of the workout
-
-    Returns:
-        Dictionary with workout info, sets list, and cardio list
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    # Get workout info
-    cur.execute(
-        """
-        SELECT id, date, workout_type, notes
-        FROM workouts
-        WHERE id = ?
-        """,
-        (workout_id,)
-    )
-    workout = cur.fetchone()
-
-    if not workout:
-        conn.close()
-        return None
-
-    # Get sets
-    cur.execute(
-        """
-        SELECT exercise_name, set_number, reps, weight, rpe
-        FROM sets
-        WHERE workout_id = ?
-        ORDER BY id
-        """,
-        (workout_id,)
-    )
-    sets = [dict(row) for row in cur.fetchall()]
-
-    # Get cardio
-    cur.execute(
-        """
-        SELECT cardio_type, minutes
-        FROM cardio_sessions
-        WHERE workout_id = ?
-        """,
-        (workout_id,)
-    )
-    cardio = [dict(row) for row in cur.fetchall()]
-
-    conn.close()
-
-    return {
-        'workout': dict(workout),
-        'sets': sets,
-        'cardio': cardio
-    }
-
-
-def delete_workout(workout_id):
-    """
-    Delete a workout and all associated sets and cardio sessions.
-
-    Args:
-        workout_id: ID of the workout to delete
-
-    Returns:
-        True if deleted, False if workout not found
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    # Check if workout exists
-    cur.execute("SELECT id FROM workouts WHERE id = ?", (workout_id,))
-    if not cur.fetchone():
-        conn.close()
-        return False
-
-    # Delete sets (cascading)
-    cur.execute("DELETE FROM sets WHERE workout_id = ?", (workout_id,))
-
-    # Delete cardio sessions (cascading)
-    cur.execute("DELETE FROM cardio_sessions WHERE workout_id = ?", (workout_id,))
-
-    # Delete workout
-    cur.execute("DELETE FROM workouts WHERE id = ?", (workout_id,))
-
-    conn.commit()
-    conn.close()
-
-    return True
-
-
-def get_workout_types():
-    """
-    Get a list of all unique workout types used.
-
-    Returns:
-        List of workout type strings
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    cur.execute(
-        """
-        SELECT DISTINCT workout_type
-        FROM workouts
-        ORDER BY workout_type
-        """
-    )
-
-    types = [row[0] for row in cur.fetchall()]
-    conn.close()
-
-    return types
-
-
-def get_exercises():
-    """
-    Get a list of all unique exercises logged.
-
-    Returns:
-        List of exercise name strings
-    """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    cur.execute(
-        """
-        SELECT DISTINCT exercise_name
-        FROM sets
-        ORDER BY exercise_name
-        """
-    )
-
-    exercises = [row[0] for row in cur.fetchall()]
-    conn.close()
-
-    return exercises
+# workout_tracker/services/workout_service.py
+
+import base64
+import json
+import time
+from datetime import datetime
+from ..db import connection, day_number
+from .cache import cached
+from .records import Workout, WorkoutSummary, SetRecord, CardioSession, row_factory
+from .events import publish, WORKOUT_SAVED, WORKOUT_DELETED, EXERCISE_ADDED
+
+# Default number of workouts per page for get_workouts_page()/iter_workouts()
+PAGE_SIZE = 200
+
+# Default number of workouts committed per transaction by save_workouts()
+BATCH_SIZE = 500
+
+
+def _insert_workout(cur, date, workout_type, sets_data, cardio_minutes=None,
+                    cardio_type=None, notes=None):
+    """
+    Insert a workout row and build the parameter rows for its sets and cardio.
+
+    Returns:
+        Tuple of (workout_id, set_rows, cardio_rows) ready for executemany()
+    """
+    cur.execute(
+        """
+        INSERT INTO workouts (date, workout_type, notes)
+        VALUES (?, ?, ?)
+        """,
+        (date, workout_type, notes)
+    )
+    workout_id = cur.lastrowid
+
+    set_rows = [
+        (
+            workout_id,
+            set_data['exercise_name'],
+            set_data['set_number'],
+            set_data['reps'],
+            set_data['weight'],
+            set_data.get('rpe')  # Optional
+        )
+        for set_data in sets_data
+    ]
+
+    cardio_rows = []
+    if cardio_minutes and cardio_minutes > 0:
+        cardio_rows.append((workout_id, cardio_type, cardio_minutes))
+
+    return workout_id, set_rows, cardio_rows
+
+
+def register_exercises(cur, names):
+    """
+    Add exercise names that are not in the exercises table yet.
+
+    Args:
+        cur: Cursor of the transaction that inserts the sets
+        names: Iterable of exercise names
+
+    Returns:
+        List of the names that were added
+    """
+    added = []
+    for name in sorted(set(names)):
+        cur.execute(
+            """
+            INSERT INTO exercises (name) VALUES (?)
+            ON CONFLICT (name) DO NOTHING
+            RETURNING id
+            """,
+            (name,)
+        )
+        if cur.fetchone():
+            added.append(name)
+    return added
+
+
+def _insert_children(cur, set_rows, cardio_rows):
+    """
+    Insert set and cardio parameter rows built by _insert_workout().
+
+    Returns:
+        List of exercise names logged for the first time
+    """
+    added = []
+    if set_rows:
+        # Register new exercise names, then store sets by exercise_id
+        added = register_exercises(cur, (row[1] for row in set_rows))
+        cur.executemany(
+            """
+            INSERT INTO sets (workout_id, exercise_id, set_number, reps, weight, rpe)
+            VALUES (?, (SELECT id FROM exercises WHERE name = ?), ?, ?, ?, ?)
+            """,
+            set_rows
+        )
+
+    if cardio_rows:
+        cur.executemany(
+            """
+            INSERT INTO cardio_sessions (workout_id, cardio_type, minutes)
+            VALUES (?, ?, ?)
+            """,
+            cardio_rows
+        )
+
+    return added
+
+
+def _publish_saved(workout_ids, dates, exercises, added):
+    """Publish the events for workouts that were just committed."""
+    if added:
+        publish(EXERCISE_ADDED, exercises=added)
+    if workout_ids:
+        publish(WORKOUT_SAVED, workout_ids, dates, exercises)
+
+
+def save_workout(date, workout_type, sets_data, cardio_minutes=None, cardio_type=None, notes=None):
+    """
+    Save a complete workout with sets and optional cardio.
+
+    Args:
+        date: Date of workout (string, format: YYYY-MM-DD)
+        workout_type: Type of workout (e.g., "Push", "Pull", "Legs", "Full Body")
+        sets_data: List of dicts with keys: exercise_name, set_number, reps, weight, rpe (optional)
+        cardio_minutes: Optional cardio duration in minutes
+        cardio_type: Optional cardio type (e.g., "Running", "Cycling", "Walking")
+        notes: Optional workout notes
+
+    Returns:
+        workout_id: The ID of the newly created workout
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+        workout_id, set_rows, cardio_rows = _insert_workout(
+            cur, date, workout_type, sets_data, cardio_minutes, cardio_type, notes
+        )
+        added = _insert_children(cur, set_rows, cardio_rows)
+
+    _publish_saved([workout_id], [date], [row[1] for row in set_rows], added)
+
+    return workout_id
+
+
+def save_workouts(workouts, batch_size=BATCH_SIZE):
+    """
+    Bulk-insert many workouts, e.g. when importing history from another app.
+
+    Workouts are committed in batches: each batch is one transaction, and
+    its sets and cardio sessions are inserted with a single executemany()
+    per table. A failure rolls back only the batch in progress; the events
+    for the batches already committed are still published before the
+    exception propagates.
+
+    Args:
+        workouts: Iterable of dicts with the save_workout() arguments as keys
+                  (date, workout_type, sets_data, and optionally
+                  cardio_minutes, cardio_type, notes)
+        batch_size: Number of workouts per transaction
+
+    Returns:
+        Dict with workouts, sets, cardio (counts inserted), seconds and
+        sets_per_second
+    """
+    counts = {'workouts': 0, 'sets': 0, 'cardio': 0}
+    start = time.perf_counter()
+    # One entry per workout inserted; the first counts['workouts'] of them
+    # are committed
+    workout_ids, dates, exercises, added = [], [], [], []
+
+    try:
+        with connection() as conn:
+            cur = conn.cursor()
+            set_rows = []
+            cardio_rows = []
+            pending = 0
+
+            for workout in workouts:
+                workout_id, workout_sets, workout_cardio = _insert_workout(cur, **workout)
+                workout_ids.append(workout_id)
+                dates.append(workout['date'])
+                exercises.append({row[1] for row in workout_sets})
+                set_rows.extend(workout_sets)
+                cardio_rows.extend(workout_cardio)
+                pending += 1
+
+                if pending >= batch_size:
+                    batch_added = _insert_children(cur, set_rows, cardio_rows)
+                    conn.commit()
+                    added += batch_added
+                    counts['workouts'] += pending
+                    counts['sets'] += len(set_rows)
+                    counts['cardio'] += len(cardio_rows)
+                    set_rows, cardio_rows, pending = [], [], 0
+
+            batch_added = _insert_children(cur, set_rows, cardio_rows)
+
+        # Leaving the block committed the last batch
+        added += batch_added
+        counts['workouts'] += pending
+        counts['sets'] += len(set_rows)
+        counts['cardio'] += len(cardio_rows)
+    finally:
+        seconds = time.perf_counter() - start
+        committed = counts['workouts']
+        _publish_saved(
+            workout_ids[:committed],
+            dates[:committed],
+            set().union(*exercises[:committed]),
+            added
+        )
+
+    counts['seconds'] = round(seconds, 3)
+    counts['sets_per_second'] = round(counts['sets'] / seconds, 1) if seconds > 0 else 0.0
+
+    return counts
+
+
+def _workout_filters(start_date=None, end_date=None, workout_type=None):
+    """
+    Build the WHERE clause and params for the common workout filters.
+
+    The clause refers to the table as `w` and works on both workouts and
+    workout_summary.
+    """
+    clause = "WHERE 1=1"
+    params = []
+
+    # Dates are compared as integer day numbers on the indexed day column
+    if start_date:
+        clause += " AND w.day >= ?"
+        params.append(day_number(start_date))
+
+    if end_date:
+        clause += " AND w.day <= ?"
+        params.append(day_number(end_date))
+
+    if workout_type:
+        clause += " AND w.workout_type = ?"
+        params.append(workout_type)
+
+    return clause, params
+
+
+def workout_summary_query(start_date=None, end_date=None, workout_type=None,
+                          after=None, limit=None):
+    """
+    Build the per-workout summary query shared by get_workouts() and the
+    exporters.
+
+    Totals are read from the workout_summary table, which triggers on sets
+    and cardio_sessions keep up to date, so no join or aggregation is needed.
+
+    Args:
+        start_date: Optional start date filter (YYYY-MM-DD, inclusive)
+        end_date: Optional end date filter (YYYY-MM-DD, inclusive)
+        workout_type: Optional workout type filter
+        after: Optional (day number, id) keyset; only workouts ordered after it
+        limit: Optional maximum number of rows
+
+    Returns:
+        Tuple of (query, params), newest workouts first
+    """
+    where, params = _workout_filters(start_date, end_date, workout_type)
+
+    if after is not None:
+        # Row-value comparison is a range seek on the (day, id) index order
+        where += " AND (w.day, w.workout_id) < (?, ?)"
+        params.extend(after)
+
+    query = """
+        SELECT
+            w.workout_id as id,
+            w.date,
+            w.workout_type,
+            w.notes,
+            w.total_sets,
+            w.total_volume,
+            w.cardio_minutes
+        FROM workout_summary w
+    """
+    query += where
+    query += " ORDER BY w.day DESC, w.workout_id DESC"
+
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
+
+    return query, params
+
+
+@cached
+def get_workouts(start_date=None, end_date=None, workout_type=None):
+    """
+    Retrieve workouts with optional filtering.
+
+    Args:
+        start_date: Optional start date filter (YYYY-MM-DD)
+        end_date: Optional end date filter (YYYY-MM-DD)
+        workout_type: Optional workout type filter
+
+    Returns:
+        List of WorkoutSummary records
+    """
+    query, params = workout_summary_query(start_date, end_date, workout_type)
+
+    with connection() as conn:
+        cur = conn.cursor()
+        cur.row_factory = row_factory(WorkoutSummary)
+        cur.execute(query, params)
+        workouts = cur.fetchall()
+
+    return workouts
+
+
+def _encode_cursor(day, workout_id):
+    """Encode a (day number, id) keyset as an opaque continuation token."""
+    raw = json.dumps([day, workout_id]).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+
+def _decode_cursor(cursor):
+    """Decode a continuation token produced by _encode_cursor()."""
+    try:
+        day, workout_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, TypeError, UnicodeError):
+        raise ValueError(f"Invalid workout cursor: {cursor!r}") from None
+    if not isinstance(day, int) or not isinstance(workout_id, int):
+        raise ValueError(f"Invalid workout cursor: {cursor!r}")
+    return day, workout_id
+
+
+def get_workouts_page(cursor=None, limit=PAGE_SIZE, filters=None):
+    """
+    Retrieve one page of workouts using keyset pagination on (day, id).
+
+    Each page is a single index range seek, so the cost of fetching a page
+    does not depend on how far into the history it is. Pages are not cached:
+    walking the history would otherwise keep every page it passed in memory.
+
+    Args:
+        cursor: Continuation token from a previous page, or None for the first
+        limit: Maximum number of workouts in the page
+        filters: Optional dict with start_date, end_date and/or workout_type
+
+    Returns:
+        Dict with 'workouts' (list of WorkoutSummary records, newest first) and
+        'next_cursor' (token for the following page, or None at the end)
+
+    Raises:
+        ValueError: If the cursor is not a valid continuation token, or
+            limit is less than 1
+    """
+    if limit < 1:
+        raise ValueError(f"Page limit must be at least 1, got {limit!r}")
+    after = _decode_cursor(cursor) if cursor else None
+    # Fetch one extra row to know whether another page follows
+    query, params = workout_summary_query(
+        **(filters or {}), after=after, limit=limit + 1
+    )
+
+    with connection() as conn:
+        cur = conn.cursor()
+        cur.row_factory = row_factory(WorkoutSummary)
+        cur.execute(query, params)
+        rows = cur.fetchall()
+
+    workouts = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        last = workouts[-1]
+        next_cursor = _encode_cursor(day_number(last.date), last.id)
+
+    return {
+        'workouts': workouts,
+        'next_cursor': next_cursor
+    }
+
+
+def iter_workouts(start_date=None, end_date=None, workout_type=None, page_size=PAGE_SIZE):
+    """
+    Iterate over workouts newest first, one page at a time.
+
+    At most one page of workouts is held in memory, however large the
+    history is.
+
+    Args:
+        start_date: Optional start date filter (YYYY-MM-DD)
+        end_date: Optional end date filter (YYYY-MM-DD)
+        workout_type: Optional workout type filter
+        page_size: Number of workouts fetched per query
+
+    Yields:
+        WorkoutSummary records
+    """
+    filters = {
+        'start_date': start_date,
+        'end_date': end_date,
+        'workout_type': workout_type
+    }
+    cursor = None
+
+    while True:
+        page = get_workouts_page(cursor, page_size, filters)
+        yield from page['workouts']
+        cursor = page['next_cursor']
+        if cursor is None:
+            break
+
+
+@cached
+def get_workout_totals(start_date=None, end_date=None, workout_type=None):
+    """
+    Get aggregate totals for all workouts matching the filters.
+
+    Args:
+        start_date: Optional start date filter (YYYY-MM-DD)
+        end_date: Optional end date filter (YYYY-MM-DD)
+        workout_type: Optional workout type filter
+
+    Returns:
+        Dict with total_workouts, total_volume, total_cardio
+    """
+    where, params = _workout_filters(start_date, end_date, workout_type)
+
+    with connection() as conn:
+        cur = conn.cursor()
+        cur.execute(
+            f"""
+            SELECT
+                COUNT(*) as total_workouts,
+                COALESCE(SUM(w.total_volume), 0) as total_volume,
+                COALESCE(SUM(w.cardio_minutes), 0) as total_cardio
+            FROM workout_summary w
+            {where}
+            """,
+            params
+        )
+        row = cur.fetchone()
+
+    return dict(row)
+
+
+@cached
+def get_workout_details(workout_id):
+    """
+    Get detailed information about a specific workout including all sets and cardio.
+
+    Args:
+        workout_id: ID of the workout
+
+    Returns:
+        Dict with the Workout record ('workout'), a list of SetRecord
+        records ('sets') and a list of CardioSession records ('cardio')
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+        cur.row_factory = row_factory(Workout)
+
+        # Get workout info
+        cur.execute(
+            """
+            SELECT id, date, workout_type, notes
+            FROM workouts
+            WHERE id = ?
+            """,
+            (workout_id,)
+        )
+        workout = cur.fetchone()
+
+        if not workout:
+            return None
+
+        # Get sets
+        cur.execute(
+            """
+            SELECT e.name as exercise_name, s.set_number, s.reps, s.weight, s.rpe
+            FROM sets s
+            JOIN exercises e ON s.exercise_id = e.id
+            WHERE s.workout_id = ?
+            ORDER BY s.id
+            """,
+            (workout_id,)
+        )
+        cur.row_factory = row_factory(SetRecord)
+        sets = cur.fetchall()
+
+        # Get cardio
+        cur.execute(
+            """
+            SELECT cardio_type, minutes
+            FROM cardio_sessions
+            WHERE workout_id = ?
+            """,
+            (workout_id,)
+        )
+        cur.row_factory = row_factory(CardioSession)
+        cardio = cur.fetchall()
+
+    return {
+        'workout': workout,
+        'sets': sets,
+        'cardio': cardio
+    }
+
+
+def _id_condition(workout_ids):
+    """
+    Build an `IN`/`BETWEEN` condition and params matching a set of workout IDs.
+
+    A step-1 range becomes BETWEEN, an index range seek; any other iterable
+    is passed as a single JSON parameter, so the number of IDs is not
+    limited by SQLite's bound-parameter limit.
+    """
+    if isinstance(workout_ids, range) and workout_ids.step == 1:
+        return "BETWEEN ? AND ?", (workout_ids.start, workout_ids.stop - 1)
+    ids = json.dumps([int(workout_id) for workout_id in workout_ids])
+    return "IN (SELECT value FROM json_each(?))", (ids,)
+
+
+def get_workout_details_many(workout_ids):
+    """
+    Get details for many workouts with one query per table.
+
+    Not cached, so that bulk results do not pile up in the query cache.
+
+    Args:
+        workout_ids: List (or other iterable) or range of workout IDs
+
+    Returns:
+        Dict mapping workout ID to the structure returned by
+        get_workout_details(), in ID order; unknown IDs are left out
+    """
+    condition, params = _id_condition(workout_ids)
+
+    with connection() as conn:
+        cur = conn.cursor()
+        cur.row_factory = row_factory(Workout)
+
+        cur.execute(
+            f"""
+            SELECT id, date, workout_type, notes
+            FROM workouts
+            WHERE id {condition}
+            ORDER BY id
+            """,
+            params
+        )
+        details = {
+            workout.id: {'workout': workout, 'sets': [], 'cardio': []}
+            for workout in cur.fetchall()
+        }
+
+        # Plain tuples: the leading workout_id is not part of the records
+        cur.row_factory = None
+
+        cur.execute(
+            f"""
+            SELECT s.workout_id, e.name as exercise_name, s.set_number, s.reps, s.weight, s.rpe
+            FROM sets s
+            JOIN exercises e ON s.exercise_id = e.id
+            WHERE s.workout_id {condition}
+            ORDER BY s.id
+            """,
+            params
+        )
+        for workout_id, *values in cur:
+            details[workout_id]['sets'].append(SetRecord._make(values))
+
+        cur.execute(
+            f"""
+            SELECT workout_id, cardio_type, minutes
+            FROM cardio_sessions
+            WHERE workout_id {condition}
+            """,
+            params
+        )
+        for workout_id, cardio_type, minutes in cur:
+            details[workout_id]['cardio'].append(CardioSession(cardio_type, minutes))
+
+    return details
+
+
+def delete_workout(workout_id):
+    """
+    Delete a workout and all associated sets and cardio sessions.
+
+    Args:
+        workout_id: ID of the workout to delete
+
+    Returns:
+        True if deleted, False if workout not found
+    """
+    return delete_workouts([workout_id]) > 0
+
+
+def _delete_workouts_where(condition, params):
+    """
+    Delete the workouts whose id satisfies `condition`, together with their
+    sets and cardio sessions, in one transaction.
+
+    Each table is cleared with a single set-based DELETE. Children go first,
+    so the ON DELETE CASCADE on workouts has nothing left to remove.
+
+    Returns:
+        Number of workouts deleted
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+        cur.execute(
+            f"""
+            DELETE FROM sets WHERE workout_id {condition}
+            RETURNING (SELECT name FROM exercises WHERE id = exercise_id)
+            """,
+            params
+        )
+        exercises = {row[0] for row in cur.fetchall()}
+        cur.execute(f"DELETE FROM cardio_sessions WHERE workout_id {condition}", params)
+        cur.execute(f"DELETE FROM workouts WHERE id {condition} RETURNING id, date", params)
+        deleted = cur.fetchall()
+
+    if deleted:
+        publish(
+            WORKOUT_DELETED,
+            [row['id'] for row in deleted],
+            [row['date'] for row in deleted],
+            exercises
+        )
+
+    return len(deleted)
+
+
+def delete_workouts(workout_ids):
+    """
+    Delete many workouts and all their sets and cardio sessions at once.
+
+    Any number of workouts is deleted with one statement per table.
+
+    Args:
+        workout_ids: List (or other iterable) or range of workout IDs;
+                     unknown IDs are ignored
+
+    Returns:
+        Number of workouts deleted
+    """
+    return _delete_workouts_where(*_id_condition(workout_ids))
+
+
+def delete_workouts_between(start_date, end_date):
+    """
+    Delete all workouts in a date range and their sets and cardio sessions.
+
+    Args:
+        start_date: First date to delete (YYYY-MM-DD or date, inclusive)
+        end_date: Last date to delete (YYYY-MM-DD or date, inclusive)
+
+    Returns:
+        Number of workouts deleted
+
+    Raises:
+        ValueError: If a date is not a valid YYYY-MM-DD date
+    """
+    return _delete_workouts_where(
+        "IN (SELECT id FROM workouts WHERE day BETWEEN ? AND ?)",
+        (day_number(start_date), day_number(end_date))
+    )
+
+
+@cached
+def get_workout_types():
+    """
+    Get a list of all unique workout types used.
+
+    Returns:
+        List of workout type strings
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+
+        cur.execute(
+            """
+            SELECT DISTINCT workout_type
+            FROM workouts
+            ORDER BY workout_type
+            """
+        )
+
+        types = [row[0] for row in cur.fetchall()]
+
+    return types
+
+
+@cached
+def get_exercises():
+    """
+    Get a list of all unique exercises logged.
+
+    Walks the exercises table in name order and keeps those with at least
+    one set (an index seek on sets.exercise_id), instead of scanning sets.
+
+    Returns:
+        List of exercise name strings
+    """
+    with connection() as conn:
+        cur = conn.cursor()
+
+        cur.execute(
+            """
+            SELECT e.name
+            FROM exercises e
+            WHERE EXISTS (SELECT 1 FROM sets s WHERE s.exercise_id = e.id)
+            ORDER BY e.name
+            """
+        )
+
+        exercises = [row[0] for row in cur.fetchall()]
+
+    return exercises